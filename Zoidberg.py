@@ -1,32 +1,246 @@
+import time
+_startup_t0 = time.perf_counter() # Reference point for --startup-profile
+
+import os
+import sys
+
+# --- Single Instance (launching side) ---
+# Flags that only make sense in the process that was launched, so they are never forwarded. This exact
+# match is only a shortcut: the running instance also refuses abbreviations of them (see check_forwarded_argv).
+LOCAL_ONLY_FLAGS = ("--new-instance", "--render", "--batch", "--animate", "--startup-profile",
+                    "--perf", "--perf-json", "--perf-overlay", "--memory-report", "--low-memory", "-h", "--help",
+                    "--multiprocessing-fork") # --batch worker processes of the frozen build
+
+def get_instance_address_file():
+    """
+    Returns the per-user file where the running instance publishes its port and token. Outside
+    XDG_RUNTIME_DIR (already private to the user) it lives in a Zoidberg-<user> directory in the
+    temp directory, created with mode 0700 if needed. Raises OSError if that directory is a
+    symlink, belongs to another user or can be entered by others, since whoever controls it
+    could read the token or plant an address file.
+    """
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], "Zoidberg.instance")
+    # The lookup order of tempfile.gettempdir(), which would add ~18 ms of imports to every launch
+    temp = os.environ.get("TMPDIR") or os.environ.get("TEMP") or os.environ.get("TMP") or "/tmp"
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    directory = os.path.join(temp, f"Zoidberg-{user}")
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    if hasattr(os, "getuid"): # Windows' TEMP is already inside the user's profile
+        import stat
+        info = os.lstat(directory)
+        if not stat.S_ISDIR(info.st_mode) or info.st_uid != user or info.st_mode & 0o077:
+            raise PermissionError(f"'{directory}' is not a directory private to this user")
+    return os.path.join(directory, "Zoidberg.instance")
+
+def forward_to_running_instance(argv):
+    """
+    Hands argv (CLI overrides or a dropped .ini) to an already-running Zoidberg, which opens
+    it in a new window. Returns False if no instance answered, or if it answered that argv has
+    to run here (a local-only flag, however abbreviated). If the instance rejects the
+    arguments, prints its argparse error and exits with status 2, as a local launch would.
+    This runs before tkinter and PIL are imported, so it only uses the socket module.
+    """
+    if any(arg.split("=", 1)[0] in LOCAL_ONLY_FLAGS for arg in argv):
+        return False
+    try:
+        with open(get_instance_address_file()) as f:
+            port, token = f.read().split()
+    except (OSError, ValueError): # No instance has run yet (or the file is garbled or unsafe)
+        return False
+
+    import socket
+    # The running process has its own working directory, so a relative dropped .ini is resolved here
+    argv = [os.path.abspath(arg) if arg.lower().endswith(".ini") and os.path.isfile(arg) else arg for arg in argv]
+    try:
+        with socket.create_connection(("127.0.0.1", int(port)), timeout=2.0) as connection:
+            connection.sendall("\0".join([token] + argv).encode("utf-8"))
+            connection.shutdown(socket.SHUT_WR)
+            reply = b""
+            while True:
+                chunk = connection.recv(4096)
+                if not chunk:
+                    break
+                reply += chunk
+    except (OSError, ValueError): # Stale file: that instance has exited
+        return False
+    if reply.startswith(b"error\0"):
+        sys.stderr.write(reply[len(b"error\0"):].decode("utf-8", "replace"))
+        sys.exit(2)
+    return reply == b"ok"
+
+if __name__ == "__main__" and forward_to_running_instance(sys.argv[1:]):
+    sys.exit(0) # The running instance opened the window; no need to import tkinter, PIL or pygame here
+
 import tkinter as tk
-import tkinter.font as tkfont
 from tkinter import messagebox
 from PIL import Image, ImageTk
 import configparser
-import os
-import sys
-import argparse
 import threading
-import pygame.mixer as mixer # Correctly imports and aliases mixer
+import queue
+import functools
+import collections
+import types
+import hashlib
+import json
+import re
+import mmap
+import struct
+# Heavier modules are imported where they are used, so a plain launch doesn't pay for them:
+# pygame.mixer (SoundPlayer worker), multiprocessing (--batch, --animate), argparse (build_arg_parser)
+# and PIL's ImageDraw/ImageFont (headless rendering).
+_startup_imports_done = time.perf_counter()
 
 # --- Color Utility Functions ---
-def get_rgb_from_color_string(widget, color_string):
+# X11/Tk color names (lower case, spaces removed) as name:rrggbb, plus Tk 8.6's crimson, indigo,
+# olive, silver and teal. gray0-gray100 and grey0-grey100 are computed instead of listed.
+_X11_COLOR_NAMES = """
+aliceblue:f0f8ff antiquewhite:faebd7 antiquewhite1:ffefdb antiquewhite2:eedfcc antiquewhite3:cdc0b0
+antiquewhite4:8b8378 aquamarine:7fffd4 aquamarine1:7fffd4 aquamarine2:76eec6 aquamarine3:66cdaa
+aquamarine4:458b74 azure:f0ffff azure1:f0ffff azure2:e0eeee azure3:c1cdcd azure4:838b8b beige:f5f5dc
+bisque:ffe4c4 bisque1:ffe4c4 bisque2:eed5b7 bisque3:cdb79e bisque4:8b7d6b black:000000 blanchedalmond:ffebcd
+blue:0000ff blue1:0000ff blue2:0000ee blue3:0000cd blue4:00008b blueviolet:8a2be2 brown:a52a2a brown1:ff4040
+brown2:ee3b3b brown3:cd3333 brown4:8b2323 burlywood:deb887 burlywood1:ffd39b burlywood2:eec591 burlywood3:cdaa7d
+burlywood4:8b7355 cadetblue:5f9ea0 cadetblue1:98f5ff cadetblue2:8ee5ee cadetblue3:7ac5cd cadetblue4:53868b
+chartreuse:7fff00 chartreuse1:7fff00 chartreuse2:76ee00 chartreuse3:66cd00 chartreuse4:458b00 chocolate:d2691e
+chocolate1:ff7f24 chocolate2:ee7621 chocolate3:cd661d chocolate4:8b4513 coral:ff7f50 coral1:ff7256 coral2:ee6a50
+coral3:cd5b45 coral4:8b3e2f cornflowerblue:6495ed cornsilk:fff8dc cornsilk1:fff8dc cornsilk2:eee8cd
+cornsilk3:cdc8b1 cornsilk4:8b8878 crimson:dc143c cyan:00ffff cyan1:00ffff cyan2:00eeee cyan3:00cdcd cyan4:008b8b
+darkblue:00008b darkcyan:008b8b darkgoldenrod:b8860b darkgoldenrod1:ffb90f darkgoldenrod2:eead0e
+darkgoldenrod3:cd950c darkgoldenrod4:8b6508 darkgray:a9a9a9 darkgreen:006400 darkgrey:a9a9a9 darkkhaki:bdb76b
+darkmagenta:8b008b darkolivegreen:556b2f darkolivegreen1:caff70 darkolivegreen2:bcee68 darkolivegreen3:a2cd5a
+darkolivegreen4:6e8b3d darkorange:ff8c00 darkorange1:ff7f00 darkorange2:ee7600 darkorange3:cd6600
+darkorange4:8b4500 darkorchid:9932cc darkorchid1:bf3eff darkorchid2:b23aee darkorchid3:9a32cd darkorchid4:68228b
+darkred:8b0000 darksalmon:e9967a darkseagreen:8fbc8f darkseagreen1:c1ffc1 darkseagreen2:b4eeb4
+darkseagreen3:9bcd9b darkseagreen4:698b69 darkslateblue:483d8b darkslategray:2f4f4f darkslategray1:97ffff
+darkslategray2:8deeee darkslategray3:79cdcd darkslategray4:528b8b darkslategrey:2f4f4f darkturquoise:00ced1
+darkviolet:9400d3 debianred:d70751 deeppink:ff1493 deeppink1:ff1493 deeppink2:ee1289 deeppink3:cd1076
+deeppink4:8b0a50 deepskyblue:00bfff deepskyblue1:00bfff deepskyblue2:00b2ee deepskyblue3:009acd
+deepskyblue4:00688b dimgray:696969 dimgrey:696969 dodgerblue:1e90ff dodgerblue1:1e90ff dodgerblue2:1c86ee
+dodgerblue3:1874cd dodgerblue4:104e8b firebrick:b22222 firebrick1:ff3030 firebrick2:ee2c2c firebrick3:cd2626
+firebrick4:8b1a1a floralwhite:fffaf0 forestgreen:228b22 gainsboro:dcdcdc ghostwhite:f8f8ff gold:ffd700
+gold1:ffd700 gold2:eec900 gold3:cdad00 gold4:8b7500 goldenrod:daa520 goldenrod1:ffc125 goldenrod2:eeb422
+goldenrod3:cd9b1d goldenrod4:8b6914 gray:bebebe green:00ff00 green1:00ff00 green2:00ee00 green3:00cd00
+green4:008b00 greenyellow:adff2f grey:bebebe honeydew:f0fff0 honeydew1:f0fff0 honeydew2:e0eee0 honeydew3:c1cdc1
+honeydew4:838b83 hotpink:ff69b4 hotpink1:ff6eb4 hotpink2:ee6aa7 hotpink3:cd6090 hotpink4:8b3a62 indianred:cd5c5c
+indianred1:ff6a6a indianred2:ee6363 indianred3:cd5555 indianred4:8b3a3a indigo:4b0082 ivory:fffff0 ivory1:fffff0
+ivory2:eeeee0 ivory3:cdcdc1 ivory4:8b8b83 khaki:f0e68c khaki1:fff68f khaki2:eee685 khaki3:cdc673 khaki4:8b864e
+lavender:e6e6fa lavenderblush:fff0f5 lavenderblush1:fff0f5 lavenderblush2:eee0e5 lavenderblush3:cdc1c5
+lavenderblush4:8b8386 lawngreen:7cfc00 lemonchiffon:fffacd lemonchiffon1:fffacd lemonchiffon2:eee9bf
+lemonchiffon3:cdc9a5 lemonchiffon4:8b8970 lightblue:add8e6 lightblue1:bfefff lightblue2:b2dfee lightblue3:9ac0cd
+lightblue4:68838b lightcoral:f08080 lightcyan:e0ffff lightcyan1:e0ffff lightcyan2:d1eeee lightcyan3:b4cdcd
+lightcyan4:7a8b8b lightgoldenrod:eedd82 lightgoldenrod1:ffec8b lightgoldenrod2:eedc82 lightgoldenrod3:cdbe70
+lightgoldenrod4:8b814c lightgoldenrodyellow:fafad2 lightgray:d3d3d3 lightgreen:90ee90 lightgrey:d3d3d3
+lightpink:ffb6c1 lightpink1:ffaeb9 lightpink2:eea2ad lightpink3:cd8c95 lightpink4:8b5f65 lightsalmon:ffa07a
+lightsalmon1:ffa07a lightsalmon2:ee9572 lightsalmon3:cd8162 lightsalmon4:8b5742 lightseagreen:20b2aa
+lightskyblue:87cefa lightskyblue1:b0e2ff lightskyblue2:a4d3ee lightskyblue3:8db6cd lightskyblue4:607b8b
+lightslateblue:8470ff lightslategray:778899 lightslategrey:778899 lightsteelblue:b0c4de lightsteelblue1:cae1ff
+lightsteelblue2:bcd2ee lightsteelblue3:a2b5cd lightsteelblue4:6e7b8b lightyellow:ffffe0 lightyellow1:ffffe0
+lightyellow2:eeeed1 lightyellow3:cdcdb4 lightyellow4:8b8b7a limegreen:32cd32 linen:faf0e6 magenta:ff00ff
+magenta1:ff00ff magenta2:ee00ee magenta3:cd00cd magenta4:8b008b maroon:b03060 maroon1:ff34b3 maroon2:ee30a7
+maroon3:cd2990 maroon4:8b1c62 mediumaquamarine:66cdaa mediumblue:0000cd mediumorchid:ba55d3 mediumorchid1:e066ff
+mediumorchid2:d15fee mediumorchid3:b452cd mediumorchid4:7a378b mediumpurple:9370db mediumpurple1:ab82ff
+mediumpurple2:9f79ee mediumpurple3:8968cd mediumpurple4:5d478b mediumseagreen:3cb371 mediumslateblue:7b68ee
+mediumspringgreen:00fa9a mediumturquoise:48d1cc mediumvioletred:c71585 midnightblue:191970 mintcream:f5fffa
+mistyrose:ffe4e1 mistyrose1:ffe4e1 mistyrose2:eed5d2 mistyrose3:cdb7b5 mistyrose4:8b7d7b moccasin:ffe4b5
+navajowhite:ffdead navajowhite1:ffdead navajowhite2:eecfa1 navajowhite3:cdb38b navajowhite4:8b795e navy:000080
+navyblue:000080 oldlace:fdf5e6 olive:808000 olivedrab:6b8e23 olivedrab1:c0ff3e olivedrab2:b3ee3a
+olivedrab3:9acd32 olivedrab4:698b22 orange:ffa500 orange1:ffa500 orange2:ee9a00 orange3:cd8500 orange4:8b5a00
+orangered:ff4500 orangered1:ff4500 orangered2:ee4000 orangered3:cd3700 orangered4:8b2500 orchid:da70d6
+orchid1:ff83fa orchid2:ee7ae9 orchid3:cd69c9 orchid4:8b4789 palegoldenrod:eee8aa palegreen:98fb98
+palegreen1:9aff9a palegreen2:90ee90 palegreen3:7ccd7c palegreen4:548b54 paleturquoise:afeeee
+paleturquoise1:bbffff paleturquoise2:aeeeee paleturquoise3:96cdcd paleturquoise4:668b8b palevioletred:db7093
+palevioletred1:ff82ab palevioletred2:ee799f palevioletred3:cd6889 palevioletred4:8b475d papayawhip:ffefd5
+peachpuff:ffdab9 peachpuff1:ffdab9 peachpuff2:eecbad peachpuff3:cdaf95 peachpuff4:8b7765 peru:cd853f pink:ffc0cb
+pink1:ffb5c5 pink2:eea9b8 pink3:cd919e pink4:8b636c plum:dda0dd plum1:ffbbff plum2:eeaeee plum3:cd96cd
+plum4:8b668b powderblue:b0e0e6 purple:a020f0 purple1:9b30ff purple2:912cee purple3:7d26cd purple4:551a8b
+red:ff0000 red1:ff0000 red2:ee0000 red3:cd0000 red4:8b0000 rosybrown:bc8f8f rosybrown1:ffc1c1 rosybrown2:eeb4b4
+rosybrown3:cd9b9b rosybrown4:8b6969 royalblue:4169e1 royalblue1:4876ff royalblue2:436eee royalblue3:3a5fcd
+royalblue4:27408b saddlebrown:8b4513 salmon:fa8072 salmon1:ff8c69 salmon2:ee8262 salmon3:cd7054 salmon4:8b4c39
+sandybrown:f4a460 seagreen:2e8b57 seagreen1:54ff9f seagreen2:4eee94 seagreen3:43cd80 seagreen4:2e8b57
+seashell:fff5ee seashell1:fff5ee seashell2:eee5de seashell3:cdc5bf seashell4:8b8682 sienna:a0522d sienna1:ff8247
+sienna2:ee7942 sienna3:cd6839 sienna4:8b4726 silver:c0c0c0 skyblue:87ceeb skyblue1:87ceff skyblue2:7ec0ee
+skyblue3:6ca6cd skyblue4:4a708b slateblue:6a5acd slateblue1:836fff slateblue2:7a67ee slateblue3:6959cd
+slateblue4:473c8b slategray:708090 slategray1:c6e2ff slategray2:b9d3ee slategray3:9fb6cd slategray4:6c7b8b
+slategrey:708090 snow:fffafa snow1:fffafa snow2:eee9e9 snow3:cdc9c9 snow4:8b8989 springgreen:00ff7f
+springgreen1:00ff7f springgreen2:00ee76 springgreen3:00cd66 springgreen4:008b45 steelblue:4682b4
+steelblue1:63b8ff steelblue2:5cacee steelblue3:4f94cd steelblue4:36648b tan:d2b48c tan1:ffa54f tan2:ee9a49
+tan3:cd853f tan4:8b5a2b teal:008080 thistle:d8bfd8 thistle1:ffe1ff thistle2:eed2ee thistle3:cdb5cd
+thistle4:8b7b8b tomato:ff6347 tomato1:ff6347 tomato2:ee5c42 tomato3:cd4f39 tomato4:8b3626 turquoise:40e0d0
+turquoise1:00f5ff turquoise2:00e5ee turquoise3:00c5cd turquoise4:00868b violet:ee82ee violetred:d02090
+violetred1:ff3e96 violetred2:ee3a8c violetred3:cd3278 violetred4:8b2252 wheat:f5deb3 wheat1:ffe7ba wheat2:eed8ae
+wheat3:cdba96 wheat4:8b7e66 white:ffffff whitesmoke:f5f5f5 yellow:ffff00 yellow1:ffff00 yellow2:eeee00
+yellow3:cdcd00 yellow4:8b8b00 yellowgreen:9acd32
+"""
+_x11_colors = None # Name -> (R, G, B), parsed from _X11_COLOR_NAMES on first use (plus add_color_name's)
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+def _color_names():
+    """Returns the name -> (R, G, B) table, parsing _X11_COLOR_NAMES on first use."""
+    global _x11_colors
+    if _x11_colors is None:
+        colors = {}
+        for entry in _X11_COLOR_NAMES.split():
+            color_name, hex_value = entry.split(":")
+            colors[color_name] = tuple(bytes.fromhex(hex_value))
+        _x11_colors = colors
+    return _x11_colors
+
+def add_color_name(name, rgb):
+    """
+    Teaches parse_color a color name the bundled table lacks, such as a platform's Tk system
+    colors (SystemButtonFace on Windows), once Tk has resolved it (see _lookup_tk_color).
+    """
+    _color_names()[name.replace(" ", "").lower()] = tuple(rgb)
+
+def _lookup_color_name(name):
+    """Returns the (R, G, B) of an X11/Tk color name (case and spaces ignored), or None."""
+    key = name.replace(" ", "").lower()
+    rgb = _color_names().get(key)
+    if rgb is None and key[:4] in ("gray", "grey") and key[4:].isdigit() and int(key[4:]) <= 100:
+        level = int(int(key[4:]) * 2.55 + 0.5) # Same rounding as X11's rgb.txt (gray50 is 127)
+        rgb = (level, level, level)
+    return rgb
+
+@functools.lru_cache(maxsize=256)
+def parse_color(color_string):
     """
-    Converts a color string (name or hex) to an RGB tuple (0-255 range).
-    Uses Tkinter's winfo_rgb for robustness with color names.
+    Converts a Tk color string to an RGB tuple (0-255 range) in pure Python, so no Tk root
+    (or Tcl round-trip) is needed. Results are memoized, so a color is only parsed once.
     Args:
-        widget: A Tkinter widget (e.g., root window or canvas) to call winfo_rgb on.
-        color_string: The color name (e.g., "red", "darkblue") or hex code (e.g., "#RRGGBB").
+        color_string: An X11/Tk color name (e.g., "red", "dark blue", "LightSteelBlue3", "gray40")
+                      or a hex code: #RGB, #RRGGBB, #RRRGGGBBB or #RRRRGGGGBBBB.
     Returns:
-        An RGB tuple (R, G, B) where each component is 0-255. Defaults to black if invalid.
+        An RGB tuple (R, G, B) where each component is 0-255.
+    Raises:
+        ValueError: If the hex code is malformed or the name is unknown.
     """
+    text = color_string.strip()
+    if text.startswith("#"):
+        digits = text[1:]
+        if len(digits) not in (3, 6, 9, 12) or not _HEX_DIGITS.issuperset(digits):
+            raise ValueError(f"Malformed hex color '{color_string}' (expected #RGB, #RRGGBB or #RRRRGGGGBBBB)")
+        width = len(digits) // 3
+        r, g, b = (int(digits[i * width:(i + 1) * width], 16) for i in range(3))
+        if width == 1:
+            return (r * 17, g * 17, b * 17) # #fff is white, as in CSS and PIL
+        shift = 4 * (width - 2) # Keep the 8 most significant bits, like winfo_rgb // 256
+        return (r >> shift, g >> shift, b >> shift)
+
+    rgb = _lookup_color_name(text)
+    if rgb is None:
+        raise ValueError(f"Unknown color name '{color_string}'")
+    return rgb
+
+def resolve_color(color_string, fallback=(0, 0, 0)):
+    """Like parse_color, but returns fallback (black by default) instead of raising for invalid colors."""
     try:
-        # winfo_rgb returns 16-bit values, so divide by 256 for 8-bit (0-255)
-        r, g, b = widget.winfo_rgb(color_string)
-        return (r // 256, g // 256, b // 256)
-    except tk.TclError:
-        # If winfo_rgb fails (invalid color name or malformed hex), fallback to black
-        return (0, 0, 0) # Default to black if all else fails
+        return parse_color(color_string)
+    except ValueError:
+        return fallback
 
 def rgb_to_hex(rgb_tuple):
     """Converts an RGB tuple (R, G, B) to a hex color string (e.g., '#RRGGBB')."""
@@ -47,140 +261,2528 @@ def interpolate_color(color1_rgb, color2_rgb, ratio):
     return (r, g, b)
 
 
-class ZoidbergApp:
-    def __init__(self, master):
-        self.master = master
-        master.title("Why not Zoidberg?")
-        master.geometry("500x550")
-        master.minsize(300, 350)
+# --- Gradient Engine ---
+def build_gradient_column(height, start_rgb, end_rgb):
+    """
+    Builds a 1-pixel-wide vertical gradient strip as an RGB PIL image.
+    Each row uses the same interpolation as interpolate_color, so the result
+    matches the old row-by-row canvas rectangles exactly.
+    """
+    height = max(1, height)
+    last_row = height - 1
+    rows = [interpolate_color(start_rgb, end_rgb, i / last_row if last_row else 0)
+            for i in range(height)]
+    column = Image.new("RGB", (1, height))
+    column.putdata(rows)
+    return column
 
-        self.config = configparser.ConfigParser()
+class GradientCache:
+    """
+    Caches rendered gradient backgrounds keyed by (width, height, start_color, end_color).
+    The gradient only varies vertically, so the 1-pixel column for a given height
+    is kept as well; a resize that only changes the width just stretches that column
+    (a single C-level NEAREST resize) instead of recomputing any colors.
+    Thread-safe: the render worker builds gradients while the Tk thread may trim().
+    Images are built outside the lock, and each call returns the image it built or found.
+    """
+    def __init__(self):
+        self._column_entry = (None, None) # (key, column)
+        self._image_entry = (None, None) # (key, image)
+        self._lock = threading.Lock()
 
-        # Initialize all config-related instance variables with defaults
-        self.display_text = ""
-        self.text_color = "black"
-        self.background_type = "solid"
-        self.background_color = "#F0F0F0"
-        self.gradient_start_color = "#ADD8E6"
-        self.gradient_end_color = "#87CEEB"
-        self.sound_enabled = False # Sound feature flag
-        self.launch_sound_filename = "woop.wav" # Default launch sound filename
-        self.config_loaded_from_dropped_file = False # Flag to track if config came from a dropped file
+    def get(self, width, height, start_rgb, end_rgb):
+        """Returns an RGB PIL image of the requested size, reusing cached work where possible."""
+        image_key = (width, height, start_rgb, end_rgb)
+        with self._lock:
+            key, image = self._image_entry
+        if key == image_key:
+            return image
 
-        self.color_shift_enabled = False # Controls if *any* static shift is applied
-        self.static_hue_offset = 0.0 # NEW: Degrees for static hue shift (0-360)
+        image = self.column(height, start_rgb, end_rgb).resize((max(1, width), max(1, height)), Image.NEAREST)
+        with self._lock:
+            self._image_entry = (image_key, image)
+        return image
 
+    def column(self, height, start_rgb, end_rgb):
+        """Returns the 1-pixel-wide gradient column for height, rebuilding it only when the inputs change."""
+        column_key = (height, start_rgb, end_rgb)
+        with self._lock:
+            key, column = self._column_entry
+        if key != column_key:
+            column = build_gradient_column(height, start_rgb, end_rgb)
+            with self._lock:
+                self._column_entry = (column_key, column)
+        return column
 
-        # Determine the application base path
-        if getattr(sys, 'frozen', False):
-            # Running from a PyInstaller executable
-            self.application_base_path = os.path.dirname(sys.executable)
-        else:
-            # Running as a .py script
-            self.application_base_path = os.path.dirname(os.path.abspath(__file__))
+    def trim(self):
+        """Drops the full-size image but keeps the column (e.g., once the image is on the canvas)."""
+        with self._lock:
+            self._image_entry = (None, None)
 
-        # Determine the primary config file path to use based on sys.argv
-        # This allows drag-and-drop to set the config file BEFORE loading
-        self.config_file = os.path.join(self.application_base_path, 'config.ini') # Default config file
 
-        if len(sys.argv) > 1 and sys.argv[1].lower().endswith('.ini') and os.path.isfile(sys.argv[1]):
-            self.config_file = sys.argv[1] # Use the dropped .ini as the primary config source
-            self.config_loaded_from_dropped_file = True # Set flag
+# --- Color Adjustment ---
+IDENTITY_ADJUSTMENT = (0, 1.0, 1.0, 1.0, 1.0, None, 0.0) # A chain that changes nothing (see color_adjustment)
 
-        self._load_config() # Loads from self.config_file
-        self._parse_and_apply_command_line_args() # Applies overrides or skips if dropped .ini was primary
+def hue_offset_to_pil(hue_offset):
+    """Converts a hue offset in degrees (0-360) to PIL's 0-255 hue band units."""
+    return int(hue_offset / 360 * 255) % 256
 
-        # DEBUG: Print final loaded color shift settings
-        print(f"DEBUG APP INIT: Color Shift Enabled: {self.color_shift_enabled}, Static Hue Offset: {self.static_hue_offset}")
+def color_adjustment(hue_offset=None, saturation=1.0, brightness=1.0, contrast=1.0, gamma=1.0,
+                     tint=None, tint_strength=0.5):
+    """
+    Returns the key of a color adjustment chain, or None if the chain changes nothing.
+    The hue is rotated by hue_offset degrees and the saturation scaled (both in HSV), then
+    each RGB channel gets the brightness factor, the contrast factor (around mid gray), the
+    gamma (above 1 brightens the midtones) and a multiplicative tint that moves white
+    tint_strength of the way to the tint color. Parameters are normalized (hue to PIL's
+    units, factors rounded), so chains that render alike share cache entries.
+    """
+    tint_rgb = resolve_color(tint, None) if tint and tint_strength > 0 else None
+    key = (hue_offset_to_pil(hue_offset) if hue_offset is not None else 0,
+           round(max(0.0, saturation), 3), round(max(0.0, brightness), 3), round(max(0.0, contrast), 3),
+           round(max(0.1, gamma), 3), tint_rgb, round(min(1.0, tint_strength), 3) if tint_rgb else 0.0)
+    return None if key == IDENTITY_ADJUSTMENT else key
 
-        # Image related instance variables
-        self.original_zoidberg_pil = None
+def with_hue_offset(adjustment, hue_offset):
+    """Returns adjustment (None: no adjustment) with its hue rotation replaced by hue_offset degrees."""
+    key = (hue_offset_to_pil(hue_offset),) + (adjustment or IDENTITY_ADJUSTMENT)[1:]
+    return None if key == IDENTITY_ADJUSTMENT else key
 
-        # Path to the image relative to the application base path
-        image_path = os.path.join(self.application_base_path, "Zoidberg", "Zoidberg Icon.png")
-        print(f"DEBUG __init__: Attempting to load image from: '{image_path}'") # DEBUG: Print image path
+def settings_color_adjustment(settings, hue_offset=None):
+    """
+    Returns the color_adjustment of a ZoidbergSettings (or any object with the same attributes):
+    its static hue offset if color shift is enabled (hue_offset overrides it) and the other
+    adjustments, which default to none for objects that don't have them.
+    """
+    if hue_offset is None and settings.color_shift_enabled:
+        hue_offset = settings.static_hue_offset
+    return color_adjustment(hue_offset, getattr(settings, "saturation", 1.0), getattr(settings, "brightness", 1.0),
+                            getattr(settings, "contrast", 1.0), getattr(settings, "gamma", 1.0),
+                            getattr(settings, "tint", None), getattr(settings, "tint_strength", 0.5))
 
-        if not os.path.exists(image_path):
-            messagebox.showerror("Image Error", (f"Zoidberg image not found at '{image_path}'.\n"
-                                                  "Please ensure the image path is correct."))
-            master.destroy()
+@functools.lru_cache(maxsize=512) # A hue cycle compiles up to 256 chains, one per frame
+def compile_color_adjustment(adjustment):
+    """
+    Fuses an adjustment chain into (hsv_lut, rgb_lut): 8-bit lookup tables for PIL's point(),
+    each None when its stage changes nothing. However many adjustments are stacked, applying
+    the chain costs at most one HSV round trip and one RGB lookup.
+    """
+    hue, saturation, brightness, contrast, gamma, tint_rgb, tint_strength = adjustment
+    hsv_lut = None
+    if hue or saturation != 1.0:
+        hsv_lut = ([(x + hue) % 256 for x in range(256)] +
+                   [min(255, round(x * saturation)) for x in range(256)] + list(range(256)))
+
+    rgb_lut = None
+    if (brightness, contrast, gamma, tint_rgb) != IDENTITY_ADJUSTMENT[2:6]:
+        rgb_lut = []
+        for channel in range(3):
+            tint_factor = 1.0 - tint_strength + tint_strength * tint_rgb[channel] / 255 if tint_rgb else 1.0
+            for x in range(256):
+                value = min(255.0, max(0.0, (x * brightness - 127.5) * contrast + 127.5))
+                value = 255.0 * (value / 255.0) ** (1.0 / gamma)
+                rgb_lut.append(min(255, round(value * tint_factor)))
+    return hsv_lut, rgb_lut
+
+def apply_color_adjustment(image, adjustment):
+    """
+    Returns an RGBA image with the adjustment chain applied (image itself if adjustment is
+    None). Each stage is a single C-level point() over the image, and alpha is untouched:
+    it is reattached after the HSV round trip, or mapped to itself in the same lookup as
+    the RGB channels when hue and saturation are unchanged.
+    """
+    if adjustment is None:
+        return image
+    hsv_lut, rgb_lut = compile_color_adjustment(adjustment)
+    if hsv_lut is None:
+        return image.convert("RGBA").point(rgb_lut + list(range(256)))
+
+    adjusted = image.convert("RGB").convert("HSV").point(hsv_lut).convert("RGB")
+    if rgb_lut is not None:
+        adjusted = adjusted.point(rgb_lut)
+    adjusted.putalpha(image.getchannel("A") if image.mode == "RGBA" else 255)
+    return adjusted
+
+def apply_hue_shift(image, hue_offset):
+    """Returns a copy of an RGBA image with its hue rotated by hue_offset degrees (a hue-only chain)."""
+    return apply_color_adjustment(image, color_adjustment(hue_offset)).copy()
+
+class ColorAdjustmentCache:
+    """
+    Memoizes color-adjusted copies of a source image, keyed by the adjustment chain (see
+    color_adjustment). The adjusted sprite doesn't depend on the size, so resizes reuse the
+    cached result instead of reapplying the chain. The oldest entries are evicted past max_entries.
+    """
+    def __init__(self, source_image, max_entries=8, asset_cache=None):
+        self.source_image = source_image
+        self.max_entries = max_entries
+        self.asset_cache = asset_cache # Optional SpriteAssetCache, to reuse adjusted images across launches
+        self._entries = {} # Insertion-ordered: oldest first
+
+    def get(self, adjustment):
+        """Returns the source image with adjustment applied, computing it at most once."""
+        if adjustment is None:
+            return self.source_image
+        adjusted = self._entries.pop(adjustment, None)
+        if adjusted is None:
+            if self.asset_cache is not None:
+                adjusted = self.asset_cache.get_or_create(("color", adjustment),
+                                                          lambda: apply_color_adjustment(self.source_image, adjustment))
+            else:
+                adjusted = apply_color_adjustment(self.source_image, adjustment)
+            while len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]
+        self._entries[adjustment] = adjusted # Re-insert as most recently used
+        return adjusted
+
+
+# --- Sprite Asset Cache ---
+class SpriteAssetCache:
+    """
+    Content-addressed on-disk cache of transformed sprite images (hue-shifted and pre-scaled
+    variants), stored as raw RGBA so a repeat launch memory-maps them instead of decoding
+    the PNG and redoing the HSV conversion. Entries are keyed by a hash of the source file
+    plus the transform parameters. Once the directory grows past max_bytes, the least
+    recently used entries (by modification time, refreshed on every hit) are deleted.
+    """
+    HEADER = struct.Struct("<4sII") # Magic, width, height; raw RGBA pixels follow
+    MAGIC = b"ZRGB"
+
+    def __init__(self, cache_dir, source_path, max_bytes=64 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.source_path = source_path
+        self.max_bytes = max_bytes
+        self._source_hash = None
+
+    def source_hash(self):
+        """Returns the SHA-256 of the source file (computed once per run)."""
+        if self._source_hash is None:
+            with open(self.source_path, 'rb') as f:
+                self._source_hash = hashlib.sha256(f.read()).hexdigest()
+        return self._source_hash
+
+    def entry_path(self, params):
+        """Returns the cache file path for a tuple of transform parameters (e.g., ("hue", 63))."""
+        key = hashlib.sha256(f"{self.source_hash()}|{params!r}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key[:32]}.rgba")
+
+    def load(self, params):
+        """Returns the cached RGBA image for params as a read-only memory-mapped image, or None."""
+        path = self.entry_path(params)
+        try:
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError): # Missing (or empty) entry
+            return None
+
+        magic, width, height = self.HEADER.unpack_from(mapped) if len(mapped) >= self.HEADER.size else (None, 0, 0)
+        if magic != self.MAGIC or len(mapped) != self.HEADER.size + width * height * 4:
+            mapped.close()
+            self._remove(path) # Truncated or foreign file
+            return None
+
+        try:
+            os.utime(path) # Mark as recently used for eviction
+        except OSError:
+            pass
+        return Image.frombuffer("RGBA", (width, height), memoryview(mapped)[self.HEADER.size:], "raw", "RGBA", 0, 1)
+
+    def store(self, params, image):
+        """Writes image (converted to RGBA) for params, then evicts old entries if over budget."""
+        if self.max_bytes <= 0:
+            return
+        path = self.entry_path(params)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            rgba = image if image.mode == "RGBA" else image.convert("RGBA")
+            with open(temp_path, 'wb') as f:
+                f.write(self.HEADER.pack(self.MAGIC, rgba.width, rgba.height))
+                f.write(rgba.tobytes())
+            os.replace(temp_path, path) # Atomic, so other instances never see a partial entry
+        except OSError as e:
+            print(f"Warning: Could not write sprite cache entry '{path}': {e}")
+            self._remove(temp_path)
             return
+        self.evict()
+
+    def get_or_create(self, params, build):
+        """Returns the cached image for params, or calls build() and caches its result."""
+        image = self.load(params) if self.max_bytes > 0 else None
+        if image is None:
+            image = build()
+            self.store(params, image)
+        return image
 
+    def evict(self):
+        """Deletes least recently used entries until the cache fits in max_bytes."""
         try:
-            self.original_zoidberg_pil = Image.open(image_path)
-            self.original_zoidberg_pil = self.original_zoidberg_pil.convert("RGBA") # Ensure it has an alpha channel initially
-            print(f"DEBUG __init__: Image loaded. Original dimensions: {self.original_zoidberg_pil.size}") # DEBUG: Print original dims
-        except Exception as e:
-            messagebox.showerror("Image Error", f"Failed to load Zoidberg image: {e}")
-            print(f"ERROR: Failed to load Zoidberg image: {e}") # DEBUG: Print error to console too
-            master.destroy()
+            entries = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith(".rgba")]
+            entries = [(os.path.getmtime(path), os.path.getsize(path), path) for path in entries]
+        except OSError:
             return
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            if self._remove(path): # Can fail on Windows while another instance has it mapped
+                total_bytes -= size
 
-        self.canvas = tk.Canvas(master, highlightthickness=0)
-        self.canvas.pack(fill=tk.BOTH, expand=True)
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
 
-        self.canvas_image_id = None
-        self.canvas_text_id = None
-        self.zoidberg_photo = None # Initialize as None; will be created/updated in _draw_content
 
+# --- Sprite Skins ---
+DEFAULT_SKIN = "Zoidberg" # The built-in sprite, Zoidberg/Zoidberg Icon.png
+SKIN_EXTENSIONS = (".png", ".webp", ".gif", ".jpg", ".jpeg", ".bmp")
 
-        self._resize_job = None
+def find_skins(application_base_path):
+    """
+    Returns {skin name: image path}: the built-in sprite first, then every image in
+    Zoidberg/Skins/ sorted by name (a skin is named after its file, without the extension).
+    Only the directory is listed; nothing is opened.
+    """
+    skins = {DEFAULT_SKIN: get_zoidberg_image_path(application_base_path)}
+    skins_dir = os.path.join(application_base_path, "Zoidberg", "Skins")
+    try:
+        file_names = sorted(os.listdir(skins_dir), key=str.casefold)
+    except OSError: # No Skins folder: just the built-in sprite
+        return skins
+    for file_name in file_names:
+        name, extension = os.path.splitext(file_name)
+        if extension.lower() in SKIN_EXTENSIONS and name.casefold() not in (skin.casefold() for skin in skins):
+            skins[name] = os.path.join(skins_dir, file_name)
+    return skins
 
-        self.canvas.bind("<Configure>", self._on_resize_debounced)
-        self.master.protocol("WM_DELETE_WINDOW", self._on_closing)
+def match_skin_name(skins, name):
+    """Returns the skin in skins called name (ignoring case), or None if there is none."""
+    for skin in skins:
+        if skin.casefold() == name.casefold():
+            return skin
+    return None
 
-        self.master.update_idletasks()
-        self._draw_content() # Initial draw
+def image_nbytes(image):
+    """Approximate memory held by a decoded PIL image."""
+    return image.width * image.height * len(image.getbands())
 
-        # Initialize pygame mixer only if sound is enabled (remains here)
-        if self.sound_enabled:
+class MemoryLRU:
+    """
+    In-memory least-recently-used cache of PIL images, bounded by their total size in bytes
+    rather than by an entry count, so one 4K skin costs as much of the budget as it takes
+    in memory. The newest entry is always kept, even if it alone exceeds max_bytes.
+    Thread-safe: the first window renders its first frame on the Tk thread and everything
+    else on the render worker. The lock is not held while build() runs, so a long build on
+    one thread never blocks a cache hit on the other (at worst both build the same entry).
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._entries = {} # Insertion-ordered, least recently used first: key -> (image, nbytes)
+        self._lock = threading.RLock() # Reentrant: get_or_create() evicts while holding it
+
+    def get_or_create(self, key, build):
+        """Returns the image cached under key, calling build() to create it on a miss."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.stats["hits"] += 1
+                self._entries[key] = entry # Re-insert as most recently used
+                return entry[0]
+            self.stats["misses"] += 1
+        image = build() # May fetch other entries (e.g., the source)
+        with self._lock:
+            replaced = self._entries.pop(key, None) # Built by the other thread meanwhile
+            if replaced is not None:
+                self.total_bytes -= replaced[1]
+            self._entries[key] = (image, image_nbytes(image))
+            self.total_bytes += self._entries[key][1]
+            self.evict()
+        return image
+
+    def evict(self):
+        """Drops the least recently used entries until the total fits in max_bytes."""
+        with self._lock:
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                _, nbytes = self._entries.pop(next(iter(self._entries)))
+                self.total_bytes -= nbytes
+                self.stats["evictions"] += 1
+
+    def discard(self, keys):
+        """Drops the entries cached under keys (those that are cached)."""
+        with self._lock:
+            for key in keys:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self.total_bytes -= entry[1]
+                    self.stats["evictions"] += 1
+
+class SkinLibrary:
+    """
+    The sprite skins a window can switch between (see find_skins). Skins are only decoded
+    when first shown, through a per-skin SpriteAssetCache on disk; the decoded and
+    color-adjusted images of every skin share one MemoryLRU, so cycling through many
+    high-resolution skins stays within memory_max_bytes.
+    """
+    def __init__(self, application_base_path, memory_max_bytes, disk_max_bytes):
+        self.application_base_path = application_base_path
+        self.cache_dir = os.path.join(application_base_path, "Zoidberg", "Cache")
+        self.disk_max_bytes = disk_max_bytes
+        self.memory = MemoryLRU(memory_max_bytes)
+        self.paths = {} # Skin name -> image path
+        self._sizes = {} # Skin name -> (width, height), read from the file header
+        self.broken = {} # Skin name -> why its image couldn't be read (so it is reported only once)
+        self._asset_caches = {} # Skin name -> SpriteAssetCache
+        self.refresh()
+
+    def refresh(self):
+        """Re-lists Zoidberg/Skins/, picking up skins added or removed since."""
+        self.paths = find_skins(self.application_base_path)
+
+    @property
+    def names(self):
+        return list(self.paths)
+
+    def resolve(self, name):
+        """Returns the skin called name (ignoring case), or None if there is none."""
+        return match_skin_name(self.paths, name)
+
+    def size(self, skin):
+        """
+        Returns the (width, height) of skin from its image header, without decoding it.
+        Raises OSError (UnidentifiedImageError included) if the file can't be read, after
+        recording why in broken.
+        """
+        size = self._sizes.get(skin)
+        if size is None:
+            try:
+                with Image.open(self.paths[skin]) as image:
+                    size = image.size
+            except OSError as e:
+                self.broken[skin] = str(e)
+                raise
+            self._sizes[skin] = size
+        return size
+
+    def asset_cache(self, skin):
+        """Returns the on-disk cache of skin's transformed images (all skins share one directory and budget)."""
+        cache = self._asset_caches.get(skin)
+        if cache is None:
+            cache = SpriteAssetCache(self.cache_dir, self.paths[skin], max_bytes=self.disk_max_bytes)
+            self._asset_caches[skin] = cache
+        return cache
+
+    def set_budgets(self, memory_max_bytes, disk_max_bytes):
+        """Applies new memory and disk cache limits (e.g., after a config reload)."""
+        self.memory.max_bytes = memory_max_bytes
+        self.memory.evict()
+        self.disk_max_bytes = disk_max_bytes
+        for cache in self._asset_caches.values():
+            cache.max_bytes = disk_max_bytes
+
+    def source(self, skin):
+        """Returns skin decoded as RGBA, decoding it on first use."""
+        path = self.paths[skin]
+        return self.memory.get_or_create(("source", skin), lambda: self.asset_cache(skin).get_or_create(
+            ("source",), lambda: Image.open(path).convert("RGBA"))) # Ensure it has an alpha channel
+
+    def release(self, skin, adjustment):
+        """Drops skin's decoded and adjusted images from memory; the disk cache brings them back when needed."""
+        self.memory.discard([("source", skin), ("color", skin, adjustment)])
+
+    def adjusted(self, skin, adjustment):
+        """Returns skin with a color adjustment chain applied (see color_adjustment), computing it at most once while cached."""
+        if adjustment is None:
+            return self.source(skin)
+        return self.memory.get_or_create(("color", skin, adjustment), lambda: self.asset_cache(skin).get_or_create(
+            ("color", adjustment), lambda: apply_color_adjustment(self.source(skin), adjustment)))
+
+
+# --- Scene Model ---
+class SceneModel:
+    """
+    Remembers the inputs each canvas layer was last drawn from, so a redraw only
+    touches the layers whose inputs actually changed (a move, a config reload that
+    only changes text color, etc.). stats counts draws per layer and no-op redraws.
+    """
+    LAYERS = ("background", "sprite", "sprite_position", "text", "text_position")
+
+    def __init__(self):
+        self.canvas_size = None # (width, height) of the last draw
+        self._keys = dict.fromkeys(self.LAYERS)
+        self.stats = {"configure_events": 0, "configure_ignored": 0, "draw_calls": 0, "skipped": 0}
+        self.stats.update(dict.fromkeys(self.LAYERS, 0))
+
+    def is_dirty(self, layer, key):
+        """True if layer was last drawn from something other than key."""
+        return self._keys[layer] != key
+
+    def mark_drawn(self, layer, key):
+        """Records that layer now reflects key."""
+        self._keys[layer] = key
+        self.stats[layer] += 1
+
+    def invalidate(self, *layers):
+        """Forces the given layers (all layers if none given) to redraw on the next draw."""
+        for layer in layers or self.LAYERS:
+            self._keys[layer] = None
+
+
+# --- Warm-Start Snapshot ---
+SNAPSHOT_VERSION = 2
+
+def get_snapshot_paths(application_base_path):
+    """Returns the (JSON, PPM) paths of the warm-start snapshot in Zoidberg/Cache/."""
+    cache_dir = os.path.join(application_base_path, "Zoidberg", "Cache")
+    return os.path.join(cache_dir, "snapshot.json"), os.path.join(cache_dir, "snapshot.ppm")
+
+def file_sha256(path):
+    """Returns the SHA-256 of a file's contents, or None if it can't be read."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def snapshot_key(value):
+    """Turns a layer key read back from the snapshot JSON into the tuple it was saved from."""
+    return tuple(snapshot_key(item) for item in value) if isinstance(value, list) else value
+
+def load_snapshot(application_base_path):
+    """
+    Returns the snapshot saved by the last window to close (a dict, with "image_path" set
+    to its frame), or None if there is none or it is unreadable or from another version.
+    """
+    json_path, image_path = get_snapshot_paths(application_base_path)
+    try:
+        with open(json_path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION or not os.path.exists(image_path):
+        return None
+    snapshot["image_path"] = image_path
+    return snapshot
+
+def save_snapshot(application_base_path, snapshot, frame_image):
+    """
+    Writes snapshot (a JSON-able dict) and its RGB frame. The frame is stored as PPM, which
+    Tk decodes natively, so the next launch can paint it before touching PIL. Both files are
+    replaced atomically; the frame goes first, and load-time checks its size against the JSON.
+    """
+    json_path, image_path = get_snapshot_paths(application_base_path)
+    try:
+        os.makedirs(os.path.dirname(json_path), exist_ok=True)
+        frame_image.save(image_path + ".tmp", format="PPM")
+        os.replace(image_path + ".tmp", image_path)
+        with open(json_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(json_path + ".tmp", json_path)
+    except OSError as e:
+        print(f"Warning: Could not save the warm-start snapshot: {e}", file=sys.stderr)
+
+
+# --- Instrumentation ---
+PERF_MAX_SAMPLES = 4096 # Ring buffer size; the oldest samples are overwritten
+PERF_OVERLAY_INTERVAL_MS = 500
+PERF_OVERLAY_WINDOW = 256 # Recent samples averaged for the on-canvas overlay
+
+class _NullSpan:
+    """Shared no-op span returned while instrumentation is off."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _PerfSpan:
+    """Times one phase with perf_counter and records it into a PerfRecorder."""
+    __slots__ = ("samples", "phase", "start")
+
+    def __init__(self, samples, phase):
+        self.samples = samples
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.samples.append((self.phase, self.start, time.perf_counter() - self.start))
+        return False
+
+class PerfRecorder:
+    """
+    Per-phase timings for the render path (config load, image decode, gradient build,
+    hue shift, resample, PhotoImage creation, canvas updates). Each sample is
+    (phase, perf_counter start, seconds) in a bounded ring buffer, so a long session
+    keeps only the most recent PERF_MAX_SAMPLES. While disabled, span() returns a
+    shared no-op context manager and nothing is allocated or recorded.
+    """
+    def __init__(self, enabled=False, max_samples=PERF_MAX_SAMPLES):
+        self.enabled = enabled
+        self.samples = collections.deque(maxlen=max_samples)
+        self.frames = collections.deque(maxlen=120) # perf_counter of recently presented frames, for FPS
+
+    def span(self, phase):
+        """Context manager timing phase (a no-op while disabled)."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _PerfSpan(self.samples, phase)
+
+    def record(self, phase, start, seconds):
+        """Records a phase that was timed by the caller."""
+        if self.enabled:
+            self.samples.append((phase, start, seconds))
+
+    def mark_frame(self):
+        """Notes that a new frame was put on screen."""
+        if self.enabled:
+            self.frames.append(time.perf_counter())
+
+    def fps(self):
+        """Frames per second over the recent frames (0 until there are two)."""
+        if len(self.frames) < 2:
+            return 0.0
+        elapsed = self.frames[-1] - self.frames[0]
+        return (len(self.frames) - 1) / elapsed if elapsed > 0 else 0.0
+
+    def summary(self, last=None):
+        """Returns {phase: {count, mean_ms, max_ms, total_ms}} over the buffered (or the last N) samples."""
+        samples = list(self.samples)[-last:] if last else self.samples
+        summary = {}
+        for phase, _, seconds in samples:
+            entry = summary.setdefault(phase, {"count": 0, "mean_ms": 0.0, "max_ms": 0.0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += seconds * 1000
+            entry["max_ms"] = max(entry["max_ms"], seconds * 1000)
+        for entry in summary.values():
+            entry["mean_ms"] = entry["total_ms"] / entry["count"]
+        return summary
+
+    def dump(self, path, counters=None):
+        """Writes the samples, per-phase summary, FPS and any extra counters to path as JSON."""
+        data = {
+            "fps": self.fps(),
+            "summary": self.summary(),
+            "counters": counters or {},
+            # start_ms is relative to process start, so spans line up with --startup-profile
+            "samples": [{"phase": phase, "start_ms": (start - _startup_t0) * 1000, "ms": seconds * 1000}
+                        for phase, start, seconds in self.samples],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def format_summary(self, last=None):
+        """Returns the per-phase summary as aligned text lines."""
+        return [f"{phase:<16} {entry['mean_ms']:7.2f} ms (max {entry['max_ms']:.2f}, n={entry['count']})"
+                for phase, entry in sorted(self.summary(last).items())]
+
+MEMORY_STEADY_SAMPLES = 64 # Samples at each end of the run compared to tell steady state from growth
+
+def _windows_memory_counters():
+    """Returns (working set, peak working set) in bytes from GetProcessMemoryInfo."""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(wintypes.HANDLE(process), ctypes.byref(counters), counters.cb):
+        return None, None
+    return counters.WorkingSetSize, counters.PeakWorkingSetSize
+
+def read_rss():
+    """Returns (current, peak) resident set size of this process in bytes; None where unavailable."""
+    if sys.platform == "win32":
+        try:
+            return _windows_memory_counters()
+        except (OSError, AttributeError):
+            return None, None
+
+    current = peak = None
+    try:
+        with open("/proc/self/statm") as f: # Linux: size, resident, ... in pages
+            current = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak *= 1 if sys.platform == "darwin" else 1024 # Bytes on macOS, KiB elsewhere
+    except ImportError:
+        pass
+    return current, peak
+
+class MemoryMonitor:
+    """
+    Memory accounting for --memory-report. The resident set size is sampled after every
+    settled frame into a bounded ring buffer; the report gives the OS peak, the steady
+    state (median of the last MEMORY_STEADY_SAMPLES samples) and its growth since the
+    end of warm-up (the MEMORY_STEADY_SAMPLES samples after the first ones, once caches
+    have filled), so memory that creeps up over thousands of resizes shows as growth.
+    tracemalloc additionally traces Python allocations (image pixel buffers live in
+    Pillow's and Tk's C heaps, so they only show in RSS). While disabled, nothing is
+    sampled and tracemalloc is never started.
+    """
+    def __init__(self, enabled=False, max_samples=PERF_MAX_SAMPLES):
+        self.enabled = enabled
+        self.first_samples = [] # The first 2 * MEMORY_STEADY_SAMPLES RSS readings (the ring drops them on long runs)
+        self.samples = collections.deque(maxlen=max_samples) # RSS bytes
+        if enabled:
+            import tracemalloc
+            tracemalloc.start()
+
+    def sample(self):
+        """Records the current RSS."""
+        if not self.enabled:
+            return
+        current, _ = read_rss()
+        if current is not None:
+            self.samples.append(current)
+            if len(self.first_samples) < 2 * MEMORY_STEADY_SAMPLES:
+                self.first_samples.append(current)
+
+    def summary(self):
+        """Returns RSS (MB) and tracemalloc totals (MB) plus the top Python allocation sites."""
+        import statistics
+        import tracemalloc
+        current, peak = read_rss()
+        megabytes = lambda value: None if value is None else round(value / (1024 * 1024), 2)
+        summary = {"samples": len(self.samples), "rss_mb": megabytes(current), "peak_rss_mb": megabytes(peak)}
+        if self.samples:
+            steady = statistics.median(list(self.samples)[-MEMORY_STEADY_SAMPLES:])
+            summary["steady_rss_mb"] = megabytes(steady)
+            warmed_up = self.first_samples[MEMORY_STEADY_SAMPLES:] or self.first_samples
+            summary["rss_growth_mb"] = megabytes(steady - statistics.median(warmed_up))
+        if tracemalloc.is_tracing():
+            traced, traced_peak = tracemalloc.get_traced_memory()
+            summary["traced_mb"] = megabytes(traced)
+            summary["traced_peak_mb"] = megabytes(traced_peak)
+            summary["top_allocations"] = [f"{stat.traceback[0].filename}:{stat.traceback[0].lineno} "
+                                          f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+                                          for stat in tracemalloc.take_snapshot().statistics("lineno")[:5]]
+        return summary
+
+
+# --- Render Pipeline ---
+RENDER_POLL_INTERVAL_MS = 8 # How often the Tk thread collects finished renders while any are in flight
+RENDER_SLOT_WAIT_SECONDS = 0.05 # How often a worker waiting for a result slot checks whether it was superseded
+
+class RenderPipeline:
+    """
+    Runs a window's image transforms (gradient, hue shift, resample) on a background worker
+    and hands the results back to the Tk thread, so the window keeps handling input while a
+    large render is in flight. Each request names the canvas layer it is for and gets the
+    next generation number of that layer: a newer request supersedes older ones, which are
+    cancelled if they haven't started yet and discarded if they finish late. Only the
+    finish callback (PhotoImage creation and canvas updates) runs on the Tk thread, polled
+    with after() only while requests are pending. With max_results, workers wait before
+    building while that many results are already waiting for the Tk thread, which bounds
+    the memory held by finished renders however many requests are in flight.
+    The executor should have a single worker when builds reuse per-window state (such as
+    the sprite pyramid), so they run one at a time; the shared sprite caches lock their
+    own bookkeeping. The tile pipeline's builds only read the images they are given.
+    """
+    def __init__(self, root, executor, max_results=None):
+        self.root = root
+        self.executor = executor
+        self._generations = {} # Layer -> newest generation requested
+        self._pending = {} # Layer -> (key, future, finish) of the newest request
+        self._results = queue.Queue() # (layer, generation, result, error) from the worker
+        self._result_slots = threading.Semaphore(max_results) if max_results else None
+        self._poll_job = None
+        self.stats = {"submitted": 0, "finished": 0, "cancelled": 0, "discarded": 0}
+
+    def pending_key(self, layer):
+        """The key of the request in flight for layer, or None."""
+        pending = self._pending.get(layer)
+        return pending[0] if pending else None
+
+    def busy(self):
+        return bool(self._pending)
+
+    def submit(self, layer, key, build, finish):
+        """Runs build() on the worker, then finish(result) on the Tk thread unless superseded first."""
+        self.cancel(layer)
+        generation = self._generations[layer]
+        future = self.executor.submit(self._run, layer, generation, build)
+        self._pending[layer] = (key, future, finish)
+        self.stats["submitted"] += 1
+        if self._poll_job is None:
+            self._poll_job = self.root.after(RENDER_POLL_INTERVAL_MS, self._poll)
+
+    def cancel(self, layer):
+        """Supersedes any request in flight for layer (it is cancelled or its result discarded)."""
+        self._generations[layer] = self._generations.get(layer, 0) + 1
+        pending = self._pending.pop(layer, None)
+        if pending is not None and pending[1].cancel():
+            self.stats["cancelled"] += 1
+
+    def _run(self, layer, generation, build):
+        """Worker side: skips requests superseded while queued, and reports the result or error."""
+        if self._generations.get(layer) != generation:
+            return
+        if self._result_slots is not None:
+            while not self._result_slots.acquire(timeout=RENDER_SLOT_WAIT_SECONDS):
+                if self._generations.get(layer) != generation:
+                    return # Superseded while waiting
+            if self._generations.get(layer) != generation:
+                self._result_slots.release()
+                return
+        try:
+            self._results.put((layer, generation, build(), None))
+        except Exception as e:
+            self._results.put((layer, generation, None, e))
+
+    def _poll(self):
+        """Tk side: finishes the current results and drops stale ones."""
+        self._poll_job = None
+        while True:
+            try:
+                layer, generation, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if self._result_slots is not None:
+                self._result_slots.release()
+            if generation != self._generations.get(layer) or layer not in self._pending:
+                self.stats["discarded"] += 1
+                continue
+            _, _, finish = self._pending.pop(layer)
+            if error is not None:
+                print(f"Warning: Rendering the {layer} layer failed: {error}")
+                continue
+            self.stats["finished"] += 1
+            finish(result)
+        if self._pending and self._poll_job is None:
+            self._poll_job = self.root.after(RENDER_POLL_INTERVAL_MS, self._poll)
+
+    def shutdown(self):
+        """Cancels everything in flight and stops polling (the executor is owned by the caller)."""
+        for layer in list(self._pending):
+            self.cancel(layer)
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+
+
+# --- Adaptive Resize Scheduling ---
+LIVE_FRAME_MIN_INTERVAL_MS = 16 # Never draw live resize frames faster than ~60 fps
+LIVE_FULL_QUALITY_BUDGET_MS = 12 # Full-quality draws cheaper than this are used for live frames too
+RESIZE_EVENT_GAP_MS = 1000 # A longer gap between <Configure> events starts a new drag
+
+class AdaptiveResizeTiming:
+    """
+    Chooses the resize debounce delay, the live-frame interval and the live-frame quality
+    from exponential moving averages of measured draw cost and of the gap between
+    <Configure> events, clamped to [min_ms, max_ms].
+    The settled (full-quality) draw waits until the event stream has clearly paused and
+    waits longer the more a full draw costs, so a short hesitation mid-drag doesn't
+    start an expensive render that the next event makes stale.
+    """
+    def __init__(self, min_ms, max_ms, smoothing=0.3):
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.smoothing = smoothing # Weight of the newest sample in each moving average
+        self.full_draw_ms = None # Moving average of full-quality draws
+        self.live_draw_ms = None # Moving average of fast (live resize) draws
+        self.event_gap_ms = None # Moving average of the gap between <Configure> events during a drag
+        self._last_event = None
+
+    def _average(self, average, sample):
+        return sample if average is None else average + self.smoothing * (sample - average)
+
+    def _clamp(self, delay_ms):
+        return int(min(self.max_ms, max(self.min_ms, delay_ms)))
+
+    def note_event(self, now):
+        """Records a size-changing <Configure> event at perf_counter time now."""
+        if self._last_event is not None:
+            gap_ms = (now - self._last_event) * 1000
+            if gap_ms < RESIZE_EVENT_GAP_MS:
+                self.event_gap_ms = self._average(self.event_gap_ms, gap_ms)
+        self._last_event = now
+
+    def note_draw(self, duration_ms, fast):
+        """Records how long a (non-skipped) draw took."""
+        if fast:
+            self.live_draw_ms = self._average(self.live_draw_ms, duration_ms)
+        else:
+            self.full_draw_ms = self._average(self.full_draw_ms, duration_ms)
+
+    def live_frame_fast(self):
+        """True if live resize frames should use the cheap resample (full draws are too slow for a frame)."""
+        return self.full_draw_ms is None or self.full_draw_ms > LIVE_FULL_QUALITY_BUDGET_MS
+
+    def live_interval_ms(self):
+        """Delay before the next live frame: leaves the event loop at least as long as a live frame takes."""
+        cost_ms = self.live_draw_ms if self.live_frame_fast() else self.full_draw_ms
+        return int(min(self.max_ms, max(LIVE_FRAME_MIN_INTERVAL_MS, 2 * (cost_ms or 0))))
+
+    def settle_delay_ms(self):
+        """Delay after the last <Configure> event before the full-quality frame is drawn."""
+        delay_ms = self.min_ms
+        if self.event_gap_ms is not None:
+            delay_ms = max(delay_ms, 3 * self.event_gap_ms) # Clearly longer than the gaps within a drag
+        if self.full_draw_ms is not None:
+            delay_ms = max(delay_ms, 2 * self.full_draw_ms) # Slow full draws wait for a firmer stop
+        return self._clamp(delay_ms)
+
+
+# --- Image Pyramid ---
+class ImagePyramid:
+    """
+    Precomputed power-of-two downscales (mipmaps) of a source image.
+    Resizing always starts from the smallest level that is still at least as large
+    as the target, so both the cheap live-resize filter and the final LANCZOS pass
+    touch far fewer source pixels than resampling the full-resolution image.
+    """
+    def __init__(self, source_image, min_side=32):
+        self.source_image = source_image
+        self.levels = [source_image]
+        while min(self.levels[-1].size) // 2 >= min_side:
+            self.levels.append(self.levels[-1].reduce(2)) # Box filter, alpha-aware for RGBA
+
+    def best_level(self, size):
+        """Returns the smallest pyramid level that covers the requested (width, height)."""
+        width, height = size
+        for level in reversed(self.levels):
+            if level.width >= width and level.height >= height:
+                return level
+        return self.levels[0] # Upscaling: start from full resolution
+
+    def resize(self, size, fast=False):
+        """
+        Resizes to (width, height) from the best level.
+        fast=True uses NEAREST for interactive feedback during a drag (the chosen level
+        is never more than 2x the target, so aliasing stays mild); otherwise a single
+        LANCZOS pass is used for the settled frame.
+        """
+        resample = Image.NEAREST if fast else Image.LANCZOS
+        return self.best_level(size).resize(size, resample)
+
+def resize_without_pyramid(image, size, fast=False):
+    """
+    ImagePyramid.resize without keeping the levels alive: PIL box-reduces the image in
+    steps internally (reducing_gap) and frees each step as soon as it is used.
+    """
+    return image.resize(size, Image.NEAREST if fast else Image.LANCZOS, reducing_gap=2.0)
+
+
+# --- Tiled Rendering ---
+FULLSCREEN_MODES = ("off", "monitor", "span")
+TILE_SIZE_DEFAULT = 512
+TILED_MIN_PIXELS = 3840 * 2160 // 2 # Windowed canvases this large (half a 4K screen) are tiled too
+TILE_WORKERS = max(1, min(8, os.cpu_count() or 1))
+TILE_RESULTS_PER_WORKER = 2 # Finished tiles per worker that may wait for the Tk thread
+
+def virtual_screen_bounds(root):
+    """
+    Returns (x, y, width, height) of the area covered by every monitor: the virtual screen
+    on Windows, Tk's screen elsewhere (which X11 already spans across monitors).
+    """
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            metrics = ctypes.windll.user32.GetSystemMetrics
+            return metrics(76), metrics(77), metrics(78), metrics(79) # SM_XVIRTUALSCREEN .. SM_CYVIRTUALSCREEN
+        except (OSError, AttributeError):
+            pass
+    return 0, 0, root.winfo_screenwidth(), root.winfo_screenheight()
+
+def tile_boxes(canvas_size, tile_size):
+    """Returns {(column, row): (left, top, right, bottom)} covering the canvas in tile_size squares (clipped at the edges)."""
+    width, height = canvas_size
+    return {(column, row): (left, top, min(left + tile_size, width), min(top + tile_size, height))
+            for row, top in enumerate(range(0, height, tile_size))
+            for column, left in enumerate(range(0, width, tile_size))}
+
+def render_tile(box, background, sprite_source, sprite_box, fast=False):
+    """
+    Renders the background and sprite (not the text) inside box = (left, top, right, bottom)
+    of the canvas as an RGB image.
+    Args:
+        background: ('solid', rgb) or ('gradient', column), column being the 1-pixel-wide
+            gradient for the whole canvas height (see GradientCache.column).
+        sprite_source: The full-resolution RGBA sprite (already hue-shifted), or None.
+        sprite_box: (left, top, width, height) of the scaled sprite on the canvas.
+        fast: Cheaper resampling for live resize frames.
+    Only the source pixels under the tile are resampled (Image.resize's box), so a tile costs
+    its own area however large the canvas is, and neighbouring tiles line up seamlessly.
+    """
+    left, top, right, bottom = box
+    size = (right - left, bottom - top)
+    if background[0] == 'gradient':
+        tile = background[1].crop((0, top, 1, bottom)).resize(size, Image.NEAREST)
+    else:
+        tile = Image.new("RGB", size, background[1])
+
+    if sprite_source is not None:
+        sprite_left, sprite_top, sprite_width, sprite_height = sprite_box
+        x0, y0 = max(left, sprite_left), max(top, sprite_top)
+        x1, y1 = min(right, sprite_left + sprite_width), min(bottom, sprite_top + sprite_height)
+        if x0 < x1 and y0 < y1:
+            scale_x = sprite_source.width / sprite_width
+            scale_y = sprite_source.height / sprite_height
+            source_box = ((x0 - sprite_left) * scale_x, (y0 - sprite_top) * scale_y,
+                          (x1 - sprite_left) * scale_x, (y1 - sprite_top) * scale_y)
+            if fast:
+                piece = sprite_source.resize((x1 - x0, y1 - y0), Image.BILINEAR, box=source_box, reducing_gap=2.0)
+            else:
+                piece = sprite_source.resize((x1 - x0, y1 - y0), Image.LANCZOS, box=source_box)
+            tile.paste(piece, (x0 - left, y0 - top), piece)
+    return tile
+
+
+# --- Hue Cycle Animation ---
+HUE_CYCLE_RING_BUDGET_BYTES = 128 * 1024 * 1024 # Upper bound on memory held by precomputed animation frames
+HUE_CYCLE_FILL_AHEAD = 4 # Frames the render worker renders per request, so sprite renders never wait long behind it
+
+def hue_cycle_frame_count(period, fps, frame_size, budget_bytes=HUE_CYCLE_RING_BUDGET_BYTES):
+    """
+    Returns the number of frames in one hue cycle: period * fps, capped at the 256 distinct
+    hues PIL's HSV mode can represent and at what fits in budget_bytes (but at least 2).
+    """
+    width, height = frame_size
+    frame_bytes = max(1, width * height * 4) # Tk keeps photo images as 32-bit pixels
+    return max(2, min(round(period * fps), 256, budget_bytes // frame_bytes))
+
+def hue_cycle_index(started, period, frame_count):
+    """Returns the frame of a frame_count ring due now, for a cycle that began at perf_counter() time started."""
+    phase = ((time.perf_counter() - started) / period) % 1.0
+    return int(phase * frame_count)
+
+class HueCycleRing:
+    """
+    A bounded ring of hue-cycle frames (Tk PhotoImages) for one sprite size.
+    The render worker fills it ahead of the playhead (render), and the Tk thread only
+    turns finished frames into PhotoImages (store, frame), so after the first cycle each
+    animation tick just swaps a PhotoImage. With keep_frames=False (low-memory mode)
+    nothing is kept: only the next frame due is rendered ahead, and it is pasted into one
+    reused PhotoImage. Each frame applies the whole adjustment chain (see
+    color_adjustment) with the frame's hue in one pass.
+    """
+    def __init__(self, base_image, frame_count, start_offset=0.0, keep_frames=True, adjustment=None):
+        self.base_image = base_image # The scaled, unadjusted sprite
+        self.frame_count = frame_count
+        self.start_offset = start_offset
+        self.keep_frames = keep_frames
+        self.adjustment = adjustment # Everything but the hue, which each frame sets
+        self.first_index = None # The frame rendered along with the ring, shown first
+        self.first_image = None # Its PIL image, kept for the warm-start snapshot
+        self._frames = [None] * frame_count if keep_frames else []
+        self._rendered = {} # Index -> PIL frame from the worker, not yet a PhotoImage
+        self._photo = None # The single PhotoImage when frames aren't kept
+        self._photo_index = None # The frame it currently holds
+
+    def render(self, index):
+        """Render worker: frame index as a PIL image (it only reads the ring's immutable inputs)."""
+        return apply_color_adjustment(self.base_image,
+                                      with_hue_offset(self.adjustment, self.start_offset + 360.0 * index / self.frame_count))
+
+    def store(self, index, image):
+        """Tk thread (or the worker, before the ring is handed over): keeps a rendered frame until it is shown."""
+        self._rendered[index] = image
+        if self.first_index is None:
+            self.first_index = index
+            self.first_image = image
+
+    def missing(self, start, limit):
+        """Tk thread: up to limit frames from start on (wrapping) that are neither rendered nor shown yet."""
+        if not self.keep_frames:
+            if self._photo_index == start or start in self._rendered:
+                return []
+            self._rendered.clear() # Frames the playhead passed before they could be shown
+            return [start]
+        indices = []
+        for step in range(self.frame_count):
+            index = (start + step) % self.frame_count
+            if self._frames[index] is None and index not in self._rendered:
+                indices.append(index)
+                if len(indices) >= limit:
+                    break
+        return indices
+
+    def frame(self, index):
+        """Tk thread: returns the PhotoImage for frame index, or None if the worker hasn't rendered it yet."""
+        if not self.keep_frames:
+            if self._photo_index != index:
+                image = self._rendered.pop(index, None)
+                if image is None:
+                    return None
+                if self._photo is None:
+                    self._photo = ImageTk.PhotoImage(image)
+                else:
+                    self._photo.paste(image) # Same size every frame: Tk repaints its existing buffer
+                self._photo_index = index
+            return self._photo
+
+        photo = self._frames[index]
+        if photo is None:
+            image = self._rendered.pop(index, None)
+            if image is None:
+                return None
+            photo = ImageTk.PhotoImage(image)
+            self._frames[index] = photo
+        return photo
+
+
+# --- Scene Layout and Headless Rendering ---
+TK_POINTS_TO_PIXELS = 96 / 72 # Tk font sizes are in points; PIL fonts are sized in pixels
+HEADLESS_FONT_CANDIDATES = ("arialbd.ttf", "Arial Bold.ttf", "Helvetica-Bold.ttf",
+                            "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf")
+TEXT_FONT_FAMILY = "Helvetica"
+TEXT_MIN_FONT_SIZE = 8 # Points; text that doesn't fit even at this size overflows its box
+TEXT_BOX_DEFAULT = (0.1, 0.13, 0.8, 0.14) # Left, top, width, height as fractions of the scaled sprite
+HEADLESS_LINE_SPACING = 4 # Extra pixels between lines in PIL's multiline_text
+
+def compute_sprite_layout(source_size, canvas_size):
+    """
+    Returns (new_width, new_height, image_x, image_y) for the sprite scaled to 85%
+    of the largest size that fits the canvas, centered on it.
+    """
+    original_width, original_height = source_size
+    canvas_width, canvas_height = canvas_size
+
+    width_scale = canvas_width / original_width
+    height_scale = canvas_height / original_height
+    scale_factor = min(width_scale, height_scale) * 0.85 
+
+    new_width = int(original_width * scale_factor)
+    new_height = int(original_height * scale_factor)
+
+    if new_height < 1: new_height = 1
+    if new_width < 1: new_width = 1
+
+    return new_width, new_height, canvas_width / 2, canvas_height / 2
+
+def compute_text_box(new_width, new_height, image_x, image_y, text_box=TEXT_BOX_DEFAULT):
+    """
+    Returns (center_x, center_y, box_width, box_height) in canvas pixels of the box the display
+    text must fit, given as (left, top, width, height) fractions of the scaled sprite.
+    The width and height are whole pixels, so layouts can be memoized across resizes.
+    """
+    left, top, width, height = text_box
+    sprite_left = image_x - new_width / 2
+    sprite_top = image_y - new_height / 2
+
+    box_width = max(10, round(new_width * width))
+    box_height = max(10, round(new_height * height))
+    center_x = sprite_left + new_width * (left + width / 2)
+    center_y = sprite_top + new_height * (top + height / 2)
+    return center_x, center_y, box_width, box_height
+
+def parse_text_box(text_box_string):
+    """
+    Parses "left, top, width, height" (fractions of the sprite) into a tuple of floats.
+    Raises:
+        ValueError: If there aren't four numbers, or the box has no area or leaves the sprite.
+    """
+    try:
+        left, top, width, height = (float(part) for part in text_box_string.split(","))
+    except ValueError:
+        raise ValueError(f"text_box must be four comma-separated numbers (left, top, width, height), got '{text_box_string}'")
+    if width <= 0 or height <= 0 or left < 0 or top < 0 or left + width > 1 or top + height > 1:
+        raise ValueError(f"text_box must lie within the sprite (fractions from 0 to 1), got '{text_box_string}'")
+    return (left, top, width, height)
+
+@functools.lru_cache(maxsize=64)
+def load_render_font(font_size_points):
+    """Loads a bold sans-serif TrueType font close to Tk's "Helvetica bold" at the given point size."""
+    from PIL import ImageFont
+    size_pixels = max(1, round(font_size_points * TK_POINTS_TO_PIXELS))
+    for font_name in HEADLESS_FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(font_name, size_pixels)
+        except OSError:
+            continue
+    return ImageFont.load_default(size_pixels)
+
+def wrap_text(text, text_width, max_width):
+    """
+    Greedily wraps text on spaces so no line is wider than max_width pixels, like Tk's text 'width'.
+    text_width(string) returns the rendered width of a string in pixels.
+    """
+    lines = []
+    for paragraph in text.split('\n'):
+        line = ""
+        for word in paragraph.split(' '):
+            candidate = f"{line} {word}" if line else word
+            if line and text_width(candidate) > max_width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+class TextFitter:
+    """
+    Finds the largest font size at which the display text, wrapped to the box width, fits
+    the text box. Wrapped text only grows with the font size, so the size is found by
+    bisection over whole point sizes (about log2(box height) measurements) rather than
+    by trying every size. Measurements are memoized by (text, family, size, width) and
+    fits by (text, family, box size), so a resize back to a size seen before measures
+    nothing and a new size only measures the candidates its bisection hasn't seen.
+    Subclasses supply the font metrics: TkTextFitter for the window, PilTextFitter headless.
+    """
+    def __init__(self, family=TEXT_FONT_FAMILY, max_entries=4096):
+        self.family = family
+        self.max_entries = max_entries
+        self._measurements = {} # (text, family, size, width) -> (lines, block_width, block_height)
+        self._fits = {} # (text, family, box_width, box_height) -> (font_size, lines)
+        self.stats = {"measured": 0, "measure_hits": 0, "fit_hits": 0}
+
+    def _text_width(self, text, font_size):
+        """Rendered width of a single line in pixels."""
+        raise NotImplementedError
+
+    def _line_height(self, font_size):
+        """Distance between baselines of wrapped lines in pixels."""
+        raise NotImplementedError
+
+    def measure(self, text, font_size, width):
+        """Returns (lines, block_width, block_height) for text wrapped to width at font_size."""
+        key = (text, self.family, font_size, width)
+        measurement = self._measurements.get(key)
+        if measurement is not None:
+            self.stats["measure_hits"] += 1
+            return measurement
+
+        self.stats["measured"] += 1
+        lines = wrap_text(text, lambda line: self._text_width(line, font_size), width)
+        block_width = max(self._text_width(line, font_size) for line in lines)
+        measurement = (tuple(lines), block_width, len(lines) * self._line_height(font_size))
+        if len(self._measurements) >= self.max_entries:
+            self._measurements.clear()
+        self._measurements[key] = measurement
+        return measurement
+
+    def fit(self, text, box_width, box_height):
+        """Returns (font_size, lines): the largest size whose wrapped text fits the box (TEXT_MIN_FONT_SIZE at least)."""
+        key = (text, self.family, box_width, box_height)
+        fitted = self._fits.get(key)
+        if fitted is not None:
+            self.stats["fit_hits"] += 1
+            return fitted
+
+        def fits(font_size):
+            _, block_width, block_height = self.measure(text, font_size, box_width)
+            return block_width <= box_width and block_height <= box_height
+
+        low = TEXT_MIN_FONT_SIZE
+        high = max(low, box_height) # A font of N points is at least N pixels tall
+        if fits(low):
+            while low < high: # Invariant: low fits
+                middle = (low + high + 1) // 2
+                if fits(middle):
+                    low = middle
+                else:
+                    high = middle - 1
+
+        fitted = (low, self.measure(text, low, box_width)[0])
+        self.remember(text, box_width, box_height, *fitted)
+        return fitted
+
+    def remember(self, text, box_width, box_height, font_size, lines):
+        """Records a fit found earlier (e.g., by the run that saved the warm-start snapshot)."""
+        if len(self._fits) >= self.max_entries:
+            self._fits.clear()
+        self._fits[(text, self.family, box_width, box_height)] = (font_size, tuple(lines))
+
+class TkTextFitter(TextFitter):
+    """TextFitter measuring with Tk's font metrics (bold family), as the canvas draws the text."""
+    def __init__(self, root, family=TEXT_FONT_FAMILY):
+        super().__init__(family)
+        self.root = root
+        self._fonts = {} # Point size -> tkinter.font.Font
+
+    def _font(self, font_size):
+        font = self._fonts.get(font_size)
+        if font is None:
+            from tkinter import font as tkfont
+            font = tkfont.Font(root=self.root, family=self.family, size=font_size, weight="bold")
+            self._fonts[font_size] = font
+        return font
+
+    def _text_width(self, text, font_size):
+        return self._font(font_size).measure(text)
+
+    def _line_height(self, font_size):
+        return self._font(font_size).metrics("linespace")
+
+class PilTextFitter(TextFitter):
+    """TextFitter measuring with the TrueType font render_scene draws with."""
+    def _text_width(self, text, font_size):
+        return load_render_font(font_size).getlength(text)
+
+    def _line_height(self, font_size):
+        return load_render_font(font_size).getbbox("A")[3] + HEADLESS_LINE_SPACING # As multiline_text spaces lines
+
+_headless_text_fitter = None # Shared PilTextFitter, created on the first headless render
+
+def get_headless_text_fitter():
+    """Returns the process-wide PilTextFitter, so repeated headless renders reuse its measurements."""
+    global _headless_text_fitter
+    if _headless_text_fitter is None:
+        _headless_text_fitter = PilTextFitter()
+    return _headless_text_fitter
+
+def render_scene(source_image, settings, size, adjustment_cache=None, scaled_sprite=None):
+    """
+    Composites the Zoidberg scene (background, scaled sprite and wrapped text) without Tk,
+    using the same layout as ZoidbergApp._draw_content.
+    Args:
+        source_image: The full-resolution RGBA Zoidberg image.
+        settings: A ZoidbergSettings (or any object with the same display/background/color shift attributes).
+        size: The (width, height) of the output image.
+        adjustment_cache: Optional ColorAdjustmentCache over source_image, to reuse adjusted sprites across renders.
+        scaled_sprite: Optional source_image already scaled for size (per compute_sprite_layout). It is
+            color-adjusted after scaling, as the window's hue cycle does, which is far cheaper when many
+            offsets are rendered at one size.
+    Returns:
+        The composited RGBA PIL image.
+    """
+    width, height = size
+
+    # --- Background ---
+    if settings.background_type == 'gradient':
+        start_rgb = resolve_color(settings.gradient_start_color)
+        end_rgb = resolve_color(settings.gradient_end_color)
+        scene = build_gradient_column(height, start_rgb, end_rgb).resize((width, height), Image.NEAREST).convert("RGBA")
+    elif settings.background_type == 'solid':
+        scene = Image.new("RGBA", size, resolve_color(settings.background_color))
+    else:
+        scene = Image.new("RGBA", size, resolve_color('#F0F0F0'))
+
+    # --- Sprite ---
+    new_width, new_height, image_x, image_y = compute_sprite_layout(source_image.size, size)
+    adjustment = settings_color_adjustment(settings)
+    if scaled_sprite is not None:
+        scaled_sprite = apply_color_adjustment(scaled_sprite, adjustment)
+    else:
+        if adjustment_cache is not None:
+            sprite = adjustment_cache.get(adjustment)
+        else:
+            sprite = apply_color_adjustment(source_image, adjustment)
+        scaled_sprite = sprite.resize((new_width, new_height), Image.LANCZOS)
+    scene.alpha_composite(scaled_sprite, (int(image_x - new_width / 2), int(image_y - new_height / 2)))
+
+    # --- Text ---
+    if settings.display_text:
+        from PIL import ImageDraw
+        text_x, text_y, box_width, box_height = compute_text_box(new_width, new_height, image_x, image_y,
+                                                                 getattr(settings, "text_box", TEXT_BOX_DEFAULT))
+        font_size, lines = get_headless_text_fitter().fit(settings.display_text, box_width, box_height)
+        ImageDraw.Draw(scene).multiline_text((text_x, text_y), "\n".join(lines), font=load_render_font(font_size),
+                                            fill=resolve_color(settings.text_color),
+                                            anchor="mm", align="left", spacing=HEADLESS_LINE_SPACING)
+
+    return scene
+
+def get_zoidberg_image_path(application_base_path):
+    """Returns the path of the Zoidberg sprite relative to the application base path."""
+    return os.path.join(application_base_path, "Zoidberg", "Zoidberg Icon.png")
+
+def get_skin_image_path(application_base_path, skin):
+    """Returns the image path of skin, or of the built-in sprite if there is no such skin."""
+    skins = find_skins(application_base_path)
+    name = match_skin_name(skins, skin)
+    if name is None:
+        print(f"Warning: Unknown skin '{skin}', using '{DEFAULT_SKIN}'. Available: {', '.join(skins)}", file=sys.stderr)
+        name = DEFAULT_SKIN
+    return skins[name]
+
+def render_to_file(settings, output_path, size):
+    """
+    Renders the scene for settings at size and saves it to output_path (format from the extension).
+    Returns a process exit code (0 on success).
+    """
+    start_time = time.perf_counter()
+    try:
+        with Image.open(get_skin_image_path(settings.application_base_path, settings.skin)) as source:
+            source_image = source.convert("RGBA")
+        scene = render_scene(source_image, settings, size)
+        if os.path.splitext(output_path)[1].lower() in ('.jpg', '.jpeg', '.bmp'):
+            scene = scene.convert("RGB") # These formats have no alpha channel
+        scene.save(output_path)
+    except Exception as e:
+        print(f"ERROR: Failed to render '{output_path}': {e}", file=sys.stderr)
+        return 1
+
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    print(f"Rendered '{output_path}' ({size[0]}x{size[1]}) in {elapsed_ms:.1f} ms")
+    return 0
+
+
+# --- Batch Rendering ---
+# Per-process state for batch workers: each skin is decoded once per worker, not once per job.
+_batch_base_path = None
+_batch_skins = {} # Skin name -> (RGBA source image, ColorAdjustmentCache)
+
+def _init_batch_worker(application_base_path):
+    """Process pool initializer: skins are decoded lazily, the first time a job in this worker needs one."""
+    global _batch_base_path
+    _batch_base_path = application_base_path
+    _batch_skins.clear()
+
+def _get_batch_skin(skin):
+    """Returns (source image, ColorAdjustmentCache) of skin in this worker, decoding it on first use."""
+    entry = _batch_skins.get(skin)
+    if entry is None:
+        with Image.open(get_skin_image_path(_batch_base_path, skin)) as source:
+            source_image = source.convert("RGBA")
+        entry = _batch_skins[skin] = (source_image, ColorAdjustmentCache(source_image))
+    return entry
+
+def _render_batch_job(job):
+    """Renders one (settings, size, output_path) job in a worker and writes it to disk."""
+    settings, size, output_path = job
+    try:
+        source_image, adjustment_cache = _get_batch_skin(settings["skin"])
+        scene = render_scene(source_image, types.SimpleNamespace(**settings), size, adjustment_cache)
+        scene.save(output_path)
+    except Exception as e:
+        return output_path, str(e)
+    return output_path, None
+
+def build_batch_jobs(cli_args, cli_argv, output_dir):
+    """
+    Expands --configs x --hue-offsets x --texts x --sizes into render jobs.
+    Every config is resolved once here (including the other command-line overrides),
+    so workers only receive plain settings dicts.
+    Returns:
+        A list of (settings_dict, (width, height), output_path) tuples.
+    """
+    override_argv = cli_argv
+    if override_argv and override_argv[0].lower().endswith('.ini'):
+        override_argv = override_argv[1:] # --configs replaces a dropped .ini
+
+    config_files = cli_args.configs or [None] # None: the default config.ini (or the dropped one)
+    hue_offsets = cli_args.hue_offsets or [None]
+    texts = cli_args.texts or [None]
+    sizes = cli_args.sizes or [cli_args.size]
+
+    jobs = []
+    used_config_names = set()
+    for config_file in config_files:
+        if config_file is None:
+            settings = ZoidbergSettings(cli_argv)
+        else:
+            if not os.path.isfile(config_file):
+                print(f"Warning: Skipping missing config file '{config_file}'", file=sys.stderr)
+                continue
+            settings = ZoidbergSettings(override_argv, config_file=config_file)
+        settings.load()
+        config_name = base_name = os.path.splitext(os.path.basename(settings.config_file))[0]
+        suffix = 2
+        while config_name in used_config_names: # e.g., two different folders' config.ini
+            config_name = f"{base_name}{suffix}"
+            suffix += 1
+        used_config_names.add(config_name)
+
+        for hue_offset in hue_offsets:
+            for text_index, text in enumerate(texts):
+                job_settings = settings.resolved_settings()
+                name_parts = [config_name]
+                if hue_offset is not None:
+                    job_settings["color_shift_enabled"] = True
+                    job_settings["static_hue_offset"] = hue_offset
+                    name_parts.append(f"hue{hue_offset:g}")
+                if text is not None:
+                    job_settings["display_text"] = text
+                    name_parts.append(f"text{text_index}")
+                for width, height in sizes:
+                    file_name = "_".join(name_parts + [f"{width}x{height}"]) + ".png"
+                    jobs.append((job_settings, (width, height), os.path.join(output_dir, file_name)))
+    return jobs
+
+def run_batch(cli_args, cli_argv):
+    """
+    Renders every batch job across a process pool, streaming each image to the output
+    directory as soon as it is done, then reports throughput. Returns a process exit code.
+    """
+    output_dir = cli_args.batch
+    os.makedirs(output_dir, exist_ok=True)
+
+    jobs = build_batch_jobs(cli_args, cli_argv, output_dir)
+    if not jobs:
+        print("ERROR: Nothing to render.", file=sys.stderr)
+        return 1
+
+    import multiprocessing
+    workers = max(1, min(cli_args.workers or os.cpu_count() or 1, len(jobs)))
+
+    failures = 0
+    start_time = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_init_batch_worker, initargs=(get_application_base_path(),)) as pool:
+        for done, (output_path, error) in enumerate(pool.imap_unordered(_render_batch_job, jobs), start=1):
+            if error:
+                failures += 1
+                print(f"[{done}/{len(jobs)}] ERROR: '{output_path}': {error}", file=sys.stderr)
+            else:
+                print(f"[{done}/{len(jobs)}] {output_path}")
+    elapsed = time.perf_counter() - start_time
+
+    rendered = len(jobs) - failures
+    print(f"Rendered {rendered} image(s) in {elapsed:.2f} s ({rendered / elapsed:.1f} images/s) "
+          f"with {workers} worker(s); {failures} failed.")
+    return 1 if failures else 0
+
+
+# --- Animated Export ---
+ANIMATION_FORMATS = {".gif": "GIF", ".png": "APNG", ".apng": "APNG", ".webp": "WEBP"}
+ANIMATION_PALETTE_SAMPLES = 8 # Evenly spaced frames quantized together into the shared palette
+ANIMATION_PALETTE_SAMPLE_SIDE = 256 # Longest side of those sample renders
+ANIMATION_FRAMES_IN_FLIGHT = 2 # Per worker: bounds memory however many frames the animation has
+_animation_sprites = {} # Per worker: (skin, size) -> the sprite scaled once for that output size
+
+def _render_animation_frame(job):
+    """
+    Renders one frame in a worker. Returns the frame's raw RGB bytes if palette is None,
+    otherwise the frame quantized to the shared palette and already compressed for
+    frame_format (GIF image data or the zlib stream of an APNG frame), so the
+    encoding runs in parallel too and the main process only writes bytes.
+    """
+    settings, size, frame_format, palette, duration_ms = job
+    source_image, _ = _get_batch_skin(settings["skin"])
+    scaled_sprite = _animation_sprites.get((settings["skin"], size))
+    if scaled_sprite is None:
+        if len(_animation_sprites) >= 8:
+            _animation_sprites.clear()
+        new_width, new_height, _, _ = compute_sprite_layout(source_image.size, size)
+        scaled_sprite = _animation_sprites[(settings["skin"], size)] = source_image.resize((new_width, new_height), Image.LANCZOS)
+    frame = render_scene(source_image, types.SimpleNamespace(**settings), size, scaled_sprite=scaled_sprite).convert("RGB")
+    if palette is None:
+        return frame.tobytes()
+
+    palette_image = Image.new("P", (1, 1))
+    palette_image.putpalette(palette)
+    frame = frame.quantize(palette=palette_image, dither=Image.Dither.FLOYDSTEINBERG)
+
+    import io
+    buffer = io.BytesIO()
+    if frame_format == "GIF":
+        frame.save(buffer, "GIF", duration=duration_ms, optimize=False) # optimize would renumber the shared palette
+        data = buffer.getvalue()
+        flags = data[10]
+        header_length = 13 + (3 << ((flags & 0x07) + 1) if flags & 0x80 else 0) # Skip its own global color table
+        return data[header_length:-1] # Graphic control extension and image data, without the trailer
+
+    frame.save(buffer, "PNG", bits=8)
+    data = buffer.getvalue()
+    image_data, position = [], 8 # Skip the PNG signature
+    while position < len(data):
+        length, chunk_type = struct.unpack_from(">I4s", data, position)
+        if chunk_type == b"IDAT":
+            image_data.append(data[position + 8:position + 8 + length])
+        position += 12 + length # Length, type, data, CRC
+    return b"".join(image_data)
+
+def _bounded_imap(pool, func, items, max_in_flight):
+    """Like pool.imap (results in order), but with at most max_in_flight items submitted and not yet consumed."""
+    pending = collections.deque()
+    for item in items:
+        pending.append(pool.apply_async(func, (item,)))
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+def build_animation_palette(samples):
+    """Returns the 256-color palette (a flat RGB list) that best covers the sample RGB frames together."""
+    mosaic = Image.new("RGB", (sum(sample.width for sample in samples), max(sample.height for sample in samples)))
+    x = 0
+    for sample in samples:
+        mosaic.paste(sample, (x, 0))
+        x += sample.width
+    return mosaic.quantize(256, method=Image.Quantize.MEDIANCUT).getpalette()
+
+def _write_gif(fp, frames, size, palette, frame_count, duration_ms):
+    """Writes GIF frame data (from _render_animation_frame) behind one global color table, looping forever."""
+    width, height = size
+    fp.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0xF7, 0, 0)) # Global color table of 256 entries
+    fp.write(bytes(palette).ljust(768, b"\0"))
+    fp.write(b"!\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", 0) + b"\0") # Loop count 0: forever
+    for frame_data in frames:
+        fp.write(frame_data)
+    fp.write(b";")
+
+def _write_apng(fp, frames, size, palette, frame_count, duration_ms):
+    """Writes APNG frames (zlib streams from _render_animation_frame) sharing one PLTE, looping forever."""
+    import zlib
+
+    def write_chunk(chunk_type, data):
+        fp.write(struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data)))
+
+    width, height = size
+    fp.write(b"\x89PNG\r\n\x1a\n")
+    write_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)) # 8-bit palette image
+    write_chunk(b"acTL", struct.pack(">II", frame_count, 0)) # 0 plays: loop forever
+    write_chunk(b"PLTE", bytes(palette))
+    sequence = 0
+    for index, frame_data in enumerate(frames):
+        write_chunk(b"fcTL", struct.pack(">IIIIIHHBB", sequence, width, height, 0, 0, round(duration_ms), 1000, 0, 0))
+        sequence += 1
+        if index == 0:
+            write_chunk(b"IDAT", frame_data) # The first frame doubles as the still image
+        else:
+            write_chunk(b"fdAT", struct.pack(">I", sequence) + frame_data)
+            sequence += 1
+    write_chunk(b"IEND", b"")
+
+def _streamed_frames(frames, size, frame_count):
+    """
+    Returns an RGB image with n_frames frame_count whose seek pastes in the next raw RGB
+    frame from frames. Pillow's multi-frame writers seek through n_frames in order, so
+    the frames never all sit in memory at once (append_images would be listed up front).
+    """
+    image = Image.new("RGB", size)
+    position = [-1]
+
+    def seek(index):
+        if index <= position[0]:
+            return # The encoder seeks back to the start once it is done; there is nothing to rewind
+        if index != position[0] + 1:
+            raise EOFError("streamed frames can only be read in order")
+        image.paste(Image.frombytes("RGB", size, next(frames)))
+        position[0] = index
+
+    image.n_frames = frame_count
+    image.seek = seek
+    image.tell = lambda: max(position[0], 0)
+    seek(0)
+    return image
+
+def _write_webp(fp, frames, size, palette, frame_count, duration_ms):
+    """Feeds raw RGB frames to Pillow's animated WebP encoder one at a time."""
+    _streamed_frames(frames, size, frame_count).save(fp, "WEBP", save_all=True, duration=round(duration_ms),
+                                                      loop=0, quality=90, method=4)
+
+ANIMATION_WRITERS = {"GIF": _write_gif, "APNG": _write_apng, "WEBP": _write_webp}
+
+def export_animation(pool, workers, settings, size, output_path, frame_count):
+    """
+    Renders one hue cycle (frame_count frames, starting from the static hue offset if color
+    shift is enabled, as the window's animation does) at size across pool and streams the
+    frames in order into output_path. A loop lasts hue_cycle_period seconds. Returns
+    (seconds, bytes of raw frames encoded).
+    """
+    frame_format = ANIMATION_FORMATS[os.path.splitext(output_path)[1].lower()]
+    duration_ms = settings.hue_cycle_period * 1000 / frame_count
+    start_offset = settings.static_hue_offset if settings.color_shift_enabled else 0.0
+    base_settings = settings.resolved_settings()
+
+    def frame_settings(index):
+        return dict(base_settings, color_shift_enabled=True,
+                    static_hue_offset=(start_offset + 360.0 * index / frame_count) % 360)
+
+    start_time = time.perf_counter()
+    palette = None
+    if frame_format != "WEBP": # WebP is true color; GIF and APNG frames share one palette (no flicker, one table)
+        scale = min(1.0, ANIMATION_PALETTE_SAMPLE_SIDE / max(size))
+        sample_size = (max(1, round(size[0] * scale)), max(1, round(size[1] * scale)))
+        sample_step = max(1, frame_count // ANIMATION_PALETTE_SAMPLES)
+        samples = pool.map(_render_animation_frame, [(frame_settings(index), sample_size, "RGB", None, 0)
+                                                     for index in range(0, frame_count, sample_step)])
+        palette = build_animation_palette([Image.frombytes("RGB", sample_size, data) for data in samples])
+
+    jobs = ((frame_settings(index), size, frame_format, palette, round(duration_ms)) for index in range(frame_count))
+    frames = _bounded_imap(pool, _render_animation_frame, jobs, workers * ANIMATION_FRAMES_IN_FLIGHT)
+    with open(output_path, "wb") as f:
+        ANIMATION_WRITERS[frame_format](f, frames, size, palette, frame_count, duration_ms)
+    return time.perf_counter() - start_time, frame_count * size[0] * size[1] * 3
+
+def run_animation(cli_args, cli_argv):
+    """
+    Exports the hue cycle as an animated GIF, APNG or WebP (from the --animate extension),
+    once per --sizes entry, and reports encode throughput. Returns a process exit code.
+    """
+    output_path = cli_args.animate
+    base, extension = os.path.splitext(output_path)
+    if extension.lower() not in ANIMATION_FORMATS:
+        print(f"ERROR: Unsupported animation format '{extension}' (use .gif, .png, .apng or .webp).", file=sys.stderr)
+        return 1
+
+    settings = ZoidbergSettings(cli_argv)
+    settings.load()
+    frame_count = cli_args.frames or hue_cycle_frame_count(settings.hue_cycle_period, settings.hue_cycle_fps, (1, 1))
+    frame_count = max(2, frame_count)
+    sizes = cli_args.sizes or [cli_args.size]
+
+    import multiprocessing
+    workers = max(1, min(cli_args.workers or os.cpu_count() or 1, frame_count))
+    failures = 0
+    with multiprocessing.Pool(workers, initializer=_init_batch_worker, initargs=(get_application_base_path(),)) as pool:
+        for width, height in sizes:
+            path = output_path if len(sizes) == 1 else f"{base}_{width}x{height}{extension}"
             try:
-                mixer.init()
+                elapsed, raw_bytes = export_animation(pool, workers, settings, (width, height), path, frame_count)
             except Exception as e:
-                print(f"Warning: Could not initialize pygame mixer: {e}")
-                self.sound_enabled = False # Disable sound if mixer fails to init
+                failures += 1
+                print(f"ERROR: Failed to export '{path}': {e}", file=sys.stderr)
+                continue
+            print(f"Wrote '{path}' ({width}x{height}, {frame_count} frames, {os.path.getsize(path) / 1024:.0f} KB) "
+                  f"in {elapsed:.2f} s: {frame_count / elapsed:.1f} frames/s, "
+                  f"{raw_bytes / elapsed / (1024 * 1024):.1f} MB/s of frames encoded with {workers} worker(s)")
+    return 1 if failures else 0
 
-        # Play launch sound if enabled
-        if self.sound_enabled:
-            sound_path = os.path.join(self.application_base_path, "Zoidberg", "Sounds", self.launch_sound_filename)
-            self._play_sound(sound_path)
-        
-        # No more animation loop to start here. Static shift is applied on draw.
 
+# --- Sound ---
+SOUND_EVENTS = ("click", "resize", "reload") # [Sounds] options; the launch sound is [Settings] launch_sound
+SOUND_CHANNELS = 8 # Mixer channels reserved for effects; a further overlapping sound steals the oldest
+SOUND_BUFFER_SAMPLES = 512 # Mixer buffer size: ~12 ms of output latency at 44.1 kHz
+SOUND_STREAM_MIN_PCM_BYTES = 4 * 1024 * 1024 # Sounds that decode to more than this (~24 s of 44.1 kHz stereo) are streamed
+SOUND_UNKNOWN_COMPRESSION_RATIO = 11 # Assumed for files whose length can't be read: 128 kbps vs. 1411 kbps CD audio
+SOUND_LATENCY_SAMPLES = 256 # Trigger-to-playback latencies kept for the --perf report
+_STREAM = object() # _get_sound result for files played through mixer.music
 
-    def _on_closing(self):
-        """Handler for window closing event to properly quit pygame mixer."""
-        if self.sound_enabled:
-            if mixer.get_init():
-                mixer.quit()
-        
-        # No color_shift_job to cancel here anymore.
+# MPEG audio frame header tables, indexed by the header's bit fields
+_MP3_BITRATES_KBPS = { # (MPEG-1?, layer) -> bitrate index -> kbps
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)} # By version bits
+
+def _mp3_duration(f, file_size):
+    """Seconds of MPEG audio from the first frame: its Xing/Info or VBRI frame count, else the CBR bitrate."""
+    header = f.read(10)
+    start = 0
+    if header[:3] == b"ID3": # Skip the ID3v2 tag (cover art can make it most of the file)
+        start = 10 + ((header[6] & 0x7F) << 21 | (header[7] & 0x7F) << 14 | (header[8] & 0x7F) << 7 | (header[9] & 0x7F))
+    f.seek(start)
+    data = f.read(64 * 1024)
+    for offset in range(len(data) - 4):
+        b1, b2, b3 = data[offset + 1], data[offset + 2], data[offset + 3]
+        version, layer = (b1 >> 3) & 3, 4 - ((b1 >> 1) & 3)
+        if data[offset] != 0xFF or (b1 & 0xE0) != 0xE0 or version == 1 or layer == 4 or b2 >> 4 in (0, 15) or (b2 >> 2) & 3 == 3:
+            continue
+        mpeg1 = version == 3
+        bitrate = _MP3_BITRATES_KBPS[(mpeg1, layer)][b2 >> 4] * 1000
+        sample_rate = _MP3_SAMPLE_RATES[version][(b2 >> 2) & 3]
+        samples_per_frame = 384 if layer == 1 else 1152 if mpeg1 or layer == 2 else 576
+        mono = b3 >> 6 == 3
+        xing = offset + 4 + ((17 if mono else 32) if mpeg1 else (9 if mono else 17))
+        if data[xing:xing + 4] in (b"Xing", b"Info") and data[xing + 7] & 1:
+            return struct.unpack_from(">I", data, xing + 8)[0] * samples_per_frame / sample_rate
+        if data[offset + 36:offset + 40] == b"VBRI":
+            return struct.unpack_from(">I", data, offset + 50)[0] * samples_per_frame / sample_rate
+        return (file_size - start - offset) * 8 / bitrate
+    return None
+
+def _ogg_duration(f, file_size):
+    """Seconds of Ogg Vorbis or Opus audio: the last page's granule position over the sample rate."""
+    head = f.read(4096)
+    if head.find(b"\x01vorbis") >= 0:
+        sample_rate = struct.unpack_from("<I", head, head.find(b"\x01vorbis") + 12)[0]
+    elif head.find(b"OpusHead") >= 0:
+        sample_rate = 48000 # Opus granule positions always count 48 kHz samples
+    else:
+        return None
+    f.seek(max(0, file_size - 64 * 1024))
+    tail = f.read()
+    page = tail.rfind(b"OggS")
+    if page < 0 or page + 14 > len(tail) or not sample_rate:
+        return None
+    return struct.unpack_from("<q", tail, page + 6)[0] / sample_rate
+
+def estimate_sound_duration(path):
+    """
+    Returns how many seconds a sound file plays, read from its headers without decoding it
+    (WAV, FLAC, MP3, Ogg Vorbis/Opus), or None for other or unreadable files.
+    """
+    try:
+        file_size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            magic = f.read(12)
+            f.seek(0)
+            if magic[:4] == b"RIFF" and magic[8:12] == b"WAVE":
+                import wave
+                with wave.open(f) as wav:
+                    return wav.getnframes() / wav.getframerate()
+            if magic[:4] == b"fLaC": # STREAMINFO: 20-bit sample rate, then 36-bit total samples
+                f.seek(18)
+                info = int.from_bytes(f.read(8), "big")
+                sample_rate, total_samples = info >> 44, info & 0xFFFFFFFFF
+                return total_samples / sample_rate if sample_rate and total_samples else None
+            if magic[:4] == b"OggS":
+                return _ogg_duration(f, file_size)
+            return _mp3_duration(f, file_size)
+    except (OSError, EOFError, struct.error, IndexError, ValueError, ZeroDivisionError):
+        return None
+
+class SoundPlayer:
+    """
+    Plays sounds from one long-lived worker thread that owns pygame.mixer.
+    The mixer is only initialized when the first sound is actually loaded, with a small
+    buffer for low latency. Sounds are decoded once and cached by filename, and play on a
+    fixed pool of SOUND_CHANNELS reserved channels: a trigger takes an idle channel, or
+    steals the one whose sound started longest ago, so overlapping triggers never wait for
+    or cut off each other. Only long tracks, whose decoded PCM would exceed
+    SOUND_STREAM_MIN_PCM_BYTES (estimated from the file's headers, see
+    estimate_sound_duration), are streamed through mixer.music instead; pygame has a
+    single music stream, so those are exclusive: playing one restarts it, and playing
+    another long track stops it.
+    Requests are queued, so preload() can decode in the background (e.g., while the
+    sprite loads) and a later play() of the same file starts without another decode.
+    Every play records its trigger-to-playback latency.
+    """
+    def __init__(self, sounds_dir):
+        self.sounds_dir = sounds_dir
+        self.available = True # False once the mixer has failed to initialize
+        self.timings = {} # Phase name -> seconds, for --startup-profile (written by the worker thread)
+        self.counters = {"played": 0, "streamed": 0, "stolen": 0}
+        self.latencies = collections.deque(maxlen=SOUND_LATENCY_SAMPLES) # Seconds from play() to playback start
+        self.output_latency = None # Seconds of audio in the mixer buffer, known once the mixer is up
+        self._mixer = None # pygame.mixer, imported on the worker thread on first use
+        self._sounds = {} # filename -> decoded mixer.Sound or _STREAM (only touched by the worker thread)
+        self._channels = [] # The reserved mixer.Channel pool
+        self._voice_started = [] # perf_counter when each pooled channel last started a sound
+        self._stream_loaded = None # Filename currently loaded into mixer.music
+        self._requests = queue.Queue()
+        self._worker = None
+
+    def preload(self, filename):
+        """Decodes filename (or opens its stream) in the background without playing it."""
+        self._submit("load", filename)
 
-        self.master.destroy()
+    def play(self, filename):
+        """Plays filename, decoding it first if it is not cached yet."""
+        self._submit("play", filename)
 
+    def stats(self):
+        """Playback counters and trigger-to-playback latency in ms (mean, 95th percentile, max)."""
+        stats = dict(self.counters)
+        latencies = sorted(self.latencies)
+        if latencies:
+            stats["latency_mean_ms"] = round(sum(latencies) / len(latencies) * 1000, 2)
+            stats["latency_p95_ms"] = round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 2)
+            stats["latency_max_ms"] = round(latencies[-1] * 1000, 2)
+        if self.output_latency is not None:
+            stats["output_buffer_ms"] = round(self.output_latency * 1000, 2) # Added by the audio device
+        return stats
 
-    def _play_sound(self, sound_file_path):
-        """Plays a sound file in a separate thread using pygame.mixer. (Basic implementation)"""
-        # Ensure mixer is initialized before trying to play sound
-        if not self.sound_enabled or not mixer.get_init():
+    def shutdown(self):
+        """Stops the worker thread and quits the mixer if it was initialized."""
+        if self._worker is not None:
+            self._requests.put(None)
+            self._worker.join(timeout=1.0)
+            self._worker = None
+
+    def _submit(self, action, filename):
+        if not self.available:
             return
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="SoundPlayer", daemon=True)
+            self._worker.start()
+        self._requests.put((action, filename, time.perf_counter()))
+
+    def _run(self):
+        """Worker loop: decodes and plays queued requests until shutdown() sends None."""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                break
+            action, filename, requested_at = request
+            sound = self._get_sound(filename)
+            if sound is None:
+                continue
+            try:
+                if sound is _STREAM:
+                    if action == "play":
+                        self._load_stream(filename) # Stops another long track that is playing
+                        self._mixer.music.play() # Restarts the stream if it was already playing
+                        self.counters["streamed"] += 1
+                    elif not self._mixer.music.get_busy(): # Opening it early must not cut off a playing stream
+                        self._load_stream(filename)
+                elif action == "play":
+                    self._channels[self._pick_channel()].play(sound)
+                else:
+                    continue
+            except Exception as e:
+                print(f"Error playing sound '{filename}': {e}")
+                continue
+            if action == "play":
+                self.latencies.append(time.perf_counter() - requested_at)
+                self.counters["played"] += 1
+
+        if self._mixer is not None and self._mixer.get_init():
+            self._mixer.quit()
+
+    def _pick_channel(self):
+        """Returns the index of an idle pooled channel, or else of the one playing the oldest sound."""
+        now = time.perf_counter()
+        for index, channel in enumerate(self._channels):
+            if not channel.get_busy():
+                break
+        else:
+            index = min(range(len(self._channels)), key=self._voice_started.__getitem__)
+            self.counters["stolen"] += 1
+        self._voice_started[index] = now
+        return index
+
+    def _load_stream(self, filename):
+        """Opens filename in mixer.music, unless it is already the loaded stream."""
+        if self._stream_loaded != filename:
+            start = time.perf_counter()
+            self._mixer.music.load(os.path.join(self.sounds_dir, filename))
+            self._stream_loaded = filename
+            self.timings.setdefault(f"decode: {filename} (streamed)", time.perf_counter() - start)
+
+    def _init_mixer(self):
+        """Imports and initializes pygame.mixer and reserves the channel pool. Returns False on failure."""
+        try:
+            start = time.perf_counter()
+            import pygame.mixer as mixer # Deferred: importing pygame is the slowest part of startup
+            self.timings["mixer_import"] = time.perf_counter() - start
+            start = time.perf_counter()
+            mixer.init(buffer=SOUND_BUFFER_SAMPLES)
+            mixer.set_num_channels(SOUND_CHANNELS)
+            mixer.set_reserved(SOUND_CHANNELS) # Sound.play() elsewhere can't take these channels
+            self.timings["mixer_init"] = time.perf_counter() - start
+        except Exception as e:
+            print(f"Warning: Could not initialize pygame mixer: {e}")
+            self.available = False
+            return False
+        self._mixer = mixer
+        self._channels = [mixer.Channel(index) for index in range(SOUND_CHANNELS)]
+        self._voice_started = [0.0] * SOUND_CHANNELS
+        frequency = mixer.get_init()[0]
+        self.output_latency = SOUND_BUFFER_SAMPLES / frequency if frequency else None
+        return True
+
+    def _estimated_pcm_bytes(self, path):
+        """How much memory decoding path would take in the mixer's sample format, estimated from its headers."""
+        frequency, sample_format, channels = self._mixer.get_init()
+        seconds = estimate_sound_duration(path)
+        if seconds is None:
+            return os.path.getsize(path) * SOUND_UNKNOWN_COMPRESSION_RATIO
+        return int(seconds * frequency) * channels * (abs(sample_format) // 8)
+
+    def _get_sound(self, filename):
+        """Returns the decoded sound for filename (or _STREAM), initializing the mixer on first use."""
+        if filename in self._sounds:
+            return self._sounds[filename]
 
-        print(f"DEBUG: Attempting to load and play sound from: '{sound_file_path}'")
+        if (self._mixer is None or not self._mixer.get_init()) and not self._init_mixer():
+            return None
 
+        sound_file_path = os.path.join(self.sounds_dir, filename)
         if not os.path.exists(sound_file_path):
             print(f"Warning: Sound file not found at '{sound_file_path}'")
-            return
-        
-        # Define the threaded function that loads and plays the sound
-        def play_threaded_sound():
+            sound = None
+        elif self._estimated_pcm_bytes(sound_file_path) > SOUND_STREAM_MIN_PCM_BYTES:
+            sound = _STREAM # Long track: streamed by mixer.music as it plays, never decoded whole
+        else:
             try:
-                sound = mixer.Sound(sound_file_path) # Load the sound
-                sound.play() # Play the sound
+                start = time.perf_counter()
+                sound = self._mixer.Sound(sound_file_path) # Decoded once, then reused
+                self.timings[f"decode: {filename}"] = time.perf_counter() - start
             except Exception as e:
-                print(f"Error playing sound '{sound_file_path}': {e}")
+                print(f"Error loading sound '{sound_file_path}': {e}")
+                sound = None
+        self._sounds[filename] = sound # Failures are cached too, so they are only reported once
+        return sound
+
+
+# --- Single Instance (running side) ---
+INSTANCE_POLL_INTERVAL_MS = 100 # How often the Tk thread checks for windows forwarded by later launches
+INSTANCE_MESSAGE_MAX_BYTES = 64 * 1024
+
+def check_forwarded_argv(argv):
+    """
+    Parses a forwarded argv the way ZoidbergSettings will and returns the reply for the
+    launching process: b"ok" if a window can open here, b"local" if argv sets a local-only
+    flag (abbreviations like --rend included, which the launching side's exact match misses)
+    or asks for --help, or b"error\0" and the usage and error text argparse would have printed.
+    """
+    if argv and argv[0].lower().endswith(".ini") and os.path.isfile(argv[0]):
+        argv = argv[1:] # A dropped .ini, read by _load_config
+    parser = build_arg_parser()
+    class HelpRequested(Exception):
+        pass
+    def reject(message):
+        raise ValueError(f"{parser.format_usage()}{parser.prog}: error: {message}\n")
+    def leave(status=0, message=None):
+        raise HelpRequested()
+    # argparse would print and exit this process instead
+    parser.error = reject
+    parser.print_help = lambda file=None: None
+    parser.exit = leave
+    try:
+        namespace = parser.parse_args(argv)
+    except ValueError as e:
+        return b"error\0" + str(e).encode("utf-8")
+    except HelpRequested:
+        return b"local"
+    for flag in LOCAL_ONLY_FLAGS:
+        dest = flag.lstrip("-").replace("-", "_")
+        if hasattr(namespace, dest) and getattr(namespace, dest) != parser.get_default(dest):
+            return b"local"
+    return b"ok"
+
+class InstanceServer:
+    """
+    Accepts argv forwarded by later launches (see forward_to_running_instance) on a loopback
+    socket. The port and a random token go into the per-user address file; a launch that
+    can't present the token is ignored. A daemon thread accepts connections and queues each
+    argv, and the Tk thread picks them up with after(), since Tk is not thread-safe.
+    """
+    def __init__(self, address_file=None):
+        import socket
+        self.requests = queue.Queue() # Forwarded argv lists, for the Tk thread
+        self._token = os.urandom(16).hex()
+        self._socket = socket.create_server(("127.0.0.1", 0))
+        try:
+            self.address_file = address_file or get_instance_address_file()
+            # Written under a fresh name, never following a planted link, then renamed over the old file
+            temporary_file = f"{self.address_file}.{os.getpid()}"
+            try:
+                os.remove(temporary_file) # Left behind by a crashed process that had the same pid
+            except FileNotFoundError:
+                pass
+            fd = os.open(temporary_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0),
+                         0o600) # Only this user may read the token
+            with os.fdopen(fd, "w") as f:
+                f.write(f"{self._socket.getsockname()[1]} {self._token}\n")
+            os.replace(temporary_file, self.address_file)
+        except OSError:
+            self._socket.close()
+            raise
+        threading.Thread(target=self._serve, name="Zoidberg instance server", daemon=True).start()
+
+    def _serve(self):
+        """Accept loop (daemon thread)."""
+        while True:
+            try:
+                connection, _ = self._socket.accept()
+            except OSError: # Closed by close()
+                return
+            with connection:
+                try:
+                    connection.settimeout(2.0)
+                    argv = self._receive(connection)
+                    if argv is None:
+                        continue
+                    reply = check_forwarded_argv(argv)
+                    if reply == b"ok":
+                        self.requests.put(argv)
+                    connection.sendall(reply)
+                except OSError:
+                    pass
+
+    def _receive(self, connection):
+        """Reads one token + argv message; returns the argv, or None if it is oversized or the token is wrong."""
+        import hmac
+        data = b""
+        while len(data) <= INSTANCE_MESSAGE_MAX_BYTES:
+            chunk = connection.recv(INSTANCE_MESSAGE_MAX_BYTES)
+            if not chunk:
+                token, *argv = data.decode("utf-8", "replace").split("\0")
+                return argv if hmac.compare_digest(token, self._token) else None
+            data += chunk
+        return None
+
+    def close(self):
+        """Stops accepting launches and removes the address file, unless a newer instance has replaced it."""
+        self._socket.close()
+        try:
+            with open(self.address_file) as f:
+                ours = f.read().split()[1:] == [self._token]
+            if ours:
+                os.remove(self.address_file)
+        except (OSError, IndexError):
+            pass
+
+class SharedResources:
+    """
+    Process-wide state shared by every Zoidberg window: in single-instance mode later launches
+    open extra windows in this process, which reuse the decoded skins, the transform caches
+    and the sound worker (and its mixer) instead of loading their own.
+    """
+    def __init__(self):
+        self.sound_player = None
+        self.skin_library = None # Decoded skins and their transforms, shared by every window
+        self.instance_server = None
+        self.render_executor = None # One background worker for every window's image transforms
+        self.tile_executor = None # Workers for tiled rendering (see render_tile)
+        self.windows = [] # Open ZoidbergApp windows; the process exits when the last one closes
+
+    def get_render_executor(self):
+        """Returns the process-wide render worker, starting it on first use."""
+        if self.render_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            # A single worker: builds run one at a time, in order. The shared sprite caches are locked,
+            # since the first window builds its first frame on the Tk thread before handing off to it.
+            self.render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Zoidberg render")
+        return self.render_executor
+
+    def get_tile_executor(self):
+        """Returns the process-wide tile workers, starting them on first use (PIL releases the GIL while resampling)."""
+        if self.tile_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.tile_executor = ThreadPoolExecutor(max_workers=TILE_WORKERS, thread_name_prefix="Zoidberg tile")
+        return self.tile_executor
+
+    def start_instance_server(self, root):
+        """Starts listening for later launches and opens a window for each one they forward."""
+        try:
+            self.instance_server = InstanceServer()
+        except OSError as e:
+            print(f"Warning: Could not start the single-instance server: {e}")
+            return
+        root.after(INSTANCE_POLL_INTERVAL_MS, self._open_forwarded_windows, root)
+
+    def _open_forwarded_windows(self, root):
+        """Opens a Toplevel for every argv forwarded since the last poll (Tk thread)."""
+        try:
+            while True:
+                try:
+                    argv = self.instance_server.requests.get_nowait()
+                except queue.Empty:
+                    break
+                window = tk.Toplevel(root)
+                try:
+                    ZoidbergApp(window, argv=argv, shared=self)
+                except (Exception, SystemExit) as e: # E.g., a forwarded .ini with an unparsable value
+                    window.destroy()
+                    print(f"Warning: Could not open a window for forwarded launch {argv}: {e!r}")
+        finally:
+            # One bad launch must not stop the windows of later ones from opening
+            root.after(INSTANCE_POLL_INTERVAL_MS, self._open_forwarded_windows, root)
+
+    def shutdown(self):
+        """Releases the process-wide resources once the last window has closed."""
+        if self.instance_server is not None:
+            self.instance_server.close()
+            self.instance_server = None
+        if self.sound_player is not None:
+            self.sound_player.shutdown() # Also quits the mixer if it was ever initialized
+        if self.render_executor is not None:
+            self.render_executor.shutdown(wait=False, cancel_futures=True)
+        if self.tile_executor is not None:
+            self.tile_executor.shutdown(wait=False, cancel_futures=True)
+
+
+# --- Settings ---
+RENDER_SETTING_FIELDS = ("display_text", "text_color", "background_type", "background_color",
+                         "gradient_start_color", "gradient_end_color",
+                         "color_shift_enabled", "static_hue_offset", "saturation", "brightness", "contrast",
+                         "gamma", "tint", "tint_strength", "text_box", "skin")
+CONFIG_POLL_INTERVAL_MS = 1000 # How often the running app checks its .ini for edits
+
+def get_application_base_path():
+    """Returns the folder holding config.ini and the Zoidberg/ assets."""
+    if getattr(sys, 'frozen', False):
+        # Running from a PyInstaller executable
+        return os.path.dirname(sys.executable)
+    # Running as a .py script
+    return os.path.dirname(os.path.abspath(__file__))
+
+def parse_size(size_string):
+    """Parses a 'WIDTHxHEIGHT' string (e.g., '500x550') into a (width, height) tuple for argparse."""
+    import argparse
+    try:
+        width, height = (int(part) for part in size_string.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size '{size_string}', expected WIDTHxHEIGHT (e.g., 500x550)")
+    if width < 1 or height < 1:
+        raise argparse.ArgumentTypeError(f"invalid size '{size_string}', width and height must be positive")
+    return (width, height)
+
+def build_arg_parser():
+    """Builds the command-line parser shared by the window and headless modes."""
+    import argparse
+    # Standard argument parsing for normal launches or launches with additional args
+    parser = argparse.ArgumentParser(
+        description="Launch Zoidberg application with custom settings."
+    )
+
+    parser.add_argument(
+        "-t", "--text",
+        type=str,
+        help="Set the display text for Zoidberg."
+    )
+
+    parser.add_argument(
+        "-bg", "--background-color",
+        type=str,
+        help="Set the single background color (e.g., 'red', '#RRGGBB')."
+    )
+
+    parser.add_argument(
+        "-bgg1", "--gradient-color1",
+        type=str,
+        help="Set the first gradient color."
+    )
+
+    parser.add_argument(
+        "-bgg2", "--gradient-color2",
+        type=str,
+        help="Set the second gradient color."
+    )
+
+    parser.add_argument(
+        "-tc", "--text-color",
+        type=str,
+        help="Set the color of the display text (e.g., 'white', '#RRGGBB')."
+    )
+
+    # Argument for sound
+    parser.add_argument(
+        "-s", "--enable-sound",
+        action="store_true", # This makes it a boolean flag (true if present)
+        help="Enable sound effects (e.g., launch sound)."
+    )
+    parser.add_argument(
+        "-sk", "--skin",
+        type=str,
+        help=f"Sprite skin to show: '{DEFAULT_SKIN}' or the name of an image in Zoidberg/Skins/ (without extension)."
+    )
+    parser.add_argument(
+        "-ls", "--launch-sound",
+        type=str,
+        help="Specify a custom launch sound filename (e.g., 'custom.wav'). Must be in Zoidberg/Sounds/."
+    )
+    # Arguments for static color shift
+    parser.add_argument(
+        "-cs", "--color-shift", # Re-purposing this flag to just enable static shift
+        action="store_true",
+        help="Enable static color shifting for Zoidberg."
+    )
+    parser.add_argument(
+        "-sho", "--static-hue-offset", # NEW: Argument for static hue offset
+        type=float,
+        help="Apply a static hue shift to Zoidberg (degrees, 0-360)."
+    )
+    parser.add_argument(
+        "--saturation",
+        metavar="FACTOR",
+        type=float,
+        help="Scale Zoidberg's saturation (0 = grayscale, 1 = unchanged)."
+    )
+    parser.add_argument(
+        "--brightness",
+        metavar="FACTOR",
+        type=float,
+        help="Scale Zoidberg's brightness (1 = unchanged)."
+    )
+    parser.add_argument(
+        "--contrast",
+        metavar="FACTOR",
+        type=float,
+        help="Scale Zoidberg's contrast around mid gray (1 = unchanged)."
+    )
+    parser.add_argument(
+        "--gamma",
+        type=float,
+        help="Gamma for Zoidberg (1 = unchanged, above 1 brightens the midtones)."
+    )
+    parser.add_argument(
+        "--tint",
+        metavar="COLOR",
+        help="Tint Zoidberg toward a color, like a colored gel (see --tint-strength)."
+    )
+    parser.add_argument(
+        "--tint-strength",
+        metavar="AMOUNT",
+        type=float,
+        help="How strong --tint is, 0-1 (default: 0.5)."
+    )
+
+    # Arguments for the hue cycle animation
+    parser.add_argument(
+        "-hc", "--hue-cycle",
+        action="store_true",
+        help="Continuously cycle Zoidberg's hue (animation)."
+    )
+    parser.add_argument(
+        "--hue-cycle-period",
+        metavar="SECONDS",
+        type=float,
+        help="Seconds for one full hue cycle (default: 10)."
+    )
+    parser.add_argument(
+        "--hue-cycle-fps",
+        metavar="FPS",
+        type=float,
+        help="Frame rate of the hue cycle animation (default: 15)."
+    )
+
+    # Headless rendering (no window, no sound)
+    parser.add_argument(
+        "--render",
+        metavar="PATH",
+        type=str,
+        help="Render the composited image to PATH (e.g., 'zoidberg.png') and exit without opening a window."
+    )
+    parser.add_argument(
+        "--size",
+        type=parse_size,
+        default=(500, 550),
+        help="Output size for --render as WIDTHxHEIGHT (default: 500x550)."
+    )
+
+    # Batch rendering across a process pool
+    parser.add_argument(
+        "--batch",
+        metavar="OUTPUT_DIR",
+        type=str,
+        help="Render every combination of --configs, --hue-offsets, --texts and --sizes into OUTPUT_DIR and exit."
+    )
+    parser.add_argument(
+        "--configs",
+        metavar="INI",
+        nargs="+",
+        help="Config files to render in --batch mode (default: the current config)."
+    )
+    parser.add_argument(
+        "--hue-offsets",
+        metavar="DEGREES",
+        type=float,
+        nargs="+",
+        help="Hue offsets to sweep in --batch mode (each one enables color shift)."
+    )
+    parser.add_argument(
+        "--texts",
+        metavar="TEXT",
+        nargs="+",
+        help="Display texts to sweep in --batch mode."
+    )
+    parser.add_argument(
+        "--sizes",
+        metavar="WxH",
+        type=parse_size,
+        nargs="+",
+        help="Output sizes for --batch and --animate (default: --size)."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes for --batch and --animate (default: one per CPU core)."
+    )
+
+    # Animated export of the hue cycle
+    parser.add_argument(
+        "--animate",
+        metavar="PATH",
+        type=str,
+        help="Export one hue cycle as an animated GIF, APNG (.png/.apng) or WebP to PATH and exit (sizes: --size or --sizes)."
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        help="Frames per hue cycle for --animate (default: hue_cycle_period x hue_cycle_fps, at most 256)."
+    )
+
+    parser.add_argument(
+        "--new-instance",
+        action="store_true",
+        help="Start a separate process even if Zoidberg is already running (single_instance in config.ini)."
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Print how long imports, config load, image decode, the first draw and mixer init took."
+    )
+    parser.add_argument(
+        "--perf",
+        action="store_true",
+        help="Time each render phase and print a per-phase summary on exit."
+    )
+    parser.add_argument(
+        "--perf-json",
+        metavar="PATH",
+        help="Like --perf, but write the samples and summary to PATH as JSON on exit."
+    )
+    parser.add_argument(
+        "--perf-overlay",
+        action="store_true",
+        help="Like --perf, and also show FPS and per-phase timings on the canvas."
+    )
+    parser.add_argument(
+        "--fullscreen",
+        nargs="?",
+        const="monitor",
+        choices=("monitor", "span"),
+        help="Fill the screen (monitor) or every monitor (span) and draw in tiles (fullscreen in config.ini). Escape leaves it."
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Keep only the buffers on screen alive (low_memory in config.ini), at some CPU cost per redraw."
+    )
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="Print peak and steady-state RSS and tracemalloc totals on exit (with --perf-json, add them to the file)."
+    )
+
+    return parser
+
+
+class ZoidbergSettings:
+    """
+    The resolved Zoidberg settings: config.ini (or a dropped .ini) plus command-line overrides.
+    Needs no Tk root, so it is shared by the window (ZoidbergApp) and headless rendering.
+    """
+    # [Settings] options added after the original ones; filled into older configs with these defaults.
+    EXTRA_SETTINGS_DEFAULTS = {
+        'saturation': '1.0',
+        'brightness': '1.0',
+        'contrast': '1.0',
+        'gamma': '1.0',
+        'tint': '',
+        'tint_strength': '0.5',
+        'hue_cycle_enabled': 'False',
+        'hue_cycle_period': '10.0',
+        'hue_cycle_fps': '15',
+        'asset_cache_max_mb': '64',
+        'resize_debounce_min_ms': '50',
+        'resize_debounce_max_ms': '500',
+        'single_instance': 'True',
+        'text_box': ', '.join(str(fraction) for fraction in TEXT_BOX_DEFAULT),
+        'skin': DEFAULT_SKIN,
+        'skin_cache_max_mb': '256',
+        'low_memory': 'False',
+        'fullscreen': 'off',
+        'tile_size': str(TILE_SIZE_DEFAULT),
+    }
+    COLOR_SETTING_DEFAULTS = { # Color settings, and what an invalid value falls back to
+        'text_color': 'black',
+        'background_color': '#F0F0F0',
+        'gradient_start_color': '#ADD8E6',
+        'gradient_end_color': '#87CEEB',
+    }
+
+    def __init__(self, argv=None, config_file=None):
+        """
+        Args:
+            argv: Command-line arguments after the script/exe name (default: sys.argv[1:]).
+            config_file: Optional .ini to load instead of config.ini, treated like a dropped file.
+        """
+        self.argv = sys.argv[1:] if argv is None else list(argv) # Arguments after the script/exe name
+        self.config = configparser.ConfigParser()
+
+        # Initialize all config-related instance variables with defaults
+        self.display_text = ""
+        self.text_color = "black"
+        self.background_type = "solid"
+        self.background_color = "#F0F0F0"
+        self.gradient_start_color = "#ADD8E6"
+        self.gradient_end_color = "#87CEEB"
+        self.sound_enabled = False # Sound feature flag
+        self.launch_sound_filename = "woop.wav" # Default launch sound filename
+        self.event_sounds = {event: "" for event in SOUND_EVENTS} # [Sounds]: event -> filename ("" for none)
+        self.config_loaded_from_dropped_file = False # Flag to track if config came from a dropped file
+
+        self.color_shift_enabled = False # Controls if *any* static shift is applied
+        self.static_hue_offset = 0.0 # NEW: Degrees for static hue shift (0-360)
+        self.saturation = 1.0 # Color adjustments applied with the hue shift (see color_adjustment)
+        self.brightness = 1.0
+        self.contrast = 1.0
+        self.gamma = 1.0
+        self.tint = "" # Tint color ("" for none)
+        self.tint_strength = 0.5
+        self.hue_cycle_enabled = False # Continuous hue cycling animation
+        self.hue_cycle_period = 10.0 # Seconds per full trip around the color wheel
+        self.hue_cycle_fps = 15.0 # Animation frame rate
+        self.asset_cache_max_mb = 64.0 # Size cap of the on-disk sprite cache (0 disables it)
+        self.resize_debounce_min_ms = 50 # Bounds of the adaptive delay before a full-quality redraw after resizing
+        self.resize_debounce_max_ms = 500
+        self.single_instance = True # Later launches open a window in this process instead of starting their own
+        self.text_box = TEXT_BOX_DEFAULT # (left, top, width, height) of the sprite the text is fitted into
+        self.skin = DEFAULT_SKIN # Sprite image: the built-in one or one from Zoidberg/Skins/
+        self.skin_cache_max_mb = 256.0 # Memory budget for decoded and hue-shifted skins
+        self.low_memory = False # Keep only on-screen buffers alive (long-running kiosks)
+        self.fullscreen = "off" # One of FULLSCREEN_MODES
+        self.tile_size = TILE_SIZE_DEFAULT # Tile edge in pixels for fullscreen and very large windows (0: never tile)
+        self.args = None # Parsed command-line namespace, set by _parse_and_apply_command_line_args
+
+        self.application_base_path = get_application_base_path()
+
+        # Determine the primary config file path to use based on the command-line arguments
+        # This allows drag-and-drop to set the config file BEFORE loading
+        self.config_file = os.path.join(self.application_base_path, 'config.ini') # Default config file
+
+        if self.argv and self.argv[0].lower().endswith('.ini') and os.path.isfile(self.argv[0]):
+            self.config_file = self.argv[0] # Use the dropped .ini as the primary config source
+            self.config_loaded_from_dropped_file = True # Set flag
+        elif config_file:
+            self.config_file = config_file # Explicit config (e.g., from --configs); never rewritten
+            self.config_loaded_from_dropped_file = True
+
+
+    def load(self):
+        """Loads the config file, then applies command-line overrides."""
+        self._load_config() # Loads from self.config_file
+        self._parse_and_apply_command_line_args() # Applies overrides or skips if dropped .ini was primary
+        self._validate_colors()
+
+
+    def _validate_colors(self):
+        """
+        Checks every color setting once, at load time; invalid ones are reported and replaced by their
+        defaults. A name missing from the bundled table is only invalid if Tk doesn't know it either.
+        """
+        def check(color_string):
+            try:
+                parse_color(color_string)
+            except ValueError:
+                rgb = self._lookup_tk_color(color_string)
+                if rgb is None:
+                    raise
+                add_color_name(color_string, rgb) # From now on parse_color knows it, on any thread
+
+        problems = []
+        for field, default in self.COLOR_SETTING_DEFAULTS.items():
+            try:
+                check(getattr(self, field))
+            except ValueError as e:
+                problems.append(f"{field}: {e}. Using '{default}' instead.")
+                setattr(self, field, default)
+        if self.tint:
+            try:
+                check(self.tint)
+            except ValueError as e:
+                problems.append(f"tint: {e}. Using no tint instead.")
+                self.tint = ""
+        if problems:
+            self._report("Config Error", "Invalid colors in the config or command line:\n" + "\n".join(problems), error=True)
+
+
+    def resolved_settings(self):
+        """Returns the settings that affect the rendered image as a plain (picklable) dict."""
+        return {field: getattr(self, field) for field in RENDER_SETTING_FIELDS}
 
-        # Start the sound playback in a new thread
-        threading.Thread(target=play_threaded_sound, daemon=True).start()
+
+    def _report(self, title, message, error=False):
+        """Reports a config problem or notice. Headless: printed to the console."""
+        print(f"{'ERROR' if error else 'INFO'}: {title}: {message}", file=sys.stderr if error else sys.stdout)
+
+    def _lookup_tk_color(self, color_string):
+        """Returns the (R, G, B) of a color from Tk's own color database, or None. Headless: there is no Tk."""
+        return None
 
 
     def _parse_and_apply_command_line_args(self):
@@ -190,81 +2792,27 @@ class ZoidbergApp:
         already loaded, and command-line flags would override them.
         """
         # Determine which arguments to parse
-        args_to_parse = sys.argv[1:] # All arguments after the script/exe name
+        args_to_parse = list(self.argv) # All arguments after the script/exe name
 
-        # If the app was launched by dropping an .ini, that path is sys.argv[1].
+        # If the app was launched by dropping an .ini, that path is argv[0].
         # We should remove it from the list of arguments argparse will try to parse
         # as regular flags, as its content has already been handled by _load_config.
         if self.config_loaded_from_dropped_file and len(args_to_parse) > 0 and args_to_parse[0] == self.config_file:
-            print(f"DEBUG: Removing dropped INI file path '{self.config_file}' from argparse arguments.")
             args_to_parse = args_to_parse[1:] # Skip the INI file path
 
-        # Standard argument parsing for normal launches or launches with additional args
-        parser = argparse.ArgumentParser(
-            description="Launch Zoidberg application with custom settings."
-        )
-
-        parser.add_argument(
-            "-t", "--text",
-            type=str,
-            help="Set the display text for Zoidberg."
-        )
-
-        parser.add_argument(
-            "-bg", "--background-color",
-            type=str,
-            help="Set the single background color (e.g., 'red', '#RRGGBB')."
-        )
-
-        parser.add_argument(
-            "-bgg1", "--gradient-color1",
-            type=str,
-            help="Set the first gradient color."
-        )
-
-        parser.add_argument(
-            "-bgg2", "--gradient-color2",
-            type=str,
-            help="Set the second gradient color."
-        )
-
-        parser.add_argument(
-            "-tc", "--text-color",
-            type=str,
-            help="Set the color of the display text (e.g., 'white', '#RRGGBB')."
-        )
-
-        # Argument for sound
-        parser.add_argument(
-            "-s", "--enable-sound",
-            action="store_true", # This makes it a boolean flag (true if present)
-            help="Enable sound effects (e.g., launch sound)."
-        )
-        parser.add_argument(
-            "-ls", "--launch-sound",
-            type=str,
-            help="Specify a custom launch sound filename (e.g., 'custom.wav'). Must be in Zoidberg/Sounds/."
-        )
-        # Arguments for static color shift
-        parser.add_argument(
-            "-cs", "--color-shift", # Re-purposing this flag to just enable static shift
-            action="store_true",
-            help="Enable static color shifting for Zoidberg."
-        )
-        parser.add_argument(
-            "-sho", "--static-hue-offset", # NEW: Argument for static hue offset
-            type=float,
-            help="Apply a static hue shift to Zoidberg (degrees, 0-360)."
-        )
+        parser = build_arg_parser()
 
         # Parse only the relevant arguments
         args = parser.parse_args(args_to_parse)
+        self.args = args # Kept for non-settings flags such as --render
 
         # Apply command line arguments as overrides
         if args.text:
             self.display_text = args.text
         if args.text_color:
             self.text_color = args.text_color
+        if args.skin:
+            self.skin = args.skin
 
         if args.enable_sound:
             self.sound_enabled = True # Command-line -s overrides config setting to True
@@ -283,6 +2831,30 @@ class ZoidbergApp:
         elif args.color_shift: 
             self.color_shift_enabled = True
 
+        if args.saturation is not None:
+            self.saturation = max(0.0, args.saturation)
+        if args.brightness is not None:
+            self.brightness = max(0.0, args.brightness)
+        if args.contrast is not None:
+            self.contrast = max(0.0, args.contrast)
+        if args.gamma is not None:
+            self.gamma = max(0.1, args.gamma)
+        if args.tint is not None:
+            self.tint = args.tint
+        if args.tint_strength is not None:
+            self.tint_strength = min(1.0, max(0.0, args.tint_strength))
+
+        if args.hue_cycle:
+            self.hue_cycle_enabled = True
+        if args.hue_cycle_period is not None:
+            self.hue_cycle_period = max(0.5, args.hue_cycle_period)
+        if args.hue_cycle_fps is not None:
+            self.hue_cycle_fps = min(60.0, max(1.0, args.hue_cycle_fps))
+        if args.low_memory:
+            self.low_memory = True
+        if args.fullscreen:
+            self.fullscreen = args.fullscreen
+
 
         # Determine background type and colors based on command-line arguments
         # Gradient arguments take precedence if both are given.
@@ -325,29 +2897,29 @@ class ZoidbergApp:
         config_modified = False
 
         if self.config_file and os.path.exists(self.config_file):
-            print(f"DEBUG: Loading configuration from: '{self.config_file}'")
             try:
                 self.config.read(self.config_file)
             except Exception as e:
-                messagebox.showerror("Config Error", f"Failed to read config file '{self.config_file}': {e}")
+                self._report("Config Error", f"Failed to read config file '{self.config_file}': {e}", error=True)
                 # Fallback to default if primary config is invalid/unreadable
                 self.config_file = os.path.join(self.application_base_path, 'config.ini')
                 self.config_loaded_from_dropped_file = False # Reset flag as we're falling back
-                print(f"DEBUG: Falling back to default config.ini: '{self.config_file}'")
+                print(f"Warning: Falling back to the default config.ini: '{self.config_file}'")
                 self.config.read(self.config_file)
 
         # If the determined config_file still doesn't exist (e.g., it was a bad dropped path, or default.ini is missing)
         if not os.path.exists(self.config_file):
             # This only happens if self.config_file was initially a non-existent dropped file,
             # OR if the default config.ini itself is missing.
-            print(f"DEBUG: Config file '{self.config_file}' not found. Creating default config.")
+            print(f"Warning: Config file '{self.config_file}' not found. Creating a default config.")
             self.config['Settings'] = {
                 'display_text': "Woop woop woop!",
                 'text_color': "#c5d8ed",
                 'sound_enabled': 'False', # Default to False
                 'launch_sound': 'woop.wav', # Default launch sound
                 'color_shift_enabled': 'False', # Default to False
-                'static_hue_offset': '0.0' # NEW
+                'static_hue_offset': '0.0', # NEW
+                **self.EXTRA_SETTINGS_DEFAULTS
             }
             self.config['Background'] = {
                 'type': 'gradient', # Changed default to gradient to demonstrate
@@ -356,14 +2928,15 @@ class ZoidbergApp:
                 'end_color': '#4682B4'   # Steel blue for clear gradient
             }
             config_modified = True
-            messagebox.showinfo("Config Created", f"'{self.config_file}' was not found and has been created with default settings.\n"
+            self._report("Config Created", f"'{self.config_file}' was not found and has been created with default settings.\n"
                                                    "You can edit its sections ([Settings], [Background]) to customize text and background.")
         else: # Config file found, ensure all options are present (for older configs)
             if not self.config.has_section('Settings'):
                 self.config['Settings'] = {
                     'display_text': "Woop woop woop!", 'text_color': "#c5d8ed",
                     'sound_enabled': 'False', 'launch_sound': 'woop.wav',
-                    'color_shift_enabled': 'False', 'static_hue_offset': '0.0'
+                    'color_shift_enabled': 'False', 'static_hue_offset': '0.0',
+                    **self.EXTRA_SETTINGS_DEFAULTS
                 }
                 config_modified = True
             else:
@@ -379,6 +2952,10 @@ class ZoidbergApp:
                 if not self.config.has_option('Settings', 'static_hue_offset'): # NEW
                     self.config['Settings']['static_hue_offset'] = '0.0'
                     config_modified = True
+                for option, default in self.EXTRA_SETTINGS_DEFAULTS.items():
+                    if not self.config.has_option('Settings', option):
+                        self.config['Settings'][option] = default
+                        config_modified = True
 
 
             if not self.config.has_section('Background'):
@@ -388,6 +2965,10 @@ class ZoidbergApp:
                 }
                 config_modified = True
 
+        if not self.config.has_section('Sounds'):
+            self.config['Sounds'] = {event: '' for event in SOUND_EVENTS}
+            config_modified = True
+
         if config_modified and not self.config_loaded_from_dropped_file: # Only write if we're managing the default config.ini
             self._write_config_with_comments()
 
@@ -401,6 +2982,39 @@ class ZoidbergApp:
         # NEW: Load color shift settings
         self.color_shift_enabled = self.config.getboolean('Settings', 'color_shift_enabled', fallback=False)
         self.static_hue_offset = float(self._sanitize_config_value(self.config.get('Settings', 'static_hue_offset', fallback='0.0')))
+        self.saturation = max(0.0, float(self._sanitize_config_value(self.config.get('Settings', 'saturation', fallback='1.0'))))
+        self.brightness = max(0.0, float(self._sanitize_config_value(self.config.get('Settings', 'brightness', fallback='1.0'))))
+        self.contrast = max(0.0, float(self._sanitize_config_value(self.config.get('Settings', 'contrast', fallback='1.0'))))
+        self.gamma = max(0.1, float(self._sanitize_config_value(self.config.get('Settings', 'gamma', fallback='1.0'))))
+        self.tint = self._sanitize_config_value(self.config.get('Settings', 'tint', fallback=''))
+        self.tint_strength = min(1.0, max(0.0, float(self._sanitize_config_value(self.config.get('Settings', 'tint_strength', fallback='0.5')))))
+
+        # Hue cycle animation settings
+        self.hue_cycle_enabled = self.config.getboolean('Settings', 'hue_cycle_enabled', fallback=False)
+        self.hue_cycle_period = max(0.5, float(self._sanitize_config_value(self.config.get('Settings', 'hue_cycle_period', fallback='10.0'))))
+        self.hue_cycle_fps = min(60.0, max(1.0, float(self._sanitize_config_value(self.config.get('Settings', 'hue_cycle_fps', fallback='15')))))
+
+        self.asset_cache_max_mb = max(0.0, float(self._sanitize_config_value(self.config.get('Settings', 'asset_cache_max_mb', fallback='64'))))
+        self.resize_debounce_min_ms = max(0, int(float(self._sanitize_config_value(self.config.get('Settings', 'resize_debounce_min_ms', fallback='50')))))
+        self.resize_debounce_max_ms = max(self.resize_debounce_min_ms, int(float(self._sanitize_config_value(self.config.get('Settings', 'resize_debounce_max_ms', fallback='500')))))
+        self.single_instance = self.config.getboolean('Settings', 'single_instance', fallback=True)
+        try:
+            self.text_box = parse_text_box(self._sanitize_config_value(self.config.get('Settings', 'text_box', fallback=self.EXTRA_SETTINGS_DEFAULTS['text_box'])))
+        except ValueError as e:
+            self._report("Config Error", f"{e}. Using the default text box.", error=True)
+            self.text_box = TEXT_BOX_DEFAULT
+        self.skin = self._sanitize_config_value(self.config.get('Settings', 'skin', fallback=DEFAULT_SKIN)) or DEFAULT_SKIN
+        self.skin_cache_max_mb = max(0.0, float(self._sanitize_config_value(self.config.get('Settings', 'skin_cache_max_mb', fallback='256'))))
+        self.low_memory = self.config.getboolean('Settings', 'low_memory', fallback=False)
+        self.fullscreen = self._sanitize_config_value(self.config.get('Settings', 'fullscreen', fallback='off')).lower()
+        if self.fullscreen not in FULLSCREEN_MODES:
+            self._report("Config Error", f"fullscreen must be one of {', '.join(FULLSCREEN_MODES)}, not '{self.fullscreen}'. Using 'off'.", error=True)
+            self.fullscreen = "off"
+        self.tile_size = int(float(self._sanitize_config_value(self.config.get('Settings', 'tile_size', fallback=str(TILE_SIZE_DEFAULT)))))
+        if self.tile_size > 0:
+            self.tile_size = min(4096, max(64, self.tile_size))
+        else:
+            self.tile_size = 0
 
 
         self.background_type = self._sanitize_config_value(self.config.get('Background', 'type', fallback='solid'))
@@ -408,6 +3022,9 @@ class ZoidbergApp:
         self.gradient_start_color = self._sanitize_config_value(self.config.get('Background', 'start_color', fallback='#ADD8E6'))
         self.gradient_end_color = self._sanitize_config_value(self.config.get('Background', 'end_color', fallback='#87CEEB'))
 
+        self.event_sounds = {event: self._sanitize_config_value(self.config.get('Sounds', event, fallback=''))
+                             for event in SOUND_EVENTS}
+
 
     def _write_config_with_comments(self):
         """
@@ -428,6 +3045,40 @@ class ZoidbergApp:
                 f.write('; Set to True to apply a static color shift to Zoidberg.\n')
                 f.write(f'static_hue_offset = {self.config.get("Settings", "static_hue_offset")}\n') # NEW
                 f.write('; Static hue offset in degrees (0-360) applied to Zoidberg if color_shift_enabled is True.\n') # NEW
+                f.write(f'saturation = {self.config.get("Settings", "saturation")}\n')
+                f.write(f'brightness = {self.config.get("Settings", "brightness")}\n')
+                f.write(f'contrast = {self.config.get("Settings", "contrast")}\n')
+                f.write('; Factors applied to Zoidberg\'s colors (1.0 = unchanged). Saturation 0 is grayscale; contrast scales around mid gray.\n')
+                f.write(f'gamma = {self.config.get("Settings", "gamma")}\n')
+                f.write('; 1.0 = unchanged; above 1 brightens the midtones, below 1 darkens them.\n')
+                f.write(f'tint = {self.config.get("Settings", "tint")}\n')
+                f.write(f'tint_strength = {self.config.get("Settings", "tint_strength")}\n')
+                f.write('; Color to tint Zoidberg toward, like a colored gel (empty for none), and how strongly (0-1).\n')
+                f.write(f'hue_cycle_enabled = {self.config.get("Settings", "hue_cycle_enabled")}\n')
+                f.write('; Set to True to continuously cycle Zoidberg\'s hue (starting from static_hue_offset if color_shift_enabled).\n')
+                f.write(f'hue_cycle_period = {self.config.get("Settings", "hue_cycle_period")}\n')
+                f.write('; Seconds for one full trip around the color wheel.\n')
+                f.write(f'hue_cycle_fps = {self.config.get("Settings", "hue_cycle_fps")}\n')
+                f.write('; Animation frame rate (1-60). Frames are skipped rather than delayed if drawing falls behind.\n')
+                f.write(f'asset_cache_max_mb = {self.config.get("Settings", "asset_cache_max_mb")}\n')
+                f.write('; Size limit in MB of the decoded sprite cache in Zoidberg/Cache/ (0 disables it).\n')
+                f.write(f'resize_debounce_min_ms = {self.config.get("Settings", "resize_debounce_min_ms")}\n')
+                f.write(f'resize_debounce_max_ms = {self.config.get("Settings", "resize_debounce_max_ms")}\n')
+                f.write('; Bounds (ms) of the delay before a full-quality redraw once resizing stops. The delay adapts to how fast this machine draws.\n')
+                f.write(f'single_instance = {self.config.get("Settings", "single_instance")}\n')
+                f.write('; Set to True to open later launches as new windows of the running app (faster, less memory). --new-instance overrides it.\n')
+                f.write(f'text_box = {self.config.get("Settings", "text_box")}\n')
+                f.write('; Box the text is fitted into: left, top, width, height as fractions of Zoidberg. The text gets the largest font that fits.\n')
+                f.write(f'skin = {self.config.get("Settings", "skin")}\n')
+                f.write(f'; Sprite to show: {DEFAULT_SKIN} (built in) or the name of an image in Zoidberg/Skins/. Left/Right arrow keys switch skins.\n')
+                f.write(f'skin_cache_max_mb = {self.config.get("Settings", "skin_cache_max_mb")}\n')
+                f.write('; Memory limit in MB for decoded skins. The least recently shown ones are dropped first.\n')
+                f.write(f'low_memory = {self.config.get("Settings", "low_memory")}\n')
+                f.write('; Set to True on small machines that run Zoidberg for weeks: only the images on screen are kept in memory, redraws cost a little more CPU.\n')
+                f.write(f'fullscreen = {self.config.get("Settings", "fullscreen")}\n')
+                f.write('; off, monitor (fill the screen) or span (a borderless window over every monitor). Escape leaves fullscreen.\n')
+                f.write(f'tile_size = {self.config.get("Settings", "tile_size")}\n')
+                f.write('; Fullscreen and very large windows are drawn in tiles of this many pixels (64-4096), only redrawing tiles that changed. 0 disables tiling.\n')
                 f.write('\n')
 
                 f.write('[Background]\n')
@@ -441,185 +3092,1242 @@ class ZoidbergApp:
                 f.write('; Light Blue (Start of Gradient)\n')
                 f.write(f'end_color = {self.config.get("Background", "end_color")}\n')
                 f.write('; Steel Blue (End of Gradient)\n')
+                f.write('\n')
+
+                f.write('[Sounds]\n')
+                f.write('; Sounds for events while sound_enabled is True: a file in Zoidberg/Sounds/, or empty for none.\n')
+                for event in SOUND_EVENTS:
+                    f.write(f'{event} = {self.config.get("Sounds", event, fallback="")}\n')
+                f.write('; click: clicking Zoidberg; resize: a resize has finished; reload: config.ini was edited while running.\n')
+
+
+class ZoidbergApp(ZoidbergSettings):
+    # Settings picked up by a config hot-reload, and the canvas layers each one invalidates
+    RELOADABLE_SETTING_LAYERS = {
+        "display_text": ("text",),
+        "text_color": ("text",),
+        "background_type": ("background",),
+        "background_color": ("background",),
+        "gradient_start_color": ("background",),
+        "gradient_end_color": ("background",),
+        "color_shift_enabled": ("sprite",),
+        "static_hue_offset": ("sprite",),
+        "saturation": ("sprite",),
+        "brightness": ("sprite",),
+        "contrast": ("sprite",),
+        "gamma": ("sprite",),
+        "tint": ("sprite",),
+        "tint_strength": ("sprite",),
+        "hue_cycle_enabled": ("sprite",),
+        "hue_cycle_period": ("sprite",),
+        "hue_cycle_fps": ("sprite",),
+        "sound_enabled": (),
+        "launch_sound_filename": (),
+        "event_sounds": (),
+        "asset_cache_max_mb": (),
+        "resize_debounce_min_ms": (),
+        "resize_debounce_max_ms": (),
+        "single_instance": (),
+        "text_box": ("text", "text_position"),
+        "skin": ("sprite",),
+        "skin_cache_max_mb": (),
+        "low_memory": ("background", "sprite"),
+        "fullscreen": (),
+        "tile_size": ("background", "sprite"),
+    }
+
+    def __init__(self, master, argv=None, shared=None):
+        """
+        Args:
+            master: The Tk root, or a Toplevel for windows opened by later launches.
+            argv: Command-line arguments for this window (default: sys.argv[1:]).
+            shared: SharedResources of the process (default: a fresh set, for the first window).
+        """
+        self.master = master
+        master.title("Why not Zoidberg?")
+        master.geometry("500x550")
+        master.minsize(300, 350)
+        self.shared = shared if shared is not None else SharedResources()
+
+        self.startup_timings = {"imports": _startup_imports_done - _startup_t0} # Phase name -> seconds
+
+        start = time.perf_counter()
+        ZoidbergSettings.__init__(self, argv)
+        self.load()
+        self.startup_timings["config_load"] = time.perf_counter() - start
+
+        self.perf = PerfRecorder(enabled=bool(self.args.perf or self.args.perf_json or self.args.perf_overlay))
+        self.perf.record("config_load", start, self.startup_timings["config_load"])
+        self._perf_overlay_job = None
+        self.memory = MemoryMonitor(enabled=bool(self.args.memory_report))
+
+        # Start decoding the launch sound now, in parallel with loading the image below.
+        # The mixer is only initialized if sound is enabled.
+        if self.shared.sound_player is None:
+            self.shared.sound_player = SoundPlayer(os.path.join(self.application_base_path, "Zoidberg", "Sounds"))
+        self.sound_player = self.shared.sound_player
+        if self.sound_enabled:
+            self.sound_player.preload(self.launch_sound_filename)
+            self._preload_event_sounds()
+
+        # Image related instance variables
+        self.skin_library = None
+
+        # Path to the image relative to the application base path
+        image_path = get_zoidberg_image_path(self.application_base_path)
+
+        if self.shared.skin_library is None:
+            if not os.path.exists(image_path):
+                messagebox.showerror("Image Error", (f"Zoidberg image not found at '{image_path}'.\n"
+                                                      "Please ensure the image path is correct."))
+                self.sound_player.shutdown()
+                master.destroy()
+                return
+
+            # Decoded and transformed sprites are cached on disk as raw RGBA, keyed by each skin's hash,
+            # so a repeat launch maps them into memory instead of decoding and transforming again.
+            # In memory, every skin's images share one LRU with a byte budget.
+            self.shared.skin_library = SkinLibrary(self.application_base_path,
+                                                   memory_max_bytes=int(self.skin_cache_max_mb * 1024 * 1024),
+                                                   disk_max_bytes=int(self.asset_cache_max_mb * 1024 * 1024))
+
+        # Windows opened by later launches reuse the skins and caches decoded by the first one
+        skin_library = self.shared.skin_library
+        self._resolve_skin(skin_library)
+        self.skin_library = skin_library
+
+        # The first window of a launch may start from the frame the last run closed on
+        snapshot = None
+        if not self.shared.windows and isinstance(master, tk.Tk):
+            start = time.perf_counter()
+            snapshot = self._check_snapshot(load_snapshot(self.application_base_path))
+            self.startup_timings["snapshot_check"] = time.perf_counter() - start
+
+        if snapshot is None:
+            try:
+                # Decode the starting skin now, so a broken image is reported before the window opens
+                start = time.perf_counter()
+                skin_library.source(self.skin)
+                self.startup_timings["image_decode"] = time.perf_counter() - start
+                self.perf.record("image_decode", start, self.startup_timings["image_decode"])
+            except Exception as e:
+                messagebox.showerror("Image Error", f"Failed to load Zoidberg image: {e}")
+                print(f"ERROR: Failed to load Zoidberg image: {e}")
+                if not self.shared.windows:
+                    self.sound_player.shutdown()
+                master.destroy()
+                return
+        self._cache_scaled_sprite = True # Only the launch-size sprite is worth keeping on disk
+
+        self.canvas = tk.Canvas(master, highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        self.canvas_image_id = None
+        self.canvas_text_id = None
+        self.zoidberg_photo = None # Initialize as None; will be created/updated in _draw_content
+        self._shown_sprite = None # (sprite_key, PIL image) of the sprite on the canvas, for the warm-start snapshot
+
+        self.canvas_background_id = None
+        self.scene = SceneModel() # Tracks which canvas layers need redrawing
+
+        self.canvas_snapshot_id = None # Warm-start frame (background and sprite) shown until a redraw replaces it
+        self.snapshot_photo = None
+        self._shown_snapshot = None # The snapshot dict behind canvas_snapshot_id
+        self._snapshot_superseded = False # A redraw is rendering the layers the snapshot stood in for
+
+        self.gradient_cache = GradientCache()
+        self.background_photo = None # Keeps the gradient PhotoImage alive while it is on the canvas
+        self.text_fitter = TkTextFitter(master) # Memoized fit-to-box text layouts
+        self.render_pipeline = RenderPipeline(master, self.shared.get_render_executor())
+        self.tile_pipeline = RenderPipeline(master, self.shared.get_tile_executor(),
+                                            max_results=TILE_WORKERS * TILE_RESULTS_PER_WORKER)
+        self.tiles = {} # (column, row) -> (canvas item, PhotoImage) of the tiles on the canvas (tiled mode)
+        self.tile_keys = {} # (column, row) -> what the tile was drawn from (None: nothing to draw)
+        self._tile_source = None # (key, full-resolution sprite) the tiles resample from
+        self._tile_sprite_box = (0, 0, 0, 0) # Where the tiles draw the sprite, for click sounds
+        self._frame_start = None # (perf_counter, fast, resampled) of the draw whose layers are still rendering
+
+        self._resize_job = None
+        self._live_resize_job = None # Pending low-quality frame while the window is being dragged
+        self.resize_timing = AdaptiveResizeTiming(self.resize_debounce_min_ms, self.resize_debounce_max_ms)
+        self.sprite_pyramid = None # ImagePyramid of the (possibly hue-shifted) sprite in use
+
+        self.hue_cycle_ring = None # HueCycleRing for the current sprite size (rebuilt on resize)
+        self._hue_cycle_job = None
+        self._hue_cycle_started = time.perf_counter()
+        self._hue_cycle_due_index = None # The last frame the playhead reached (shown, or dropped if not ready)
+        self.hue_cycle_pipeline = RenderPipeline(master, self.shared.get_render_executor()) # Fills the ring ahead
+        self.hue_cycle_stats = {"ticks": 0, "frames_shown": 0, "frames_dropped": 0}
+        self.config_reload_stats = collections.Counter() # "reloads" and how often each setting changed, for --perf
+
+        self.canvas.bind("<Configure>", self._on_resize_debounced)
+        self.master.bind("<Right>", lambda event: self._cycle_skin(1))
+        self.master.bind("<Left>", lambda event: self._cycle_skin(-1))
+        self.master.bind("<Escape>", self._leave_fullscreen)
+        self.master.protocol("WM_DELETE_WINDOW", self._on_closing)
+
+        self._windowed_geometry = None # Geometry to restore when leaving span mode
+        if self.fullscreen != "off":
+            self._apply_fullscreen()
+
+        self.master.update_idletasks()
+        start = time.perf_counter()
+        if snapshot is not None and self._show_snapshot(snapshot):
+            # Layers the snapshot doesn't match (e.g., the window manager picked another size) render in the background
+            self._draw_content()
+        elif not self.shared.windows:
+            self._draw_content(sync=True) # Initial draw, rendered in place so the window never opens empty
+        else:
+            # A window opened by a later launch renders on the worker: building here would freeze the open ones
+            self._draw_content()
+        self.startup_timings["first_draw"] = time.perf_counter() - start
+        if self.args.startup_profile:
+            self.master.after_idle(self._on_first_frame)
+
+        # Play launch sound if enabled (already decoding since startup)
+        if self.sound_enabled:
+            self._play_sound(self.launch_sound_filename)
+        
+        if self.hue_cycle_enabled:
+            self._hue_cycle_job = self.master.after(0, self._hue_cycle_tick)
+
+        if self.args.perf_overlay:
+            self._perf_overlay_job = self.master.after(PERF_OVERLAY_INTERVAL_MS, self._update_perf_overlay)
+
+        # Watch the config file (default or dropped .ini) for edits
+        self._config_signature = self._config_file_signature()
+        self._config_poll_job = self.master.after(CONFIG_POLL_INTERVAL_MS, self._poll_config_file)
+
+        self.shared.windows.append(self)
+
+
+    def _on_first_frame(self):
+        """Runs once the event loop has painted the first frame (--startup-profile)."""
+        self.startup_timings["time_to_first_frame"] = time.perf_counter() - _startup_t0
+        self._report_startup_profile(deadline=time.perf_counter() + 3.0)
+
+    def _report_startup_profile(self, deadline):
+        """Prints the startup phases, waiting (up to deadline) for the background sound preload to finish."""
+        sound_pending = (self.sound_enabled and self.sound_player.available
+                         and not any(name.startswith("decode") for name in self.sound_player.timings))
+        if sound_pending and time.perf_counter() < deadline:
+            self.master.after(20, self._report_startup_profile, deadline)
+            return
+
+        print("Startup profile (ms):")
+        for name, seconds in self.startup_timings.items():
+            print(f"  {name:<32} {seconds * 1000:8.1f}")
+        for name, seconds in list(self.sound_player.timings.items()):
+            print(f"  {name + ' (background)':<32} {seconds * 1000:8.1f}")
+        if not self.sound_enabled:
+            print("  (sound disabled: pygame was not imported)")
+
+
+    def _update_perf_overlay(self):
+        """Redraws the --perf-overlay readout (FPS and recent per-phase means) in the top-left corner."""
+        self._perf_overlay_job = self.master.after(PERF_OVERLAY_INTERVAL_MS, self._update_perf_overlay)
+        lines = [f"{self.perf.fps():.1f} fps"] + self.perf.format_summary(last=PERF_OVERLAY_WINDOW)
+        text = "\n".join(lines)
+
+        if not self.canvas.find_withtag("perf_overlay"):
+            self.canvas.create_rectangle(0, 0, 0, 0, fill="#000000", outline="", tags=("perf_overlay", "perf_overlay_bg"))
+            self.canvas.create_text(6, 6, anchor=tk.NW, font=("Courier", 9), fill="#00FF00",
+                                    tags=("perf_overlay", "perf_overlay_text"))
+        self.canvas.itemconfig("perf_overlay_text", text=text)
+        x1, y1, x2, y2 = self.canvas.bbox("perf_overlay_text")
+        self.canvas.coords("perf_overlay_bg", x1 - 4, y1 - 4, x2 + 4, y2 + 4)
+        self.canvas.tag_raise("perf_overlay_bg")
+        self.canvas.tag_raise("perf_overlay_text")
+
+    def _perf_counters(self):
+        """Redraw and animation counters reported alongside the phase timings."""
+        counters = {"redraw": dict(self.scene.stats), "hue_cycle": dict(self.hue_cycle_stats),
+                    "config_reload": dict(self.config_reload_stats),
+                    "render_pipeline": dict(self.render_pipeline.stats),
+                    "tile_pipeline": dict(self.tile_pipeline.stats, tiles=len(self.tiles)),
+                    "skin_cache": dict(self.skin_library.memory.stats), "sound": self.sound_player.stats()}
+        if self.memory.enabled:
+            counters["memory"] = self.memory.summary()
+        return counters
+
+    def _report_perf(self):
+        """Writes --perf-json, or prints the per-phase summary for --perf/--perf-overlay."""
+        if self.args.perf_json:
+            try:
+                self.perf.dump(self.args.perf_json, self._perf_counters())
+            except OSError as e:
+                print(f"Warning: Could not write '{self.args.perf_json}': {e}")
+            return
+        print("Render phases:")
+        for line in self.perf.format_summary():
+            print(f"  {line}")
+        for name, counters in self._perf_counters().items():
+            print(f"  {name}: {counters}")
+
+    def _report_memory(self):
+        """Prints the --memory-report summary (unless --perf/--perf-json already included it)."""
+        print("Memory:")
+        for name, value in self.memory.summary().items():
+            if isinstance(value, list):
+                print(f"  {name}:")
+                for line in value:
+                    print(f"    {line}")
+            else:
+                print(f"  {name:<16} {value}")
+
+
+    def _on_closing(self):
+        """
+        Handler for window closing event. The shared resources (sound worker and mixer,
+        single-instance server) are released when the last window closes.
+        """
+        if self._hue_cycle_job:
+            self.master.after_cancel(self._hue_cycle_job)
+            self._hue_cycle_job = None
+
+        if self._config_poll_job:
+            self.master.after_cancel(self._config_poll_job)
+            self._config_poll_job = None
+
+        if self._perf_overlay_job:
+            self.master.after_cancel(self._perf_overlay_job)
+            self._perf_overlay_job = None
+
+        self.render_pipeline.shutdown()
+        self.tile_pipeline.shutdown()
+        self.hue_cycle_pipeline.shutdown()
+
+        if self.perf.enabled:
+            self._report_perf()
+        elif self.memory.enabled:
+            self._report_memory()
+
+        if self.shared.windows == [self]:
+            self._save_snapshot() # The next launch opens on this frame
+
+        self.shared.windows.remove(self)
+        if self.shared.windows:
+            # Other windows are still open: close just this one (the Tk root can only be hidden)
+            if isinstance(self.master, tk.Tk):
+                self.master.withdraw()
+            else:
+                self.master.destroy()
+            return
+
+        self.shared.shutdown()
+        self.master.nametowidget(".").destroy() # Ends mainloop (the root may be a hidden window by now)
+
+
+    def _play_sound(self, sound_filename):
+        """Plays a sound from Zoidberg/Sounds/ through the shared SoundPlayer worker."""
+        if not self.sound_enabled:
+            return
+
+        self.sound_player.play(sound_filename)
+
+    def _play_event_sound(self, event):
+        """Plays the sound mapped to event in [Sounds], if there is one."""
+        if self.event_sounds.get(event):
+            self._play_sound(self.event_sounds[event])
+
+    def _preload_event_sounds(self):
+        """Decodes the [Sounds] effects in the background (long tracks are streamed when played instead)."""
+        for filename in set(self.event_sounds.values()) - {""}:
+            self.sound_player.preload(filename)
+
+
+    def _config_file_signature(self):
+        """Returns (mtime, size) of the config file, or None if it can't be read."""
+        try:
+            stat_result = os.stat(self.config_file)
+        except OSError:
+            return None
+        return (stat_result.st_mtime_ns, stat_result.st_size)
+
+    def _poll_config_file(self):
+        """Checks the config file for edits (a cheap stat) and hot-reloads it if it changed."""
+        self._config_poll_job = self.master.after(CONFIG_POLL_INTERVAL_MS, self._poll_config_file)
+        signature = self._config_file_signature()
+        if signature is not None and signature != self._config_signature:
+            self._config_signature = signature
+            self._reload_config()
+
+    def _reload_config(self):
+        """
+        Re-reads the config file (command-line overrides still win), diffs the result against
+        the current settings and invalidates only the canvas layers affected by what changed.
+        A file that doesn't parse is reported on the console and the current settings are kept.
+        """
+        previous = {field: getattr(self, field) for field in self.RELOADABLE_SETTING_LAYERS}
+        previous_config_file = self.config_file
+        previous_config = self.config
+
+        try:
+            configparser.ConfigParser().read(self.config_file) # Validate first; _load_config would fall back with a message box
+            self.config = configparser.ConfigParser() # Fresh parser, so removed options don't linger
+            with self.perf.span("config_load"):
+                self.load()
+        except Exception as e:
+            print(f"Warning: Could not reload '{previous_config_file}', keeping current settings: {e}")
+            for field, value in previous.items():
+                setattr(self, field, value)
+            self.config = previous_config
+            return
+        finally:
+            self.config_file = previous_config_file # Keep watching the same file
+            self._config_signature = self._config_file_signature() # _load_config may have rewritten it
+        self.skin_library.refresh() # The config may name a skin added since launch
+        self._resolve_skin(self.skin_library)
+
+        changed = [field for field, value in previous.items() if getattr(self, field) != value]
+        if not changed:
+            return
+        self.config_reload_stats["reloads"] += 1
+        self.config_reload_stats.update(changed)
+        if self.sound_enabled:
+            self._preload_event_sounds() # Newly mapped effects are decoded before they are first triggered
+            self._play_event_sound("reload")
+
+        self.skin_library.set_budgets(int(self.skin_cache_max_mb * 1024 * 1024), int(self.asset_cache_max_mb * 1024 * 1024))
+        self.resize_timing.min_ms = self.resize_debounce_min_ms
+        self.resize_timing.max_ms = self.resize_debounce_max_ms
+
+        if "hue_cycle_enabled" in changed:
+            if self.hue_cycle_enabled and not self._hue_cycle_job:
+                self._hue_cycle_job = self.master.after(0, self._hue_cycle_tick)
+            elif not self.hue_cycle_enabled:
+                if self._hue_cycle_job:
+                    self.master.after_cancel(self._hue_cycle_job)
+                    self._hue_cycle_job = None
+                self._drop_hue_cycle_ring()
+
+        if "fullscreen" in changed:
+            self._apply_fullscreen() # The resize redraws
+        if "tile_size" in changed:
+            self._clear_tiles() # The grid moved; tiles come back at the new size
+
+        layers = {layer for field in changed for layer in self.RELOADABLE_SETTING_LAYERS[field]}
+        if layers:
+            self.scene.invalidate(*layers)
+            self._draw_content() # Redraws just the invalidated layers
+
+
+    def _report(self, title, message, error=False):
+        """Reports a config problem or notice in a message box."""
+        if error:
+            messagebox.showerror(title, message)
         else:
-            print(f"DEBUG: Not writing to config file, as a dropped INI was used: '{self.config_file}'")
+            messagebox.showinfo(title, message)
+
+    def _lookup_tk_color(self, color_string):
+        """Asks Tk (winfo_rgb) for a color the bundled X11 table lacks, or returns None if Tk doesn't know it either."""
+        if color_string.strip().startswith("#"):
+            return None # Malformed hex: parse_color accepts every form Tk does
+        try:
+            return tuple(component // 256 for component in self.master.winfo_rgb(color_string))
+        except tk.TclError:
+            return None
 
 
     def _on_resize_debounced(self, event):
         """
         Handles the resize event with debouncing.
-        Only calls _draw_content after a short delay (250ms), canceling previous pending calls.
-        This prevents continuous redrawing during an active drag operation.
+        While the window is being dragged, live frames keep the window tracking the mouse,
+        spaced so drawing never takes more than half the event loop's time. The full-quality
+        _draw_content only runs once the size settles, canceling previous pending calls.
+        Both delays and the live-frame quality come from AdaptiveResizeTiming, which
+        follows the measured draw cost and <Configure> rate within the configured bounds.
         """
+        self.scene.stats["configure_events"] += 1
+
+        # <Configure> also fires for moves and restacking; nothing to do if the size is unchanged.
+        if (event.width, event.height) == self.scene.canvas_size and not self._resize_job:
+            self.scene.stats["configure_ignored"] += 1
+            return
+        self.resize_timing.note_event(time.perf_counter())
+
         if self._resize_job:
             self.master.after_cancel(self._resize_job)
-        self._resize_job = self.master.after(250, self._draw_content)
+        self._resize_job = self.master.after(self.resize_timing.settle_delay_ms(), self._draw_settled_frame)
+
+        if self._live_resize_job is None:
+            self._live_resize_job = self.master.after(self.resize_timing.live_interval_ms(), self._draw_live_frame)
+
+    def _draw_settled_frame(self):
+        """Draws the full-quality frame once a resize has settled."""
+        self._resize_job = None
+        if self._live_resize_job: # Anything it would draw is superseded by this frame
+            self.master.after_cancel(self._live_resize_job)
+            self._live_resize_job = None
+        self._draw_content() # A no-op if the last live frame was already full quality at this size
+        self._play_event_sound("resize")
+
+    def _draw_live_frame(self):
+        """Draws a frame during an active resize drag (cheap quality unless full draws are fast enough)."""
+        self._live_resize_job = None
+        if (self.canvas.winfo_width(), self.canvas.winfo_height()) == self.scene.canvas_size:
+            return # Already drawn at this size; a fast frame would only downgrade it
+        self._draw_content(fast=self.resize_timing.live_frame_fast())
+
+    def _current_hue_cycle_index(self, ring):
+        """Returns the ring frame that should be visible right now, based on the wall clock."""
+        return hue_cycle_index(self._hue_cycle_started, self.hue_cycle_period, ring.frame_count)
 
-    def _draw_content(self):
+    def _hue_cycle_tick(self):
         """
-        Handles scaling the Zoidberg image and drawing it along with the text on the canvas.
-        This function now also draws the background (solid or gradient).
-        It applies a static color shift if enabled.
+        One hue cycle animation tick, scheduled with after().
+        The frame shown is derived from the wall clock rather than a counter, so when a
+        redraw is slow the animation skips ahead (dropping frames) instead of falling behind.
+        A frame the render worker hasn't finished yet is dropped too: the current one stays up.
         """
-        if not self.original_zoidberg_pil:
-            return
+        tick_start = time.perf_counter()
+        self._hue_cycle_job = None
+        self.hue_cycle_stats["ticks"] += 1
 
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        ring = self.hue_cycle_ring
+        if ring is not None and self.canvas_image_id:
+            index = self._current_hue_cycle_index(ring)
+            if index != self._hue_cycle_due_index:
+                if self._hue_cycle_due_index is not None:
+                    self.hue_cycle_stats["frames_dropped"] += (index - self._hue_cycle_due_index) % ring.frame_count - 1
+                self._hue_cycle_due_index = index
+                with self.perf.span("hue_cycle_frame"): # PhotoImage the first time round the ring
+                    photo = ring.frame(index)
+                if photo is None:
+                    self.hue_cycle_stats["frames_dropped"] += 1
+                else:
+                    self.zoidberg_photo = photo
+                    with self.perf.span("canvas_update"):
+                        self.canvas.itemconfig(self.canvas_image_id, image=self.zoidberg_photo)
+                    self.hue_cycle_stats["frames_shown"] += 1
+                    self.perf.mark_frame()
+            self._fill_hue_cycle_ring()
 
-        if canvas_width <= 0 or canvas_height <= 0:
-            print(f"DEBUG _draw_content: Canvas size is invalid: {canvas_width}x{canvas_height}. Skipping draw.")
+        # No point ticking faster than the ring changes frames
+        frame_interval = 1.0 / self.hue_cycle_fps
+        if ring is not None:
+            frame_interval = max(frame_interval, self.hue_cycle_period / ring.frame_count)
+        remaining_ms = (frame_interval - (time.perf_counter() - tick_start)) * 1000
+        self._hue_cycle_job = self.master.after(max(1, int(remaining_ms)), self._hue_cycle_tick)
+
+    def _fill_hue_cycle_ring(self):
+        """Asks the render worker for the next frames the ring is missing, starting just ahead of the playhead."""
+        ring = self.hue_cycle_ring
+        if ring is None or self.hue_cycle_pipeline.busy():
             return
+        indices = ring.missing((self._current_hue_cycle_index(ring) + 1) % ring.frame_count, HUE_CYCLE_FILL_AHEAD)
+        if indices:
+            self.hue_cycle_pipeline.submit("frames", tuple(indices),
+                                           functools.partial(self._render_hue_cycle_frames, ring, indices),
+                                           functools.partial(self._store_hue_cycle_frames, ring))
+
+    def _render_hue_cycle_frames(self, ring, indices):
+        """Render worker: the PIL images of the ring frames at indices."""
+        with self.perf.span("hue_cycle_render"):
+            return [(index, ring.render(index)) for index in indices]
+
+    def _store_hue_cycle_frames(self, ring, frames):
+        """Tk thread: hands rendered frames to their ring and asks for the next ones until it is full."""
+        if ring is not self.hue_cycle_ring:
+            return # Replaced (e.g., by a resize) while they were rendering
+        for index, image in frames:
+            ring.store(index, image)
+        self._fill_hue_cycle_ring()
+
+    def _drop_hue_cycle_ring(self):
+        """Releases the ring's frames and stops filling it."""
+        self.hue_cycle_pipeline.cancel("frames")
+        self.hue_cycle_ring = None
+
+    def _build_hue_cycle_ring(self, build_sprite, period, fps, start_offset, keep_frames, adjustment, started):
+        """
+        Render worker: a fresh ring for the sprite build_sprite() returns (see _build_sprite),
+        with the frame due now already rendered. The settings come from the Tk thread.
+        Returns (ring, pyramid).
+        """
+        scaled_zoidberg_pil, pyramid = build_sprite()
+        frame_count = hue_cycle_frame_count(period, fps, scaled_zoidberg_pil.size)
+        ring = HueCycleRing(scaled_zoidberg_pil, frame_count, start_offset, keep_frames=keep_frames, adjustment=adjustment)
+        index = hue_cycle_index(started, period, frame_count)
+        with self.perf.span("hue_cycle_render"):
+            ring.store(index, ring.render(index))
+        return ring, pyramid
+
+    def _resolve_skin(self, skin_library):
+        """
+        Maps self.skin to an available skin, falling back to the built-in sprite for unknown
+        names and for skins whose image can't be read.
+        """
+        skin = skin_library.resolve(self.skin)
+        if skin is None:
+            self._report("Skin Error", f"Unknown skin '{self.skin}'. Available: {', '.join(skin_library.names)}. "
+                                       f"Using '{DEFAULT_SKIN}'.", error=True)
+            skin = DEFAULT_SKIN
+        elif skin != DEFAULT_SKIN and not self._skin_readable(skin_library, skin):
+            skin = DEFAULT_SKIN # A broken built-in sprite is reported when the window decodes it
+        self.skin = skin
+
+    def _skin_readable(self, skin_library, skin):
+        """True if skin's image header can be read. A skin that can't is reported once per process."""
+        reported = skin in skin_library.broken
+        try:
+            skin_library.size(skin)
+            return True
+        except OSError as e:
+            if not reported:
+                self._report("Skin Error", f"Failed to load skin '{skin}' from '{skin_library.paths[skin]}': {e}. "
+                                           "Skipping it.", error=True)
+            return False
+
+    def _cycle_skin(self, step):
+        """
+        Switches to the next (step=1) or previous (step=-1) readable skin; it is decoded on the
+        render worker when first shown.
+        """
+        self.skin_library.refresh()
+        names = self.skin_library.names
+        if self.skin not in names: # Its file was removed
+            self.skin = DEFAULT_SKIN
+        index = names.index(self.skin)
+        for _ in range(len(names) - 1):
+            index = (index + step) % len(names)
+            if self._skin_readable(self.skin_library, names[index]):
+                self.skin = names[index]
+                break
+        self._draw_content() # The sprite key includes the skin
+
+    def _render_layer(self, layer, key, build, finish, sync):
+        """
+        Renders a layer through the background pipeline: build() runs on the render worker
+        and finish(result) on the Tk thread. A request already in flight for the same key is
+        left alone. sync=True runs both right here (for the first window's first frame).
+        """
+        if sync:
+            finish(build())
+        elif self.render_pipeline.pending_key(layer) != key:
+            self.render_pipeline.submit(layer, key, build, lambda result: self._finish_layer(finish, result))
+
+    def _finish_layer(self, finish, result):
+        """Tk-thread completion of a pipelined layer; the frame is complete once nothing is pending."""
+        finish(result)
+        if not self._rendering() and self._frame_start is not None:
+            self._frame_complete(*self._frame_start)
+
+    def _rendering(self):
+        """True while any layer or tile of the current frame is still being rendered."""
+        return self.render_pipeline.busy() or self.tile_pipeline.busy()
+
+    def _frame_complete(self, draw_start, fast, resampled):
+        """
+        Records how long a frame took from the draw call until its last layer was on the canvas.
+        Only frames that rebuilt the background or sprite feed the resize timing: a text or
+        position update costs far less than a resize and would make it look cheap.
+        """
+        self._frame_start = None
+        if self._snapshot_superseded:
+            self._drop_snapshot() # Its replacement is fully on the canvas now
+        draw_seconds = time.perf_counter() - draw_start
+        if resampled:
+            self.resize_timing.note_draw(draw_seconds * 1000, fast)
+        self.perf.record("draw_live" if fast else "draw", draw_start, draw_seconds)
+        self.perf.mark_frame()
+        if not fast:
+            self.memory.sample()
+
+    def _build_sprite(self, skin, new_width, new_height, fast, adjustment, use_disk_cache, low_memory, pyramid):
+        """
+        Render worker: skin with a color adjustment chain applied (None: unadjusted, as the hue
+        cycle ring wants it) and scaled to new_width x new_height. Every input is bound on the
+        Tk thread when the request is made, so a config reload or skin switch mid-build can't
+        change what it reads. Returns (sprite, pyramid): the scaled PIL image and the image
+        pyramid it came from (pyramid, if it still matches the sprite, else a new one; None in
+        low-memory mode), which the Tk thread keeps for the next build.
+        """
+        perf = self.perf
+        # --- Prepare Zoidberg Image (apply the color adjustments if any) ---
+        # The adjusted sprite is memoized per skin and chain, so resizes don't repeat the HSV conversion.
+        if adjustment is not None:
+            with perf.span("color_adjust"):
+                current_zoidberg_pil = self.skin_library.adjusted(skin, adjustment)
+        else:
+            with perf.span("skin_decode"):
+                current_zoidberg_pil = self.skin_library.source(skin)
+
+        with perf.span("resample"):
+            if low_memory:
+                pyramid = None
+                resize = functools.partial(resize_without_pyramid, current_zoidberg_pil, (new_width, new_height))
+            else:
+                if pyramid is None or pyramid.source_image is not current_zoidberg_pil:
+                    pyramid = ImagePyramid(current_zoidberg_pil) # Rebuilt only when the sprite changes
+                resize = functools.partial(pyramid.resize, (new_width, new_height))
+            if use_disk_cache:
+                # The sprite at the launch window size comes straight from the disk cache on later launches
+                scaled_zoidberg_pil = self.skin_library.asset_cache(skin).get_or_create(
+                    ("scaled", adjustment, new_width, new_height), resize)
+            else:
+                scaled_zoidberg_pil = resize(fast=fast)
+
+        if low_memory and not fast:
+            # The size has settled and the scaled sprite is all this frame needs. This window's full-resolution
+            # images come back from the disk cache (memory-mapped, so the OS can reclaim them) when the next size
+            # needs them; live-resize frames keep them, and other windows' skins are left alone.
+            self.skin_library.release(skin, adjustment)
+        return scaled_zoidberg_pil, pyramid
+
+    def _replace_photo(self, attribute, image):
+        """
+        Sets the PhotoImage attribute (e.g., "background_photo") to show image. In low-memory
+        mode a photo of the same size is repainted in place, reusing Tk's pixel buffer, and one
+        of another size is released before the new one is allocated, so two never coexist.
+        """
+        photo = getattr(self, attribute)
+        if self.low_memory and photo is not None:
+            if (photo.width(), photo.height()) == image.size:
+                photo.paste(image)
+                return
+            setattr(self, attribute, None)
+            del photo # Tk frees the image with the last reference
+        setattr(self, attribute, ImageTk.PhotoImage(image))
+
+    def _show_sprite(self, sprite_key, image_position, result):
+        """
+        Tk thread: puts a rendered sprite on the canvas. result is (sprite, pyramid), where
+        sprite is a PIL image, or a fresh HueCycleRing (see _build_hue_cycle_ring) when
+        cycling, which the worker then fills; the pyramid is kept for the next build.
+        """
+        perf = self.perf
+        sprite, self.sprite_pyramid = result
+        if isinstance(sprite, HueCycleRing):
+            self._drop_hue_cycle_ring() # Release the old ring's frames first
+            self.hue_cycle_ring = sprite
+            self._hue_cycle_due_index = sprite.first_index
+            with perf.span("hue_cycle_frame"):
+                self.zoidberg_photo = sprite.frame(sprite.first_index)
+            self._fill_hue_cycle_ring()
+            self._shown_sprite = (sprite_key, sprite.first_image)
+        else:
+            self._drop_hue_cycle_ring() # Its frames are no longer shown
+            with perf.span("photo_image"):
+                self._replace_photo("zoidberg_photo", sprite)
+            self._shown_sprite = (sprite_key, sprite)
+
+        with perf.span("canvas_update"):
+            if self.canvas_image_id:
+                self.canvas.itemconfig(self.canvas_image_id, image=self.zoidberg_photo)
+            else:
+                self.canvas_image_id = self.canvas.create_image(*image_position,
+                                                                 image=self.zoidberg_photo,
+                                                                 anchor=tk.CENTER)
+                self.canvas.tag_bind(self.canvas_image_id, "<Button-1>", lambda event: self._play_event_sound("click"))
+                if self.canvas_text_id:
+                    self.canvas.tag_lower(self.canvas_image_id, self.canvas_text_id) # Sprites landing late stay under the text
+                self.scene.mark_drawn("sprite_position", image_position)
+        self.scene.mark_drawn("sprite", sprite_key)
+
+    def _show_gradient(self, background_key, gradient_pil):
+        """Tk thread: puts a rendered gradient background on the canvas."""
+        perf = self.perf
+        with perf.span("photo_image"):
+            self._replace_photo("background_photo", gradient_pil)
+        if self.low_memory:
+            self.gradient_cache.trim() # Tk has its own copy now
+        with perf.span("canvas_update"):
+            if self.canvas_background_id:
+                self.canvas.itemconfig(self.canvas_background_id, image=self.background_photo)
+            else:
+                self.canvas_background_id = self.canvas.create_image(0, 0, image=self.background_photo, anchor=tk.NW)
+                self.canvas.tag_lower(self.canvas_background_id)
+        self.scene.mark_drawn("background", background_key)
+
+    def _apply_fullscreen(self):
+        """Puts the window in the fullscreen mode setting: off, monitor (Tk's fullscreen) or span (every monitor)."""
+        master = self.master
+        if self.fullscreen == "span":
+            master.attributes("-fullscreen", False)
+            if self._windowed_geometry is None:
+                self._windowed_geometry = master.geometry()
+            x, y, width, height = virtual_screen_bounds(master)
+            master.overrideredirect(True) # Window managers keep decorated windows on one monitor
+            master.geometry(f"{width}x{height}+{x}+{y}") # "+-1920" is left of the primary monitor
+        else:
+            if self._windowed_geometry is not None:
+                master.overrideredirect(False)
+                master.geometry(self._windowed_geometry)
+                self._windowed_geometry = None
+            master.attributes("-fullscreen", self.fullscreen == "monitor")
+
+    def _leave_fullscreen(self, event=None):
+        """Escape key: back to a normal window."""
+        if self.fullscreen != "off":
+            self.fullscreen = "off"
+            self._apply_fullscreen()
+
+    def _use_tiles(self, canvas_width, canvas_height):
+        """True if the canvas is drawn in tiles: always in fullscreen, and windowed from TILED_MIN_PIXELS up."""
+        return self.tile_size > 0 and (self.fullscreen != "off" or canvas_width * canvas_height >= TILED_MIN_PIXELS)
+
+    def _draw_tiles(self, canvas_width, canvas_height, background_key, sprite_key, sprite_layout, fast):
+        """
+        _draw_content's background and sprite for tiled mode: a grid of tile_size canvas images
+        instead of two canvas-sized ones. Each tile is keyed by what it shows, so only tiles whose
+        content changed are rendered (a solid background only needs the tiles under the sprite),
+        on the tile workers in parallel. At most a few finished tiles wait for the Tk thread,
+        so a redraw's memory doesn't grow with the canvas. Returns how many tiles changed.
+        """
+        # Coming from the layered path: its canvas-sized images go, and come back if tiling stops
+        self.render_pipeline.cancel("background")
+        self.render_pipeline.cancel("sprite")
+        if self.canvas_background_id:
+            self.canvas.delete(self.canvas_background_id)
+            self.canvas_background_id = None
+            self.background_photo = None
+        if self.canvas_image_id:
+            self.canvas.delete(self.canvas_image_id)
+            self.canvas_image_id = None
+            self.zoidberg_photo = None
+            self._shown_sprite = None
+        self._drop_hue_cycle_ring() # The cycle pauses on the static offset; redrawing every tile per frame is too slow
+        self.scene.invalidate("sprite", "sprite_position")
+
+        new_width, new_height, image_x, image_y = sprite_layout
+        sprite_box = (int(image_x - new_width / 2), int(image_y - new_height / 2), new_width, new_height)
+        sprite_left, sprite_top = sprite_box[:2]
+        self._tile_sprite_box = sprite_box
+
+        if self.background_type == 'gradient':
+            start_rgb = resolve_color(self.gradient_start_color)
+            end_rgb = resolve_color(self.gradient_end_color)
+            background = ('gradient', self.gradient_cache.column(canvas_height, start_rgb, end_rgb))
+        else:
+            background = ('solid', resolve_color(self.background_color if self.background_type == 'solid' else '#F0F0F0'))
+        if self.scene.is_dirty("background", ("tiles", background_key)):
+            if background[0] == 'solid': # Shows through tiles with nothing to draw
+                self.canvas.config(bg=self.background_color if self.background_type == 'solid' else '#F0F0F0')
+            self.scene.mark_drawn("background", ("tiles", background_key))
+
+        boxes = tile_boxes((canvas_width, canvas_height), self.tile_size)
+        changed = 0
+        for cell in [cell for cell in self.tile_keys if cell not in boxes]:
+            self._remove_tile(cell)
+            changed += 1
 
-        self.canvas.delete("all") # Clear the canvas (removes the old red rectangle too)
+        jobs = [] # (cell, box, key, needs_sprite) of tiles to render
+        for cell, box in boxes.items():
+            left, top, right, bottom = box
+            if left < sprite_left + new_width and right > sprite_left and top < sprite_top + new_height and bottom > sprite_top:
+                sprite_part = (sprite_key, sprite_left - left, sprite_top - top)
+            else:
+                sprite_part = None
+            if background[0] == 'gradient':
+                key = (background_key[3:], canvas_height, top, right - left, bottom - top, sprite_part)
+            elif sprite_part is not None:
+                key = (background[1], right - left, bottom - top, sprite_part)
+            else:
+                key = None # The canvas color is all there is
+
+            layer = ("tile",) + cell
+            if cell in self.tile_keys and self.tile_keys[cell] == key:
+                if self.tile_pipeline.pending_key(layer) is not None:
+                    self.tile_pipeline.cancel(layer) # Back to what is already shown
+                continue
+            changed += 1
+            if key is None:
+                self._remove_tile(cell)
+                self.tile_keys[cell] = None
+            elif self.tile_pipeline.pending_key(layer) != key:
+                jobs.append((cell, box, key, sprite_part is not None))
+
+        adjustment = settings_color_adjustment(self)
+        source_key = (self.skin, adjustment)
+        source = self._tile_source[1] if self._tile_source and self._tile_source[0] == source_key else None
+        if source is None and any(needs_sprite for *_, needs_sprite in jobs):
+            # The full-resolution sprite comes from the shared caches, which only the render worker touches;
+            # its tiles are requested by the redraw once it arrives.
+            self._render_layer("tile_source", source_key,
+                               functools.partial(self._tile_sprite_source, self.skin, adjustment, fast, self.low_memory),
+                               functools.partial(self._tile_source_ready, source_key, fast), False)
+            jobs = [job for job in jobs if not job[3]]
+
+        for cell, box, key, needs_sprite in jobs:
+            build = functools.partial(render_tile, box, background, source if needs_sprite else None, sprite_box, fast)
+            self.tile_pipeline.submit(("tile",) + cell, key, build,
+                                      functools.partial(self._finish_layer, functools.partial(self._show_tile, cell, box, key)))
+        return changed
+
+    def _tile_sprite_source(self, skin, adjustment, fast, low_memory):
+        """Render worker: the full-resolution sprite the tiles resample from (the settings come from the Tk thread)."""
+        with self.perf.span("color_adjust"):
+            source = self.skin_library.adjusted(skin, adjustment)
+        if low_memory and not fast:
+            self.skin_library.release(skin, adjustment) # _tile_source keeps the one in use
+        return source
+
+    def _tile_source_ready(self, source_key, fast, source):
+        """Tk thread: keeps the tiles' sprite and redraws, which requests the tiles that needed it."""
+        self._tile_source = (source_key, source)
+        self._draw_content(fast=fast)
+
+    def _show_tile(self, cell, box, key, tile_pil):
+        """Tk thread: puts a rendered tile on the canvas, repainting its PhotoImage in place if the size is unchanged."""
+        item, photo = self.tiles.get(cell, (None, None))
+        with self.perf.span("photo_image"):
+            if photo is not None and (photo.width(), photo.height()) == tile_pil.size:
+                photo.paste(tile_pil)
+            else:
+                photo = ImageTk.PhotoImage(tile_pil)
+        with self.perf.span("canvas_update"):
+            if item is None:
+                item = self.canvas.create_image(box[0], box[1], image=photo, anchor=tk.NW)
+                self.canvas.tag_lower(item) # Under the text
+                self.canvas.tag_bind(item, "<Button-1>", self._on_tile_click)
+            else:
+                self.canvas.itemconfig(item, image=photo)
+        self.tiles[cell] = (item, photo)
+        self.tile_keys[cell] = key
+
+    def _on_tile_click(self, event):
+        """Plays the click sound when a click on the tiles lands on the sprite."""
+        left, top, width, height = self._tile_sprite_box
+        if left <= event.x < left + width and top <= event.y < top + height:
+            self._play_event_sound("click")
+
+    def _remove_tile(self, cell):
+        """Cancels a tile's render and takes it off the canvas."""
+        self.tile_pipeline.cancel(("tile",) + cell)
+        item, _ = self.tiles.pop(cell, (None, None))
+        if item is not None:
+            self.canvas.delete(item)
+        self.tile_keys.pop(cell, None)
 
-        # --- Draw Background (Solid or Gradient) ---
-        # This will now correctly draw the background without the red overlay
+    def _clear_tiles(self):
+        """Leaves tiled mode: removes every tile and invalidates the layers the tiles stood in for. Returns how many there were."""
+        count = len(self.tile_keys)
+        for cell in list(self.tile_keys):
+            self._remove_tile(cell)
+        self.render_pipeline.cancel("tile_source")
+        self._tile_source = None
+        self.scene.invalidate("background", "sprite", "sprite_position")
+        return count
+
+    def _layer_keys(self, canvas_width, canvas_height, fast=False):
+        """
+        Returns (background_key, sprite_key, sprite_layout) for a canvas size: the inputs the
+        background and sprite layers are drawn from, and compute_sprite_layout's result.
+        """
         if self.background_type == 'solid':
-            self.canvas.config(bg=self.background_color)
+            background_key = ('solid', self.background_color)
         elif self.background_type == 'gradient':
-            start_rgb = get_rgb_from_color_string(self.master, self.gradient_start_color)
-            end_rgb = get_rgb_from_color_string(self.master, self.gradient_end_color)
+            background_key = ('gradient', canvas_width, canvas_height,
+                              self.gradient_start_color, self.gradient_end_color)
+        else:
+            background_key = ('fallback',)
 
-            for i in range(canvas_height):
-                ratio = i / (canvas_height - 1) if canvas_height > 1 else 0
-                interpolated_rgb = interpolate_color(start_rgb, end_rgb, ratio)
-                interpolated_hex = rgb_to_hex(interpolated_rgb)
+        sprite_layout = compute_sprite_layout(self.skin_library.size(self.skin), (canvas_width, canvas_height))
+        sprite_key = (self.skin, sprite_layout[0], sprite_layout[1], fast, settings_color_adjustment(self),
+                      self.hue_cycle_enabled)
+        return background_key, sprite_key, sprite_layout
 
-                self.canvas.create_rectangle(0, i, canvas_width, i + 1,
-                                             fill=interpolated_hex, outline="")
-        else:
-            self.canvas.config(bg='#F0F0F0') # Fallback to a default color
+    def _snapshot_identity(self):
+        """
+        What a snapshot must have been saved under to be shown: the config file and skin
+        contents and every setting that affects the frame, normalized as JSON would store them.
+        """
+        settings = self.resolved_settings()
+        settings["hue_cycle_enabled"] = self.hue_cycle_enabled
+        return json.loads(json.dumps({
+            "config_sha256": file_sha256(self.config_file),
+            "skin_sha256": self.skin_library.asset_cache(self.skin).source_hash(),
+            "settings": settings,
+        }))
+
+    def _check_snapshot(self, snapshot):
+        """Restores the snapshot's window geometry and returns it if its frame still matches (else None)."""
+        if snapshot is None:
+            return None
+        match = re.fullmatch(r"(\d+)x(\d+)\+(-?\d+)\+(-?\d+)", str(snapshot.get("geometry")))
+        if match:
+            width, height, x, y = (int(group) for group in match.groups())
+            on_screen = 0 <= x < self.master.winfo_screenwidth() and 0 <= y < self.master.winfo_screenheight()
+            self.master.geometry(snapshot["geometry"] if on_screen else f"{width}x{height}")
+        try:
+            identity = self._snapshot_identity()
+        except OSError:
+            return None
+        if any(snapshot.get(field) != value for field, value in identity.items()):
+            return None
+        return snapshot
+
+    def _show_snapshot(self, snapshot):
+        """
+        Paints the snapshot frame as one canvas item and records the background and sprite it
+        shows as drawn, so _draw_content only renders what differs. The text is drawn normally,
+        from the layout the snapshot remembered. Returns False if the frame can't be used.
+        """
+        try:
+            self.snapshot_photo = tk.PhotoImage(master=self.master, file=snapshot["image_path"])
+            canvas_size = tuple(snapshot["canvas_size"])
+            background_key, sprite_key = snapshot_key(snapshot["background_key"]), snapshot_key(snapshot["sprite_key"])
+            sprite_position = tuple(snapshot["sprite_position"])
+            text = snapshot["text"]
+            self.text_fitter.remember(self.display_text, text["box_width"], text["box_height"],
+                                      text["font_size"], text["lines"])
+        except (tk.TclError, KeyError, TypeError, ValueError) as e:
+            print(f"Warning: Ignoring the warm-start snapshot: {e}", file=sys.stderr)
+            self.snapshot_photo = None
+            return False
+        if (self.snapshot_photo.width(), self.snapshot_photo.height()) != canvas_size:
+            self.snapshot_photo = None
+            return False
 
+        self.canvas_snapshot_id = self.canvas.create_image(0, 0, image=self.snapshot_photo, anchor=tk.NW)
+        self.canvas.tag_bind(self.canvas_snapshot_id, "<Button-1>", lambda event: self._play_event_sound("click"))
+        if self.background_type == 'solid':
+            self.canvas.config(bg=self.background_color) # Shows around the frame if the window opens larger
+        self.scene.mark_drawn("background", background_key)
+        if not self.hue_cycle_enabled: # The cycle needs its frame ring, which only a real sprite render builds
+            self.scene.mark_drawn("sprite", sprite_key)
+            self.scene.mark_drawn("sprite_position", sprite_position)
+        self._shown_snapshot = snapshot
+        return True
 
-        # --- Prepare Zoidberg Image (apply static color shift if enabled) ---
-        current_zoidberg_pil = self.original_zoidberg_pil.copy()
+    def _drop_snapshot(self):
+        """Removes the warm-start frame once the layers it stood in for are drawn."""
+        self.canvas.delete(self.canvas_snapshot_id)
+        self.canvas_snapshot_id = None
+        self.snapshot_photo = None
+        self._shown_snapshot = None
+        self._snapshot_superseded = False
 
-        if self.color_shift_enabled:
-            print(f"DEBUG _draw_content: Applying static color shift with hue offset {self.static_hue_offset}")
-            
-            # --- START Transparency Preservation Logic (Refined) ---
-            # 1. Split the original RGBA image into its RGB and Alpha components
-            #    Ensure the original image is RGBA (handled in __init__)
-            if current_zoidberg_pil.mode == 'RGBA':
-                r_orig, g_orig, b_orig, a_orig = current_zoidberg_pil.split()
-            else: # Handle cases where original image might not have had an alpha channel, treat as fully opaque
-                r_orig, g_orig, b_orig = current_zoidberg_pil.split()
-                a_orig = Image.new('L', current_zoidberg_pil.size, 255) # Create a full opaque alpha channel
+    def _save_snapshot(self):
+        """
+        Saves the window geometry, the frame's background and sprite composited at the current
+        size, and what they were drawn from, for the next launch to paint right away. The
+        sprite is the one already on the canvas; nothing is resampled at close, so if a render
+        is still in flight (or the last frame was a live-resize one) no snapshot is saved.
+        """
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        if not self.skin_library or canvas_width <= 1 or canvas_height <= 1:
+            return
+        if self.fullscreen != "off" or self._use_tiles(canvas_width, canvas_height):
+            return # Not a window size to reopen at, and a canvas-sized frame is what tiling avoids
 
+        if self.canvas_snapshot_id and not self._snapshot_superseded:
+            # Last run's frame is still what the canvas shows: keep it, at this window's geometry
+            snapshot = {field: value for field, value in self._shown_snapshot.items() if field != "image_path"}
+            snapshot["geometry"] = self.master.winfo_geometry()
+            try:
+                with Image.open(self._shown_snapshot["image_path"]) as frame:
+                    frame.load() # Closed before save_snapshot replaces the file (Windows can't replace an open one)
+            except OSError as e:
+                print(f"Warning: Could not save the warm-start snapshot: {e}", file=sys.stderr)
+                return
+            save_snapshot(self.application_base_path, snapshot, frame)
+            return
 
-            # 2. Convert the RGB part to HSV
-            rgb_image_for_hsv = Image.merge("RGB", (r_orig, g_orig, b_orig))
-            hsv_image = rgb_image_for_hsv.convert("HSV")
-            h, s, v = hsv_image.split()
+        try:
+            background_key, sprite_key, (new_width, new_height, image_x, image_y) = self._layer_keys(canvas_width,
+                                                                                                   canvas_height)
+            if self._shown_sprite is None or self._shown_sprite[0] != sprite_key:
+                return # The canvas doesn't show a settled sprite for these settings
+            sprite = self._shown_sprite[1]
+            if self.background_type == 'gradient':
+                frame = self.gradient_cache.get(canvas_width, canvas_height, resolve_color(self.gradient_start_color),
+                                                resolve_color(self.gradient_end_color)).copy()
+            else:
+                frame = Image.new("RGB", (canvas_width, canvas_height),
+                                  resolve_color(self.background_color if self.background_type == 'solid' else '#F0F0F0'))
+            frame.paste(sprite, (int(image_x - new_width / 2), int(image_y - new_height / 2)), sprite)
 
-            # 3. Apply hue offset to the hue band
-            pil_hue_offset = int(self.static_hue_offset / 360 * 255)
-            hue_lut = [(x + pil_hue_offset) % 256 for x in range(256)]
-            h_shifted = h.point(hue_lut)
+            _, _, text_box_width, text_box_height = compute_text_box(new_width, new_height, image_x, image_y,
+                                                                     self.text_box)
+            font_size, text_lines = self.text_fitter.fit(self.display_text, text_box_width, text_box_height)
+            snapshot = self._snapshot_identity()
+        except Exception as e:
+            print(f"Warning: Could not save the warm-start snapshot: {e}", file=sys.stderr)
+            return
 
-            # 4. Merge shifted HSV back to RGB
-            hsv_shifted = Image.merge("HSV", (h_shifted, s, v))
-            rgb_shifted_result = hsv_shifted.convert("RGB") # Convert back to RGB
+        snapshot.update({
+            "version": SNAPSHOT_VERSION,
+            "geometry": self.master.winfo_geometry(),
+            "canvas_size": [canvas_width, canvas_height],
+            "background_key": background_key,
+            "sprite_key": sprite_key,
+            "sprite_position": [image_x, image_y],
+            "text": {"box_width": text_box_width, "box_height": text_box_height,
+                     "font_size": font_size, "lines": list(text_lines)},
+        })
+        save_snapshot(self.application_base_path, snapshot, frame)
 
-            # 5. Merge the shifted RGB with the ORIGINAL alpha channel
-            current_zoidberg_pil = Image.merge("RGBA", (rgb_shifted_result.split()[0], rgb_shifted_result.split()[1], rgb_shifted_result.split()[2], a_orig))
-            # --- END Transparency Preservation Logic ---
+    def _draw_content(self, fast=False, sync=False):
+        """
+        Handles scaling the Zoidberg image and drawing it along with the text on the canvas.
+        This function now also draws the background (solid or gradient).
+        It applies a static color shift if enabled.
+        fast=True resamples with a cheap filter for live resize feedback.
+        Only layers whose inputs changed since the last draw are touched; existing
+        canvas items are updated in place instead of being deleted and recreated.
+        The gradient and sprite are rendered on the background RenderPipeline and appear
+        when ready (sync=True renders them in place); a newer draw supersedes older ones.
+        Fullscreen and very large canvases draw them in tiles instead (see _draw_tiles).
+        """
+        if not self.skin_library:
+            return
 
-        
-        # --- Draw Zoidberg Image ---
-        original_width, original_height = current_zoidberg_pil.size 
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
 
-        width_scale = canvas_width / original_width
-        height_scale = canvas_height / original_height
-        scale_factor = min(width_scale, height_scale) * 0.85 
+        if canvas_width <= 0 or canvas_height <= 0:
+            return # Not mapped yet
 
-        new_width = int(original_width * scale_factor)
-        new_height = int(original_height * scale_factor)
+        draw_start = time.perf_counter()
+        perf = self.perf
+        self.scene.stats["draw_calls"] += 1
+        self.scene.canvas_size = (canvas_width, canvas_height)
+        layers_drawn = 0
+        resampled = False # Whether the background or sprite is rebuilt (what a resize costs)
 
-        if new_height < 1: new_height = 1
-        if new_width < 1: new_width = 1
-        print(f"DEBUG _draw_content: Scaled Zoidberg dimensions: {new_width}x{new_height}")
+        background_key, sprite_key, (new_width, new_height, image_x, image_y) = self._layer_keys(canvas_width,
+                                                                                               canvas_height, fast)
 
-        scaled_zoidberg_pil = current_zoidberg_pil.resize((new_width, new_height), Image.LANCZOS)
-        
-        image_x = canvas_width / 2
-        image_y = canvas_height / 2
+        tiled = self._use_tiles(canvas_width, canvas_height)
 
-        self.zoidberg_photo = ImageTk.PhotoImage(scaled_zoidberg_pil) 
+        if self.canvas_snapshot_id and not self._snapshot_superseded and (
+                tiled or self.scene.is_dirty("background", background_key) or self.scene.is_dirty("sprite", sprite_key)
+                or self.scene.is_dirty("sprite_position", (image_x, image_y))):
+            # The snapshot bakes the background and sprite together: render both, and drop it once they're shown
+            self.scene.invalidate("background", "sprite", "sprite_position")
+            self._snapshot_superseded = True
 
-        if self.canvas_image_id:
-            if self.canvas.find_withtag(self.canvas_image_id):
-                self.canvas.itemconfig(self.canvas_image_id, image=self.zoidberg_photo)
-                print(f"DEBUG _draw_content: Updated existing canvas image item {self.canvas_image_id}.")
-            else: # Item was deleted, recreate it
-                self.canvas_image_id = self.canvas.create_image(image_x, image_y,
-                                                                 image=self.zoidberg_photo,
-                                                                 anchor=tk.CENTER)
-                print(f"DEBUG _draw_content: Recreated canvas image item {self.canvas_image_id}.")
+        if tiled:
+            tiles_drawn = self._draw_tiles(canvas_width, canvas_height, background_key, sprite_key,
+                                           (new_width, new_height, image_x, image_y), fast)
+            layers_drawn += tiles_drawn
+            resampled = tiles_drawn > 0
         else:
-            self.canvas_image_id = self.canvas.create_image(image_x, image_y,
-                                                             image=self.zoidberg_photo,
-                                                             anchor=tk.CENTER)
-            print(f"DEBUG _draw_content: Created new canvas image item {self.canvas_image_id}.")
+            if self.tile_keys:
+                layers_drawn += self._clear_tiles() # Back from fullscreen or a very large size
+            # --- Draw Background (Solid or Gradient) ---
+            if self.scene.is_dirty("background", background_key):
+                if self.background_type == 'gradient':
+                    start_rgb = resolve_color(self.gradient_start_color) # Memoized; validated at config load
+                    end_rgb = resolve_color(self.gradient_end_color)
 
-        # --- Draw Text ---
-        text_offset_y_ratio = 0.20
+                    def build_gradient():
+                        # The whole gradient is a single cached bitmap placed as one canvas item,
+                        # instead of one rectangle (and one Tcl round-trip) per pixel row.
+                        with perf.span("gradient_build"):
+                            return self.gradient_cache.get(canvas_width, canvas_height, start_rgb, end_rgb)
+                    self._render_layer("background", background_key, build_gradient,
+                                       functools.partial(self._show_gradient, background_key), sync)
+                    resampled = True
+                else:
+                    # Solid (or fallback) backgrounds are just the canvas color; drop any gradient item.
+                    self.render_pipeline.cancel("background")
+                    if self.canvas_background_id:
+                        self.canvas.delete(self.canvas_background_id)
+                        self.canvas_background_id = None
+                        self.background_photo = None
+                    self.canvas.config(bg=self.background_color if self.background_type == 'solid' else '#F0F0F0')
+                    self.scene.mark_drawn("background", background_key)
+                layers_drawn += 1
+            else:
+                self.render_pipeline.cancel("background") # Back to what is already shown: drop any stale render
 
-        text_y_on_image = new_height * text_offset_y_ratio
-        final_text_y = (image_y - new_height / 2) + text_y_on_image 
-        final_text_x = image_x
+            # --- Draw Zoidberg Image ---
+            if self.scene.is_dirty("sprite", sprite_key):
+                use_disk_cache = self._cache_scaled_sprite and not fast and not self.hue_cycle_enabled
+                if use_disk_cache:
+                    self._cache_scaled_sprite = False
+                adjustment = settings_color_adjustment(self) if not self.hue_cycle_enabled else None # The ring adjusts each frame
+                # Everything the worker needs is bound here, so it never reads settings the Tk thread may change
+                build = functools.partial(self._build_sprite, self.skin, new_width, new_height, fast, adjustment,
+                                          use_disk_cache, self.low_memory, self.sprite_pyramid)
+                if self.hue_cycle_enabled:
+                    start_offset = self.static_hue_offset if self.color_shift_enabled else 0.0 # Cycles from the static offset if set
+                    build = functools.partial(self._build_hue_cycle_ring, build, self.hue_cycle_period, self.hue_cycle_fps,
+                                              start_offset, not self.low_memory, settings_color_adjustment(self),
+                                              self._hue_cycle_started)
+                self._render_layer("sprite", sprite_key, build,
+                                   functools.partial(self._show_sprite, sprite_key, (image_x, image_y)), sync)
+                layers_drawn += 1
+                resampled = True
+            else:
+                self.render_pipeline.cancel("sprite")
 
-        base_font_size = 20
-        base_image_width_for_font = 300
+            # The current sprite moves right away; a resized one replaces it when ready
+            if self.canvas_image_id and self.scene.is_dirty("sprite_position", (image_x, image_y)):
+                self.canvas.coords(self.canvas_image_id, image_x, image_y)
+                self.scene.mark_drawn("sprite_position", (image_x, image_y))
+                layers_drawn += 1
 
-        font_size = max(8, int(base_font_size * (new_width / base_image_width_for_font)))
-        font_style = ("Helvetica", font_size, "bold")
+        # --- Draw Text ---
+        final_text_x, final_text_y, text_box_width, text_box_height = compute_text_box(new_width, new_height,
+                                                                                       image_x, image_y, self.text_box)
+        with perf.span("text_layout"):
+            font_size, text_lines = self.text_fitter.fit(self.display_text, text_box_width, text_box_height)
+        font_style = (TEXT_FONT_FAMILY, font_size, "bold")
+        wrapped_text = "\n".join(text_lines) # Wrapped with Tk's own metrics, so the canvas won't re-wrap it
 
-        text_wrap_width_pixels = new_width * 0.8
-        if text_wrap_width_pixels < 10: text_wrap_width_pixels = 10
+        text_key = (wrapped_text, self.text_color, font_style, text_box_width)
 
         # Update or create the text item
-        if self.canvas_text_id:
-            if self.canvas.find_withtag(self.canvas_text_id):
-                self.canvas.itemconfig(self.canvas_text_id,
-                                       text=self.display_text,
-                                       font=font_style,
-                                       fill=self.text_color,
-                                       width=text_wrap_width_pixels)
-                self.canvas.coords(self.canvas_text_id, final_text_x, final_text_y)
-                print(f"DEBUG _draw_content: Updated existing canvas text item {self.canvas_text_id}.")
-            else:
-                self.canvas_text_id = self.canvas.create_text(final_text_x, final_text_y,
-                                                             text=self.display_text,
-                                                             font=font_style,
-                                                             fill=self.text_color,
-                                                             anchor=tk.CENTER,
-                                                             width=text_wrap_width_pixels)
-                print(f"DEBUG _draw_content: Recreated canvas text item {self.canvas_text_id}.")
+        if self.scene.is_dirty("text", text_key):
+            with perf.span("canvas_update"):
+                if self.canvas_text_id:
+                    self.canvas.itemconfig(self.canvas_text_id,
+                                           text=wrapped_text,
+                                           font=font_style,
+                                           fill=self.text_color,
+                                           width=text_box_width)
+                else:
+                    self.canvas_text_id = self.canvas.create_text(final_text_x, final_text_y,
+                                                                 text=wrapped_text,
+                                                                 font=font_style,
+                                                                 fill=self.text_color,
+                                                                 anchor=tk.CENTER,
+                                                                 width=text_box_width)
+            self.scene.mark_drawn("text", text_key)
+            layers_drawn += 1
+
+        if self.scene.is_dirty("text_position", (final_text_x, final_text_y)):
+            self.canvas.coords(self.canvas_text_id, final_text_x, final_text_y)
+            self.scene.mark_drawn("text_position", (final_text_x, final_text_y))
+            layers_drawn += 1
+
+        if not layers_drawn:
+            self.scene.stats["skipped"] += 1
+            return
+
+        if self._rendering():
+            self._frame_start = (draw_start, fast, resampled) # Completed by _finish_layer
         else:
-            self.canvas_text_id = self.canvas.create_text(final_text_x, final_text_y,
-                                                         text=self.display_text,
-                                                         font=font_style,
-                                                         fill=self.text_color,
-                                                         anchor=tk.CENTER,
-                                                         width=text_wrap_width_pixels)
-            print(f"DEBUG _draw_content: Created new canvas text item {self.canvas_text_id}.")
+            self._frame_complete(draw_start, fast, resampled)
 
 
 # --- Main Application Execution ---
 if __name__ == "__main__":
-    # Initialize pygame mixer at the very start
-    try:
-        mixer.init() 
-    except Exception as e:
-        print(f"Warning: Could not initialize pygame mixer: {e}")
-        # If mixer fails here, subsequent sound calls inside app might still fail.
+    if getattr(sys, 'frozen', False):
+        import multiprocessing
+        multiprocessing.freeze_support() # Needed for --batch/--animate worker processes in the PyInstaller build
+
+    # Headless render: no window and no pygame mixer
+    cli_args, _ = build_arg_parser().parse_known_args()
+    if cli_args.render:
+        settings = ZoidbergSettings()
+        settings.load()
+        sys.exit(render_to_file(settings, cli_args.render, cli_args.size))
+    if cli_args.batch:
+        sys.exit(run_batch(cli_args, sys.argv[1:]))
+    if cli_args.animate:
+        sys.exit(run_animation(cli_args, sys.argv[1:]))
 
+    # The pygame mixer is imported and initialized lazily by SoundPlayer, only if a sound is played
     root = tk.Tk()
-    app = ZoidbergApp(root)
+    shared = SharedResources()
+    app = ZoidbergApp(root, shared=shared)
+    # Later launches were forwarded to a running instance at the top of this file if there was one
+    if shared.windows and app.single_instance and not cli_args.new_instance:
+        shared.start_instance_server(root)
     root.mainloop()
-    
-    # Quit pygame mixer when the application closes
-    if mixer.get_init():
-        mixer.quit()
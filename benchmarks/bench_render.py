@@ -0,0 +1,205 @@
+"""
+Headless benchmarks for Zoidberg's rendering and startup paths.
+
+Runs without a display server (nothing here creates a Tk window), so it works
+on a plain Linux box or CI runner. Times:
+    - gradient generation (column build + stretch) per window size
+    - hue shifting the full-resolution sprite, alone and fused with four more color adjustments
+    - resampling the sprite (quality and live-resize paths) per window size
+    - a full headless scene render (render_scene) per window size
+    - config parsing via ZoidbergSettings._load_config
+    - cold-start import of Zoidberg.py in a fresh interpreter
+
+Usage:
+    python benchmarks/bench_render.py --output results.json
+    python benchmarks/bench_render.py --baseline results.json --threshold 0.15
+
+With --baseline, every benchmark whose median is more than --threshold slower
+than the baseline is reported and the exit code is 1.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import PIL
+from PIL import Image
+
+import Zoidberg
+
+# Window sizes from the minimum window up to 4K
+WINDOW_SIZES = [(300, 350), (500, 550), (800, 600), (1280, 720), (1920, 1080), (2560, 1440), (3840, 2160)]
+GRADIENT_COLORS = ((135, 206, 235), (70, 130, 180)) # config.ini's default start/end colors
+NOISE_FLOOR_MS = 0.05 # Slowdowns smaller than this are timer noise, whatever the percentage
+
+
+def time_call(func, repeat, warmup=1):
+    """Runs func warmup + repeat times and returns {median_ms, min_ms, mean_ms, repeat} over the timed runs."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "mean_ms": statistics.fmean(samples),
+        "repeat": repeat,
+    }
+
+
+def size_label(size):
+    return f"{size[0]}x{size[1]}"
+
+
+def bench_gradient(results, repeat):
+    start_rgb, end_rgb = GRADIENT_COLORS
+    for size in WINDOW_SIZES:
+        # A fresh cache each time, so every run pays for the column build and the stretch
+        results[f"gradient/{size_label(size)}"] = time_call(
+            lambda: Zoidberg.GradientCache().get(size[0], size[1], start_rgb, end_rgb), repeat)
+
+
+def bench_hue_shift(results, source_image, repeat):
+    results["hue_shift/source"] = time_call(lambda: Zoidberg.apply_hue_shift(source_image, 120.0), repeat)
+    # Stacking adjustments should cost about the same as the hue shift alone (one fused pass per stage)
+    chain = Zoidberg.color_adjustment(120.0, saturation=1.3, brightness=1.1, contrast=1.2, gamma=1.4,
+                                      tint="#FF8800", tint_strength=0.3)
+    results["color_adjust/source_5"] = time_call(lambda: Zoidberg.apply_color_adjustment(source_image, chain), repeat)
+
+
+def bench_resample(results, source_image, repeat):
+    pyramid = Zoidberg.ImagePyramid(source_image)
+    for size in WINDOW_SIZES:
+        new_width, new_height, _, _ = Zoidberg.compute_sprite_layout(source_image.size, size)
+        results[f"resample/{size_label(size)}"] = time_call(
+            lambda: pyramid.resize((new_width, new_height)), repeat)
+        results[f"resample_fast/{size_label(size)}"] = time_call(
+            lambda: pyramid.resize((new_width, new_height), fast=True), repeat)
+
+
+def bench_render_scene(results, source_image, settings, repeat):
+    adjustment_cache = Zoidberg.ColorAdjustmentCache(source_image)
+    for size in WINDOW_SIZES:
+        results[f"render_scene/{size_label(size)}"] = time_call(
+            lambda: Zoidberg.render_scene(source_image, settings, size, adjustment_cache), repeat)
+
+
+def bench_load_config(results, config_path, repeat):
+    def load_config():
+        settings = Zoidberg.ZoidbergSettings(argv=[], config_file=config_path) # Treated as dropped: never rewritten
+        with contextlib.redirect_stdout(io.StringIO()):
+            settings._load_config()
+    results["load_config"] = time_call(load_config, repeat)
+
+
+def bench_cold_import(results, repeat):
+    """Imports Zoidberg.py in a fresh interpreter: total process time and the import alone."""
+    code = "import time; t = time.perf_counter(); import Zoidberg; print(time.perf_counter() - t)"
+    process_ms, import_ms = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True,
+                                capture_output=True, text=True).stdout
+        process_ms.append((time.perf_counter() - start) * 1000)
+        import_ms.append(float(output.strip().splitlines()[-1]) * 1000)
+    for name, samples in (("cold_start/process", process_ms), ("cold_start/import", import_ms)):
+        results[name] = {"median_ms": statistics.median(samples), "min_ms": min(samples),
+                         "mean_ms": statistics.fmean(samples), "repeat": repeat}
+
+
+def run_benchmarks(repeat, import_repeat):
+    image_path = Zoidberg.get_zoidberg_image_path(REPO_ROOT)
+    source_image = Image.open(image_path).convert("RGBA")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = os.path.join(temp_dir, "config.ini")
+        shutil.copyfile(os.path.join(REPO_ROOT, "config.ini"), config_path)
+
+        settings = Zoidberg.ZoidbergSettings(argv=[], config_file=config_path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            settings.load()
+
+        results = {}
+        bench_gradient(results, repeat)
+        bench_hue_shift(results, source_image, repeat)
+        bench_resample(results, source_image, repeat)
+        bench_render_scene(results, source_image, settings, repeat)
+        bench_load_config(results, config_path, repeat)
+    bench_cold_import(results, import_repeat)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "pillow": PIL.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "source_size": list(source_image.size),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Prints current vs baseline medians and returns the names that regressed by more than threshold."""
+    regressions = []
+    print(f"{'benchmark':<28} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<28} {'-':>10} {result['median_ms']:10.2f} {'new':>8}")
+            continue
+        change = result["median_ms"] / base["median_ms"] - 1 if base["median_ms"] > 0 else 0.0
+        flag = ""
+        if change > threshold and result["median_ms"] - base["median_ms"] > NOISE_FLOOR_MS:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<28} {base['median_ms']:10.2f} {result['median_ms']:10.2f} {change:+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless benchmarks for Zoidberg's rendering and startup paths.")
+    parser.add_argument("--output", metavar="PATH", help="Write the results as JSON to PATH (default: print them).")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare against a previous --output file.")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Median slowdown (fraction) that counts as a regression (default: 0.10).")
+    parser.add_argument("--repeat", type=int, default=15, help="Timed runs per benchmark (default: 15).")
+    parser.add_argument("--import-repeat", type=int, default=5,
+                        help="Fresh interpreters started for the cold-start benchmark (default: 5).")
+    args = parser.parse_args()
+
+    current = run_benchmarks(max(1, args.repeat), max(1, args.import_repeat))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+    elif not args.baseline:
+        print(json.dumps(current, indent=2))
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+"""Makes Zoidberg.py importable from the tests (it is a single script, not a package)."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
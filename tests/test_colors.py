@@ -0,0 +1,77 @@
+"""Headless tests for color parsing and the fused color adjustment chain."""
+import pytest
+from PIL import Image
+
+import Zoidberg
+
+
+@pytest.mark.parametrize("color_string, expected", [
+    ("red", (255, 0, 0)),
+    ("Light Steel Blue", (176, 196, 222)),
+    ("LightSteelBlue3", (162, 181, 205)),
+    ("  navy  ", (0, 0, 128)),
+    ("gray50", (127, 127, 127)), # X11's rgb.txt rounding
+    ("grey100", (255, 255, 255)),
+    ("#fff", (255, 255, 255)),
+    ("#123", (17, 34, 51)),
+    ("#C5D8ED", (197, 216, 237)),
+    ("#123456789", (18, 69, 120)), # The 8 most significant bits of each component
+    ("#FFFF80800000", (255, 128, 0)),
+])
+def test_parse_color(color_string, expected):
+    assert Zoidberg.parse_color(color_string) == expected
+
+
+@pytest.mark.parametrize("color_string", ["nosuchcolor", "gray101", "#12", "#GGGGGG", "#1234567", ""])
+def test_parse_color_rejects(color_string):
+    with pytest.raises(ValueError):
+        Zoidberg.parse_color(color_string)
+
+
+def test_resolve_color_falls_back():
+    assert Zoidberg.resolve_color("nosuchcolor") == (0, 0, 0)
+    assert Zoidberg.resolve_color("nosuchcolor", None) is None
+    assert Zoidberg.resolve_color("blue", None) == (0, 0, 255)
+
+
+def test_add_color_name():
+    with pytest.raises(ValueError):
+        Zoidberg.parse_color("ZoidbergTestColor")
+    Zoidberg.add_color_name("Zoidberg TestColor", (1, 2, 3))
+    assert Zoidberg.parse_color("zoidbergtestcolor") == (1, 2, 3)
+
+
+def test_identity_adjustment_is_none():
+    assert Zoidberg.color_adjustment() is None
+    assert Zoidberg.color_adjustment(hue_offset=0, tint="red", tint_strength=0) is None
+    assert Zoidberg.with_hue_offset(None, 0) is None
+
+
+def test_compile_hue_only():
+    hsv_lut, rgb_lut = Zoidberg.compile_color_adjustment(Zoidberg.color_adjustment(hue_offset=180))
+    assert rgb_lut is None
+    assert len(hsv_lut) == 768
+    assert hsv_lut[0] == Zoidberg.hue_offset_to_pil(180)
+    assert hsv_lut[256:] == list(range(256)) + list(range(256)) # Saturation and value untouched
+
+
+def test_compile_rgb_only():
+    hsv_lut, rgb_lut = Zoidberg.compile_color_adjustment(Zoidberg.color_adjustment(brightness=2.0))
+    assert hsv_lut is None
+    assert len(rgb_lut) == 768
+    assert rgb_lut[0] == 0 and rgb_lut[100] == 200 and rgb_lut[200] == 255
+
+
+def test_compile_tint():
+    _, rgb_lut = Zoidberg.compile_color_adjustment(Zoidberg.color_adjustment(tint="red", tint_strength=1.0))
+    assert rgb_lut[255] == 255 # Red channel keeps white
+    assert rgb_lut[256 + 255] == 0 and rgb_lut[512 + 255] == 0 # Green and blue are filtered out
+
+
+def test_apply_color_adjustment_keeps_alpha():
+    image = Image.new("RGBA", (4, 4), (200, 100, 50, 77))
+    for adjustment in (Zoidberg.color_adjustment(brightness=0.5), Zoidberg.color_adjustment(hue_offset=90)):
+        adjusted = Zoidberg.apply_color_adjustment(image, adjustment)
+        assert adjusted.mode == "RGBA"
+        assert adjusted.getpixel((0, 0))[3] == 77
+    assert Zoidberg.apply_color_adjustment(image, None) is image
@@ -0,0 +1,129 @@
+"""Headless tests for the gradient cache, resize timing and text layout."""
+import threading
+
+import pytest
+
+import Zoidberg
+
+
+def test_gradient_cache_colors_and_size():
+    cache = Zoidberg.GradientCache()
+    image = cache.get(30, 100, (255, 0, 0), (0, 0, 255))
+    assert image.size == (30, 100)
+    assert image.getpixel((0, 0)) == (255, 0, 0)
+    assert image.getpixel((29, 99)) == (0, 0, 255)
+    assert image.getpixel((0, 50)) == image.getpixel((29, 50)) # Only varies vertically
+
+
+def test_gradient_cache_reuse():
+    cache = Zoidberg.GradientCache()
+    image = cache.get(30, 100, (0, 0, 0), (255, 255, 255))
+    assert cache.get(30, 100, (0, 0, 0), (255, 255, 255)) is image
+    column = cache.column(100, (0, 0, 0), (255, 255, 255))
+    cache.get(60, 100, (0, 0, 0), (255, 255, 255)) # Width-only change: stretches the same column
+    assert cache.column(100, (0, 0, 0), (255, 255, 255)) is column
+    cache.trim()
+    assert cache.get(30, 100, (0, 0, 0), (255, 255, 255)) is not image
+    assert cache.column(100, (0, 0, 0), (255, 255, 255)) is column # trim keeps the column
+
+
+def test_gradient_cache_get_races_trim():
+    cache = Zoidberg.GradientCache()
+    results = []
+    done = threading.Event()
+
+    def trim():
+        while not done.is_set():
+            cache.trim()
+
+    trimmer = threading.Thread(target=trim)
+    trimmer.start()
+    try:
+        for height in range(1, 300):
+            results.append(cache.get(5, height, (0, 0, 0), (255, 255, 255)))
+    finally:
+        done.set()
+        trimmer.join()
+    assert all(image is not None and image.size == (5, height) for height, image in enumerate(results, start=1))
+
+
+def test_resize_timing_defaults():
+    timing = Zoidberg.AdaptiveResizeTiming(50, 500)
+    assert timing.settle_delay_ms() == 50
+    assert timing.live_frame_fast() # Nothing measured yet
+    assert timing.live_interval_ms() == Zoidberg.LIVE_FRAME_MIN_INTERVAL_MS
+
+
+def test_resize_timing_follows_event_gaps():
+    timing = Zoidberg.AdaptiveResizeTiming(50, 500)
+    for i in range(10):
+        timing.note_event(i * 0.0625) # A <Configure> every 62.5 ms
+    assert timing.event_gap_ms == 62.5
+    assert timing.settle_delay_ms() == 187
+    timing.note_event(100.0) # A long pause starts a new drag instead of skewing the average
+    assert timing.event_gap_ms == 62.5
+
+
+def test_resize_timing_follows_draw_cost():
+    timing = Zoidberg.AdaptiveResizeTiming(50, 500)
+    timing.note_draw(5, fast=False)
+    assert not timing.live_frame_fast()
+    assert timing.live_interval_ms() == Zoidberg.LIVE_FRAME_MIN_INTERVAL_MS
+    for _ in range(30):
+        timing.note_draw(400, fast=False)
+    timing.note_draw(30, fast=True)
+    assert timing.live_frame_fast()
+    assert timing.live_interval_ms() == 60
+    assert timing.settle_delay_ms() == 500 # 2 x 400 ms, clamped
+
+
+class FixedMetricsFitter(Zoidberg.TextFitter):
+    """Every character is 0.6 x the font size wide, and lines are 1.2 x the font size apart."""
+    def _text_width(self, text, font_size):
+        return len(text) * font_size * 0.6
+
+    def _line_height(self, font_size):
+        return font_size * 1.2
+
+
+def largest_fitting_size(fitter, text, box_width, box_height):
+    """The answer TextFitter.fit finds by bisection, found by trying every size."""
+    best = Zoidberg.TEXT_MIN_FONT_SIZE
+    for font_size in range(Zoidberg.TEXT_MIN_FONT_SIZE, box_height + 1):
+        _, block_width, block_height = fitter.measure(text, font_size, box_width)
+        if block_width <= box_width and block_height <= box_height:
+            best = font_size
+    return best
+
+
+@pytest.mark.parametrize("text, box_width, box_height", [
+    ("Woop woop woop!", 200, 80),
+    ("Woop woop woop!", 60, 200),
+    ("Why not Zoidberg?", 400, 30),
+    ("a\nb\nc", 100, 100),
+    ("Supercalifragilistic", 20, 20), # Nothing fits: the minimum size
+])
+def test_text_fitter_matches_linear_search(text, box_width, box_height):
+    font_size, lines = FixedMetricsFitter().fit(text, box_width, box_height)
+    assert font_size == largest_fitting_size(FixedMetricsFitter(), text, box_width, box_height)
+    assert lines == FixedMetricsFitter().measure(text, font_size, box_width)[0]
+
+
+def test_text_fitter_memoizes():
+    fitter = FixedMetricsFitter()
+    first = fitter.fit("Woop woop woop!", 200, 80)
+    measured = fitter.stats["measured"]
+    assert measured <= 10 # Bisection: about log2(80) sizes, not 80
+    assert fitter.fit("Woop woop woop!", 200, 80) == first
+    assert fitter.stats["measured"] == measured and fitter.stats["fit_hits"] == 1
+
+
+def test_compute_text_box():
+    # A 200x100 sprite centered at (150, 100): it spans x 50-250 and y 50-150
+    center_x, center_y, box_width, box_height = Zoidberg.compute_text_box(200, 100, 150, 100, (0.25, 0.5, 0.5, 0.25))
+    assert (center_x, center_y) == (150, 112.5)
+    assert (box_width, box_height) == (100, 25)
+
+
+def test_compute_text_box_minimum():
+    assert Zoidberg.compute_text_box(8, 8, 4, 4, (0, 0, 0.1, 0.1))[2:] == (10, 10)
@@ -0,0 +1,111 @@
+"""Headless tests for forwarded launches and the warm-start snapshot identity check."""
+import os
+import shutil
+
+import pytest
+
+import Zoidberg
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("argv", [[], ["-t", "hi"], ["--static-hue-offset", "90", "--hue-cycle"], ["--size", "640x480"]])
+def test_forwarded_argv_ok(argv):
+    assert Zoidberg.check_forwarded_argv(argv) == b"ok"
+
+
+@pytest.mark.parametrize("argv", [["--render", "out.png"], ["--rend", "out.png"], ["--low-mem"], ["--perf"],
+                                  ["--new-instance"], ["-h"], ["--he"]])
+def test_forwarded_argv_local(argv):
+    assert Zoidberg.check_forwarded_argv(argv) == b"local"
+
+
+@pytest.mark.parametrize("argv, message", [
+    (["--bogus"], "unrecognized arguments: --bogus"),
+    (["--static-hue-offset", "abc"], "invalid float value: 'abc'"),
+    (["--size", "0x3"], "invalid size '0x3'"),
+])
+def test_forwarded_argv_error(argv, message):
+    reply = Zoidberg.check_forwarded_argv(argv)
+    assert reply.startswith(b"error\0usage: ")
+    assert message in reply.decode("utf-8")
+
+
+def test_forwarded_argv_skips_dropped_ini(tmp_path):
+    ini = tmp_path / "dropped.ini"
+    ini.write_text("[Settings]\n")
+    assert Zoidberg.check_forwarded_argv([str(ini), "-t", "hi"]) == b"ok"
+
+
+class FakeRoot:
+    """Just the geometry calls _check_snapshot makes on a Tk root."""
+    def __init__(self):
+        self.geometries = []
+
+    def winfo_screenwidth(self):
+        return 1920
+
+    def winfo_screenheight(self):
+        return 1080
+
+    def geometry(self, geometry):
+        self.geometries.append(geometry)
+
+
+@pytest.fixture
+def app(tmp_path):
+    """A ZoidbergApp with just the state _snapshot_identity and _check_snapshot use (no Tk window)."""
+    os.makedirs(tmp_path / "Zoidberg")
+    shutil.copy(Zoidberg.get_zoidberg_image_path(REPO_ROOT), Zoidberg.get_zoidberg_image_path(str(tmp_path)))
+    shutil.copy(os.path.join(REPO_ROOT, "config.ini"), tmp_path / "config.ini")
+    app = object.__new__(Zoidberg.ZoidbergApp)
+    Zoidberg.ZoidbergSettings.__init__(app, [], config_file=str(tmp_path / "config.ini"))
+    app.application_base_path = str(tmp_path)
+    app.master = FakeRoot()
+    app.load()
+    app.skin_library = Zoidberg.SkinLibrary(str(tmp_path), 1 << 20, 1 << 20)
+    app._resolve_skin(app.skin_library)
+    return app
+
+
+def saved_snapshot(app, geometry="500x550+30+40"):
+    return dict(app._snapshot_identity(), version=Zoidberg.SNAPSHOT_VERSION, geometry=geometry)
+
+
+def test_snapshot_matches(app):
+    snapshot = saved_snapshot(app)
+    assert app._check_snapshot(snapshot) is snapshot
+    assert app.master.geometries == ["500x550+30+40"]
+
+
+def test_snapshot_off_screen_keeps_size_only(app):
+    app._check_snapshot(saved_snapshot(app, geometry="500x550+5000+40"))
+    assert app.master.geometries == ["500x550"]
+
+
+def test_snapshot_rejects_changed_setting(app):
+    snapshot = saved_snapshot(app)
+    app.display_text = "Hooray!"
+    assert app._check_snapshot(snapshot) is None
+
+
+def test_snapshot_rejects_changed_config(app):
+    snapshot = saved_snapshot(app)
+    with open(app.config_file, "a") as f:
+        f.write("; edited\n")
+    assert app._check_snapshot(snapshot) is None
+
+
+def test_snapshot_rejects_changed_skin(app):
+    snapshot = saved_snapshot(app)
+    with open(app.skin_library.paths[app.skin], "ab") as f:
+        f.write(b"\0")
+    app.skin_library = Zoidberg.SkinLibrary(app.application_base_path, 1 << 20, 1 << 20)
+    assert app._check_snapshot(snapshot) is None
+
+
+def test_snapshot_survives_json_round_trip(app, tmp_path):
+    Zoidberg.save_snapshot(str(tmp_path), saved_snapshot(app), Zoidberg.Image.new("RGB", (4, 4)))
+    snapshot = Zoidberg.load_snapshot(str(tmp_path))
+    assert snapshot["image_path"].endswith("snapshot.ppm")
+    assert app._check_snapshot(snapshot) is snapshot